@@ -7,13 +7,32 @@ Module principal permettant de lancer l'application.
 Ce module initialise la boucle événementielle asynchrone,
 configure l'interface graphique et lance l'écran de démarrage.
 
+Options:
+    --trace-startup [FICHIER]: Affiche (ou écrit dans FICHIER) les étapes du démarrage.
+    --fast-start: Le SplashScreen avance sur les étapes réelles, sans animation simulée.
+    --watchdog [MS]: Signale les blocages de la boucle au-delà de MS millisecondes (100 par défaut).
+    --base-url URL: Utilise un autre serveur de l'API (ou la variable d'environnement `CRM_BASE_URL`).
+    --fake-server: Lance un faux serveur local (`utils.FakeCrmServer`, réglé par les variables
+        `CRM_FAKE_*`) et s'y connecte ; identifiants admin@example.com / admin. Le token et
+        l'instantané sont gardés dans un dossier temporaire, pas à côté de `auth.json`.
+
+Avec `--trace-startup`, les compteurs des tâches asyncio restantes sont aussi affichés à la fermeture.
+
 Dependencies:
     PySide6: Permet de créer des interfaces graphiques.
     qasync: Rend l'interface graphique compatible avec asyncio.
 """
 
 # Imports standards
+import argparse
 import asyncio
+import os
+import shutil
+import sys
+import tempfile
+
+# Instant de référence du relevé de démarrage : importé avant tout le reste
+from utils.StartupTracer import tracer
 
 # Imports tiers
 import qasync
@@ -22,8 +41,15 @@ from PySide6.QtWidgets import QApplication
 # Imports internes
 from Pages.SplashScreen import SplashScreen
 from utils.CrmApiAsync import CrmApiAsync
+from utils.LoopWatchdog import watchdog
+from utils.TaskSupervisor import TaskSupervisor
+from utils.styles import apply_application_stylesheet
 from utils.utils import get_icon
 
+tracer.mark("imports")
+
+DEFAULT_BASE_URL = "https://api-crm.knsr-family.com"
+
 
 def main() -> None:
     """Lance l'application en affichant le Splash Screen.
@@ -36,18 +62,64 @@ def main() -> None:
         >>> main()
 
     """
-    app = QApplication([])
+    parser = argparse.ArgumentParser(prog="CRMClient")
+    parser.add_argument("--trace-startup", nargs="?", const="1", default=None, metavar="FICHIER")
+    parser.add_argument("--fast-start", action="store_true", default=os.environ.get("CRM_FAST_START") == "1")
+    parser.add_argument("--watchdog", nargs="?", const="1", default=None, metavar="MS")
+    parser.add_argument("--base-url", default=os.environ.get("CRM_BASE_URL", DEFAULT_BASE_URL), metavar="URL")
+    parser.add_argument("--fake-server", action="store_true")
+    args, qt_args = parser.parse_known_args()
+    tracer.configure(args.trace_startup)
+    watchdog.configure(args.watchdog)
+
+    app = QApplication(sys.argv[:1] + qt_args)
+    tracer.mark("qapplication")
     app.setWindowIcon(get_icon("icon.ico"))
+    apply_application_stylesheet(app)
     loop = qasync.QEventLoop(app)
     asyncio.set_event_loop(loop)
-
-    api = CrmApiAsync("https://api-crm.knsr-family.com", "auth.json")
-
-    splash = SplashScreen(api)
+    watchdog.start(loop)
+
+    fake_server = fake_dir = None
+    base_url = args.base_url
+    auth_file = os.environ.get("CRM_AUTH_FILE", "auth.json")
+    if args.fake_server:
+        # Import à la demande : aiohttp.web n'est pas chargé au démarrage normal
+        from utils.FakeCrmServer import FakeCrmServer
+        fake_server = FakeCrmServer.from_env()
+        base_url = loop.run_until_complete(fake_server.start())
+        print(f"Faux serveur CRM : {base_url} ({fake_server.email} / {fake_server.password})", file=sys.stderr)
+        # Dossier à part : la session de test n'écrase ni le vrai token ni le vrai instantané
+        fake_dir = tempfile.mkdtemp(prefix="crm-fake-")
+        auth_file = os.path.join(fake_dir, "auth.json")
+
+    api = CrmApiAsync(base_url, auth_file, prewarm=False)
+    # Connexion préparée dès le démarrage de la boucle
+    loop.call_soon(api.start_warm_up)
+    if fake_dir is not None and api.snapshot_path is not None:
+        api.snapshot_path = os.path.join(fake_dir, "users.snapshot")
+
+    splash = SplashScreen(api, fast_start=args.fast_start)
     splash.show()
 
     with loop:
         loop.run_forever()
+        loop.run_until_complete(api.close())
+        if fake_server is not None:
+            loop.run_until_complete(fake_server.stop())
+        watchdog.stop()
+
+    if watchdog.enabled:
+        print(watchdog.report(), file=sys.stderr)
+
+    if tracer.enabled:
+        # Tâches encore en cours à la fermeture : une valeur non nulle révèle une fuite
+        print(TaskSupervisor.report(), file=sys.stderr)
+
+    # Écrit les paramètres modifiés juste avant la fermeture
+    api.settings.flush_sync()
+    if fake_dir is not None:
+        shutil.rmtree(fake_dir, ignore_errors=True)
 
 
 if __name__ == "__main__":
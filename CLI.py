@@ -0,0 +1,446 @@
+"""
+CLI.py
+======
+
+Interface en ligne de commande `crm-client`, utilisable sans écran.
+
+Ce module réutilise `CrmApiAsync` et le token sauvegardé par l'application (ou par
+`crm-client login`) pour lister, lire, créer, modifier, supprimer, importer et
+exporter des utilisateurs. Il n'importe jamais Qt : le démarrage reste rapide et
+le script fonctionne sur un serveur sans affichage.
+
+Les listes sont écrites au fur et à mesure de la réception des pages, et les
+opérations unitaires (lecture, suppression, import) sont envoyées en parallèle,
+au plus `--concurrency` à la fois. Avec `--json`, chaque résultat est écrit sur
+une ligne JSON (JSON Lines), y compris les erreurs (`{"error": ...}`).
+
+Usage:
+    python CLI.py [--json] [--concurrency N] COMMANDE [OPTIONS]
+
+Commandes:
+    login EMAIL: Se connecte et sauvegarde le token (mot de passe demandé ou `CRM_PASSWORD`).
+    logout: Oublie le token sauvegardé.
+    list: Affiche les utilisateurs page par page.
+    get ID...: Affiche des utilisateurs.
+    create: Ajoute un utilisateur.
+    update ID: Modifie les champs donnés d'un utilisateur.
+    delete ID...: Supprime des utilisateurs.
+    import FICHIER: Ajoute les utilisateurs d'un fichier CSV ou JSON Lines (`-` pour l'entrée standard).
+    export [FICHIER]: Écrit tous les utilisateurs en CSV, JSON Lines ou Parquet (sortie standard par défaut).
+
+Le code de sortie vaut 0 si toutes les opérations ont réussi, 1 sinon.
+
+Dependencies:
+    utils.CrmApiAsync: Pour les requêtes à l'API (aiohttp).
+    utils.Export: Pour parcourir les pages d'utilisateurs et écrire les exports.
+"""
+
+# Imports standards
+import argparse
+import asyncio
+import csv
+import getpass
+import json
+import os
+import sys
+from typing import Any, Awaitable, Callable, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+
+# Imports internes
+from utils.CrmApiAsync import CrmApiAsync
+from utils.Export import FORMATS, ExportError, export_users, iter_all_users, iter_users
+from utils.UserSnapshot import UserSnapshot
+
+DEFAULT_BASE_URL = "https://api-crm.knsr-family.com"
+FIELDS = ("id", "name", "first_name", "email", "telephone")
+EDITABLE_FIELDS = ("name", "first_name", "email", "telephone")
+
+
+class CliError(Exception):
+    """Erreur qui interrompt la commande (non connecté, fichier illisible, page en échec)."""
+
+
+def error_message(response: Dict[str, Any]) -> str:
+    """Renvoie un message lisible pour une réponse en erreur de `CrmApiAsync`.
+
+    Args:
+        response (Dict[str, Any]): Réponse contenant la clé `err`.
+
+    Returns:
+        str: Statut HTTP éventuel et message de l'erreur.
+    """
+    err = response.get("err")
+    status = getattr(err, "status", None)
+    message = getattr(err, "message", None) or err
+    field = getattr(err, "field", None)
+    text = str(message)
+    if isinstance(status, int) and str(status) not in text:
+        text = f"{status} {text}"
+    return f"{text} ({field})" if isinstance(field, str) else text
+
+
+class Output:
+    """Écrit les résultats des commandes, en texte ou en JSON Lines.
+
+    Attributes:
+        json_mode (bool): Si True, chaque résultat est un objet JSON sur une ligne.
+        stream (TextIO): Sortie des résultats.
+        failures (int): Nombre d'opérations en échec.
+    """
+
+    def __init__(self, json_mode: bool, stream: TextIO = sys.stdout) -> None:
+        self.json_mode = json_mode
+        self.stream = stream
+        self.failures = 0
+
+    def user(self, user: Dict[str, Any]) -> None:
+        """Écrit un utilisateur (colonnes séparées par des tabulations en mode texte).
+
+        Args:
+            user (Dict[str, Any]): Données de l'utilisateur.
+        """
+        if self.json_mode:
+            self.stream.write(json.dumps(user, ensure_ascii=False) + "\n")
+        else:
+            self.stream.write("\t".join(str(user.get(field, "")) for field in FIELDS) + "\n")
+
+    def done(self, message: str, **result: Any) -> None:
+        """Écrit le résultat d'une opération réussie.
+
+        Args:
+            message (str): Message affiché en mode texte.
+            **result: Champs de l'objet écrit en mode JSON.
+        """
+        if self.json_mode:
+            self.stream.write(json.dumps({"ok": True, **result}, ensure_ascii=False) + "\n")
+        else:
+            self.stream.write(message + "\n")
+
+    def error(self, message: str, **context: Any) -> None:
+        """Signale une opération en échec (sur la sortie d'erreur en mode texte).
+
+        Args:
+            message (str): Message de l'erreur.
+            **context: Champs ajoutés à l'objet écrit en mode JSON (ID, ligne...).
+        """
+        self.failures += 1
+        if self.json_mode:
+            self.stream.write(json.dumps({"ok": False, **context, "error": message}, ensure_ascii=False) + "\n")
+        else:
+            where = " ".join(f"{key}={value}" for key, value in context.items())
+            print(f"{where}: {message}" if where else message, file=sys.stderr)
+
+
+async def for_each(items: Iterable[Any], worker: Callable[[Any], Awaitable[None]], concurrency: int) -> None:
+    """Traite des éléments en parallèle, au plus `concurrency` à la fois.
+
+    Les éléments sont lus au fur et à mesure : un grand fichier d'import n'est
+    jamais chargé entièrement en mémoire.
+
+    Args:
+        items (Iterable[Any]): Éléments à traiter.
+        worker (Callable[[Any], Awaitable[None]]): Traitement d'un élément.
+        concurrency (int): Nombre maximal de traitements simultanés.
+    """
+    iterator = iter(items)
+
+    async def run() -> None:
+        # Chaque coroutine prend l'élément suivant de l'itérateur partagé
+        for item in iterator:
+            await worker(item)
+
+    await asyncio.gather(*(run() for _ in range(max(1, concurrency))))
+
+
+def read_import_file(path: str, file_format: Optional[str]) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """Lit les utilisateurs à importer ligne par ligne.
+
+    Args:
+        path (str): Chemin du fichier, `-` pour l'entrée standard.
+        file_format (Optional[str]): `csv` ou `jsonl`, déduit de l'extension si None.
+
+    Yields:
+        Tuple[int, Dict[str, Any]]: Numéro de ligne et données de l'utilisateur.
+
+    Raises:
+        CliError: Si le fichier ne peut pas être ouvert.
+    """
+    file_format = file_format or ("csv" if path.lower().endswith(".csv") else "jsonl")
+    try:
+        f = sys.stdin if path == "-" else open(path, "r", encoding="utf-8", newline="")
+    except OSError as e:
+        raise CliError(str(e))
+    with f:
+        if file_format == "csv":
+            reader = csv.DictReader(f)
+            for row in reader:
+                yield reader.line_num, row
+        else:
+            for number, line in enumerate(f, start=1):
+                if line.strip():
+                    try:
+                        row = json.loads(line)
+                    except json.JSONDecodeError as e:
+                        row = {"_error": str(e)}
+                    yield number, row if isinstance(row, dict) else {"_error": "Objet JSON attendu"}
+
+
+# ------------------------------------------------------------
+# Commandes
+# ------------------------------------------------------------
+async def command_login(api: CrmApiAsync, args: argparse.Namespace, out: Output) -> None:
+    """Se connecte et sauvegarde le token pour les commandes suivantes."""
+    password = os.environ.get("CRM_PASSWORD") or getpass.getpass("Mot de passe : ")
+    response = await api.login(args.email, password)
+    if await api.verify_request(response) != api.Ok:
+        out.error(error_message(response))
+        return
+    api.settings.set("access_token", response["access_token"])
+    out.done(f"Connecté en tant que {args.email}", email=args.email)
+
+
+async def command_logout(api: CrmApiAsync, args: argparse.Namespace, out: Output) -> None:
+    """Oublie le token sauvegardé."""
+    api.logout()
+    out.done("Déconnecté")
+
+
+async def command_list(api: CrmApiAsync, args: argparse.Namespace, out: Output) -> None:
+    """Écrit les utilisateurs au fur et à mesure de la réception des pages."""
+    count = 0
+    async for user in iter_users(api, args.page_size, args.order_by, args.desc):
+        if args.limit is not None and count >= args.limit:
+            break
+        out.user(user)
+        count += 1
+
+
+async def command_get(api: CrmApiAsync, args: argparse.Namespace, out: Output) -> None:
+    """Écrit les utilisateurs demandés, lus en parallèle."""
+    async def get(user_id: int) -> None:
+        response = await api.get_user(user_id)
+        if await api.verify_request(response) != api.Ok:
+            out.error(error_message(response), id=user_id)
+        else:
+            out.user(response)
+
+    await for_each(args.ids, get, args.concurrency)
+
+
+async def command_create(api: CrmApiAsync, args: argparse.Namespace, out: Output) -> None:
+    """Ajoute un utilisateur."""
+    response = await api.create_user(args.name, args.first_name, args.email, args.telephone)
+    if await api.verify_request(response) != api.Ok:
+        out.error(error_message(response))
+    else:
+        out.user(response)
+
+
+async def command_update(api: CrmApiAsync, args: argparse.Namespace, out: Output) -> None:
+    """Modifie les champs donnés d'un utilisateur, les autres sont repris du serveur."""
+    changes = {field: getattr(args, field) for field in EDITABLE_FIELDS if getattr(args, field) is not None}
+    if not changes:
+        raise CliError("Aucun champ à modifier")
+    current = await api.get_user(args.id)
+    if await api.verify_request(current) != api.Ok:
+        out.error(error_message(current), id=args.id)
+        return
+    response = await api.update_user(args.id, {**current, **changes})
+    if await api.verify_request(response) != api.Ok:
+        out.error(error_message(response), id=args.id)
+    else:
+        out.user(response)
+
+
+async def command_delete(api: CrmApiAsync, args: argparse.Namespace, out: Output) -> None:
+    """Supprime les utilisateurs demandés, en parallèle."""
+    async def delete(user_id: int) -> None:
+        response = await api.delete_user(user_id)
+        if await api.verify_request(response) != api.Ok:
+            out.error(error_message(response), id=user_id)
+        else:
+            out.done(f"Utilisateur {user_id} supprimé", id=user_id)
+
+    await for_each(args.ids, delete, args.concurrency)
+
+
+async def command_import(api: CrmApiAsync, args: argparse.Namespace, out: Output) -> None:
+    """Ajoute les utilisateurs d'un fichier, en parallèle.
+
+    Les utilisateurs existants sont d'abord chargés dans l'index des doublons de
+    `CrmApiAsync` (une seule requête décodée au fil de l'eau), puis chaque utilisateur
+    créé l'alimente : une ligne reprenant un email ou un téléphone connu est refusée
+    sans requête. `--no-duplicate-check` envoie toutes les lignes au serveur.
+    """
+    check = not args.no_duplicate_check
+    if check:
+        async for user in iter_all_users(api):
+            api.duplicates.add(user)
+
+    async def create(item: Tuple[int, Dict[str, Any]]) -> None:
+        line, row = item
+        missing = [field for field in EDITABLE_FIELDS if not row.get(field)]
+        if "_error" in row or missing:
+            out.error(row.get("_error") or f"Champs manquants : {', '.join(missing)}", line=line)
+            return
+        response = await api.create_user(row["name"], row["first_name"], row["email"], row["telephone"],
+                                         check_duplicates=check)
+        if await api.verify_request(response) != api.Ok:
+            out.error(error_message(response), line=line)
+        else:
+            out.done(f"Ligne {line} : utilisateur {response.get('id')} ajouté", line=line, id=response.get("id"))
+
+    await for_each(read_import_file(args.file, args.format), create, args.concurrency)
+
+
+async def command_export(api: CrmApiAsync, args: argparse.Namespace, out: Output) -> None:
+    """Exporte tous les utilisateurs page par page (ou depuis l'instantané local), à mémoire constante."""
+    path = args.file or "-"
+    if args.from_snapshot:
+        snapshot = UserSnapshot.open(api.snapshot_path) if api.snapshot_path else None
+        if snapshot is None:
+            raise CliError("Aucun instantané local (voir CRM_USER_SNAPSHOT)")
+        users = snapshot
+    else:
+        snapshot = None
+        users = iter_all_users(api) if args.stream else iter_users(api, args.page_size)
+
+    def progress(count: int) -> None:
+        print(f"\r{count} utilisateurs exportés", end="", file=sys.stderr, flush=True)
+
+    try:
+        count = await export_users(
+            users, path, args.format or (None if args.file else "jsonl"), args.gzip or None,
+            progress_callback=progress if sys.stderr.isatty() and path != "-" else None,
+        )
+    except (ValueError, OSError) as e:
+        raise CliError(str(e))
+    finally:
+        if snapshot is not None:
+            snapshot.close()
+    if path != "-":
+        if not out.json_mode and sys.stderr.isatty():
+            print(file=sys.stderr)
+        out.done(f"{count} utilisateurs exportés dans {path}", path=path, count=count)
+
+
+COMMANDS: Dict[str, Callable[[CrmApiAsync, argparse.Namespace, Output], Awaitable[None]]] = {
+    "login": command_login,
+    "logout": command_logout,
+    "list": command_list,
+    "get": command_get,
+    "create": command_create,
+    "update": command_update,
+    "delete": command_delete,
+    "import": command_import,
+    "export": command_export,
+}
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Construit l'analyseur des arguments de `crm-client`.
+
+    Returns:
+        argparse.ArgumentParser: Analyseur avec une sous-commande par opération.
+    """
+    parser = argparse.ArgumentParser(prog="crm-client", description="Client CRM en ligne de commande")
+    parser.add_argument("--base-url", default=os.environ.get("CRM_BASE_URL", DEFAULT_BASE_URL))
+    parser.add_argument("--auth-file", default=os.environ.get("CRM_AUTH_FILE", "auth.json"))
+    parser.add_argument("--json", action="store_true", help="résultats en JSON Lines")
+    parser.add_argument("--concurrency", type=int, default=8, metavar="N",
+                        help="requêtes simultanées au plus (get, delete, import)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    login = commands.add_parser("login", help="se connecter et sauvegarder le token")
+    login.add_argument("email")
+    commands.add_parser("logout", help="oublier le token sauvegardé")
+
+    listing = commands.add_parser("list", help="lister les utilisateurs")
+    listing.add_argument("--page-size", type=int, default=CrmApiAsync.USERS_PAGE_SIZE)
+    listing.add_argument("--order-by", choices=EDITABLE_FIELDS)
+    listing.add_argument("--desc", action="store_true")
+    listing.add_argument("--limit", type=int)
+
+    get = commands.add_parser("get", help="afficher des utilisateurs")
+    get.add_argument("ids", nargs="+", type=int, metavar="ID")
+
+    create = commands.add_parser("create", help="ajouter un utilisateur")
+    update = commands.add_parser("update", help="modifier un utilisateur")
+    update.add_argument("id", type=int)
+    for field in EDITABLE_FIELDS:
+        option = "--" + field.replace("_", "-")
+        create.add_argument(option, required=True)
+        update.add_argument(option)
+
+    delete = commands.add_parser("delete", help="supprimer des utilisateurs")
+    delete.add_argument("ids", nargs="+", type=int, metavar="ID")
+
+    import_ = commands.add_parser("import", help="ajouter les utilisateurs d'un fichier")
+    import_.add_argument("file", help="fichier CSV ou JSON Lines, - pour l'entrée standard")
+    import_.add_argument("--format", choices=("csv", "jsonl"))
+    import_.add_argument("--no-duplicate-check", action="store_true",
+                         help="envoie chaque ligne au serveur sans consulter les utilisateurs existants")
+
+    export = commands.add_parser("export", help="exporter tous les utilisateurs")
+    export.add_argument("file", nargs="?", help="fichier de sortie, sortie standard par défaut")
+    export.add_argument("--format", choices=FORMATS, help="déduit de l'extension du fichier par défaut")
+    export.add_argument("--gzip", action="store_true", help="compresse la sortie (implicite pour .gz)")
+    export.add_argument("--stream", action="store_true",
+                        help="une seule requête décodée au fil de l'eau au lieu de pages")
+    export.add_argument("--from-snapshot", action="store_true", help="exporte l'instantané local sans requête")
+    export.add_argument("--page-size", type=int, default=1000)
+    return parser
+
+
+async def run(args: argparse.Namespace) -> int:
+    """Exécute la commande demandée.
+
+    Args:
+        args (argparse.Namespace): Arguments analysés.
+
+    Returns:
+        int: Code de sortie (0 si tout a réussi).
+    """
+    api = CrmApiAsync(args.base_url, args.auth_file, prewarm=False)
+    # Seul l'import consulte un index local (celui des doublons) : mémoire constante pour les autres commandes
+    api.user_indexes = [api.duplicates] if args.command == "import" else []
+    out = Output(args.json)
+    try:
+        if args.command not in ("login", "logout") and not api.load_saved_token():
+            raise CliError("Non connecté : lancez `crm-client login EMAIL`")
+        await COMMANDS[args.command](api, args, out)
+    except CliError as e:
+        out.error(str(e))
+    except ExportError as e:
+        out.error(error_message(e.response))
+    except OSError as e:
+        # Serveur injoignable (les erreurs DNS sont déjà renvoyées par CrmApiAsync)
+        out.error(str(e))
+    finally:
+        api.discard_prefetched()
+        await api.close()
+        # Écrit le token sauvegardé ou supprimé avant de quitter
+        api.settings.flush_sync()
+    return 1 if out.failures else 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Point d'entrée de `crm-client`.
+
+    Args:
+        argv (Optional[List[str]]): Arguments, ceux de la ligne de commande si None.
+
+    Returns:
+        int: Code de sortie.
+
+    Example:
+        >>> main(["--json", "list", "--limit", "10"])
+    """
+    args = build_parser().parse_args(argv)
+    try:
+        return asyncio.run(run(args))
+    except KeyboardInterrupt:
+        return 130
+
+
+if __name__ == "__main__":
+    sys.exit(main())
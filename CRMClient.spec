@@ -1,12 +1,20 @@
 # -*- mode: python ; coding: utf-8 -*-
+import os
+import subprocess
+
+# CRM_EMBED_RESOURCES=1 : assets/ et styles/ sont compilés dans le module resources_rc
+# au lieu d'être copiés à côté de l'exécutable.
+embed_resources = os.environ.get('CRM_EMBED_RESOURCES') == '1'
+if embed_resources:
+    subprocess.run(['pyside6-rcc', 'resources.qrc', '-o', 'resources_rc.py'], check=True)
 
 
 a = Analysis(
     ['Application.py'],
     pathex=[],
     binaries=[],
-    datas=[('assets', 'assets'), ('styles', 'styles')],
-    hiddenimports=[],
+    datas=[] if embed_resources else [('assets', 'assets'), ('styles', 'styles')],
+    hiddenimports=['resources_rc'] if embed_resources else [],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
@@ -7,14 +7,11 @@ Module contenant la classe gérant la page d'accès au compte courant de l'utili
 Dependencies:
     pyside6: Module principal du programme
 """
-import asyncio
-import os.path
-
 from PySide6.QtCore import Qt
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QFrame, QPushButton, QMessageBox
 
 from utils.CrmApiAsync import CrmApiAsync
-from utils.utils import load_qss_file
+from utils.TaskSupervisor import TaskSupervisor
 
 
 class AccountPage(QWidget):
@@ -25,26 +22,27 @@ class AccountPage(QWidget):
     Attributes:
         api (CrmApiAsync): La classe cliente de l'API.
         parent (QWidget): Parent de la page de la page AccountPage.
-        login_window (QWidget): La page de connexion pour rediriger après la déconnexion.
+        tasks (TaskSupervisor): Les tâches asynchrones de la page, rattachées à celles du parent s'il en a.
+        login_window (QWidget | None): La page de connexion, créée seulement lors de la déconnexion.
         name_label (QLabel): Label du nom de l'utilisateur courant.
         email_label (QLabel): Label de l'email de l'utilisateur courant.
         role_label (QLabel): Label du rôle de l'utilisateur courant.
         status_label (QLabel): Label du status de l'utilisateur courant.
         disconnect_btn (QPushButton): Le bouton de déconnexion.
     """
-    def __init__(self, api: CrmApiAsync, parent: QWidget, login_window: QWidget):
+    def __init__(self, api: CrmApiAsync, parent: QWidget):
         """Le constructeur de la page AccountPage.
 
         Args:
             api (CrmApiAsync): La classe cliente de l'API.
             parent (QWidget): Parent de la page AccountPage.
-            login_window (QWidget): La page de connexion.
         """
         super().__init__()
         self.setWindowTitle("Informations du compte utilisateur")
         self.api = api
         self.parent = parent
-        self.login_window = login_window
+        self.tasks = TaskSupervisor("AccountPage", parent=getattr(parent, "tasks", None))
+        self.login_window = None
         self.name_label = None
         self.email_label = None
         self.role_label = None
@@ -87,7 +85,7 @@ class AccountPage(QWidget):
         self.role_label = QLabel()
         self.status_label = QLabel()
 
-        asyncio.create_task(self.load_current_user_info())
+        self.tasks.spawn(self.load_current_user_info())
 
         for label in [self.name_label, self.email_label, self.role_label, self.status_label]:
             label.setStyleSheet("font-size: 30px; margin: 3px; color: #E0E1DD;")
@@ -95,7 +93,6 @@ class AccountPage(QWidget):
         # Bouton d'actualisation
         self.disconnect_btn = QPushButton("Se déconnecter")
         self.disconnect_btn.setObjectName("disconnect_btn")
-        self.disconnect_btn.setStyleSheet(load_qss_file("button_style.qss"))
         self.disconnect_btn.setCursor(Qt.CursorShape.PointingHandCursor)
         self.disconnect_btn.clicked.connect(self.disconnect_user_action)
 
@@ -111,7 +108,7 @@ class AccountPage(QWidget):
         container_layout.addStretch()
         container_layout.addWidget(self.disconnect_btn, alignment=Qt.AlignmentFlag.AlignRight)
 
-        container.setStyleSheet("background-color: #0B1739;")
+        container.setObjectName("account_container")
 
         container_layout.setContentsMargins(40, 40, 40, 40)
         layout.addWidget(container, 1)
@@ -123,7 +120,7 @@ class AccountPage(QWidget):
         """
         Méthode permettant de récupérer les informations de l'utilisateur courant.
         """
-        response = await self.api.get_current_user_access()
+        response = await self.api.session.load()
         response_code = await self.api.verify_request(response)
 
         if response_code == self.api.Ok:
@@ -144,7 +141,9 @@ class AccountPage(QWidget):
         )
 
         if confirm == QMessageBox.StandardButton.Yes:
-            if os.path.exists("auth.json"):
-                os.remove("auth.json")
+            from Pages.LoginPage import LoginWindow  # Import local : LoginPage importe déjà ce module
+
+            self.api.logout()
+            self.login_window = LoginWindow(self.api)
             self.login_window.show()
             self.parent.close()
\ No newline at end of file
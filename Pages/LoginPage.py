@@ -8,7 +8,6 @@ Dependencies:
     PySide6: Pour la création de l'interface graphique.
 """
 
-import asyncio
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QPalette, QColor, QFont
 from PySide6.QtWidgets import (
@@ -16,9 +15,10 @@ from PySide6.QtWidgets import (
     QFormLayout, QCheckBox, QSpacerItem, QFrame
 )
 
-from Pages.Panel import AdminPanel
 from utils.CrmApiAsync import CrmApiAsync
-from utils.utils import load_qss_file, update_json_file, center_on_screen
+from utils.StartupTracer import tracer
+from utils.TaskSupervisor import TaskSupervisor
+from utils.utils import center_on_screen
 
 
 class LoginWindow(QWidget):
@@ -28,6 +28,7 @@ class LoginWindow(QWidget):
 
     Attributes:
         api (CrmApiAsync): Client API pour la communication avec le backend.
+        tasks (TaskSupervisor): Tâches asynchrones de la page, annulées à sa fermeture.
         email_input (QLineEdit): Champ pour saisir l'email.
         password_input (QLineEdit): Champ pour saisir le mot de passe.
         info_label (QLabel): Label pour afficher l'état de la connexion.
@@ -45,6 +46,7 @@ class LoginWindow(QWidget):
         """
         super().__init__()
         self.api = api
+        self.tasks = TaskSupervisor("LoginWindow")
         self.email_input = None
         self.password_input = None
         self.info_label = None
@@ -57,6 +59,7 @@ class LoginWindow(QWidget):
     def init_ui(self):
         """Construit l'interface graphique de la page de connexion."""
         self.setWindowTitle("CRM Client")
+        self.setObjectName("login_window")
         self.resize(1280, 720)
         center_on_screen(self)
 
@@ -75,7 +78,6 @@ class LoginWindow(QWidget):
         card = QFrame()
         card.setFixedSize(400, 600)
         card.setObjectName("card")
-        card.setStyleSheet(load_qss_file("login_page.qss"))
 
         card_layout = QVBoxLayout(card)
         card_layout.setContentsMargins(30, 30, 30, 30)
@@ -95,12 +97,10 @@ class LoginWindow(QWidget):
 
         self.email_input = QLineEdit()
         self.email_input.setPlaceholderText("Adresse e-mail")
-        self.email_input.setStyleSheet(load_qss_file("input_style.qss"))
 
         self.password_input = QLineEdit()
         self.password_input.setPlaceholderText("Mot de passe")
         self.password_input.setEchoMode(QLineEdit.EchoMode.Password)
-        self.password_input.setStyleSheet(load_qss_file("input_style.qss"))
 
         form_layout.addWidget(self.email_input)
         form_layout.addWidget(self.password_input)
@@ -127,8 +127,7 @@ class LoginWindow(QWidget):
         self.login_btn = QPushButton("Se connecter")
         self.login_btn.setCursor(Qt.CursorShape.PointingHandCursor)
         self.login_btn.setObjectName("login_btn")
-        self.login_btn.setStyleSheet(load_qss_file("button_style.qss"))
-        self.login_btn.clicked.connect(lambda: asyncio.create_task(self.login()))
+        self.login_btn.clicked.connect(lambda: self.tasks.spawn(self.login()))
         card_layout.addWidget(self.login_btn)
 
         # Centrer la carte dans le layout principal
@@ -138,6 +137,17 @@ class LoginWindow(QWidget):
 
         self.setLayout(main_layout)
 
+    def closeEvent(self, event):
+        """Annule les tâches en cours à la fermeture de la page de connexion."""
+        self.tasks.cancel_all()
+        super().closeEvent(event)
+
+    def paintEvent(self, event):
+        """Enregistre le premier affichage de la page de connexion et termine le relevé de démarrage."""
+        if tracer.mark_once("login_first_paint"):
+            tracer.dump()
+        super().paintEvent(event)
+
     def toggle_password(self, state: int):
         """Affiche ou masque le mot de passe.
 
@@ -172,10 +182,15 @@ class LoginWindow(QWidget):
         connexion_code = await self.api.verify_request(connexion)
 
         if connexion_code == self.api.Ok:
+            from Pages.Panel import AdminPanel  # Import à l'ouverture du panel
+
             self.set_progress("Connexion réussie !", False)
             if self.remember_cb.isChecked():
-                update_json_file("auth.json", "access_token", connexion["access_token"])
-            self.admin_panel = AdminPanel(self.api, LoginWindow(self.api))
+                self.api.settings.set("access_token", connexion["access_token"])
+            # Utilisateur courant et première page d'utilisateurs chargés pendant la construction du panel
+            self.api.session.invalidate()
+            self.api.session.start()
+            self.admin_panel = AdminPanel(self.api)
             self.admin_panel.show()
             self.close()
         elif connexion_code == self.api.ErrorDNS:
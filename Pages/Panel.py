@@ -20,10 +20,10 @@ from PySide6.QtWidgets import (
     QListWidget,
 )
 
-from Pages.AccountPage.AccountPage import AccountPage
-from Pages.UsersPages.UserManagement import UserManagement
 from utils.CrmApiAsync import CrmApiAsync
-from utils.utils import load_qss_file, center_on_screen, get_icon
+from utils.StartupTracer import tracer
+from utils.TaskSupervisor import TaskSupervisor
+from utils.utils import center_on_screen, get_icon, LazyPage, prewarm_lazy_pages
 
 
 class MenuWidget(QListWidget):
@@ -40,7 +40,6 @@ class MenuWidget(QListWidget):
         self.addItem(QListWidgetItem("Mon compte"))
         self.setCurrentRow(0)
         self.setFocusPolicy(Qt.FocusPolicy.NoFocus)
-        self.setStyleSheet(load_qss_file("menu_widget.qss"))
 
 
 class Panel(QWidget):
@@ -58,6 +57,7 @@ class Panel(QWidget):
             stacked_widget (QStackedWidget): Conteneur des pages.
         """
         super().__init__()
+        self.setObjectName("panel")
 
         self.menu = MenuWidget()
         self.stacked_widget = stacked_widget
@@ -72,7 +72,7 @@ class Panel(QWidget):
         icon_layout = QHBoxLayout(icon_widget)
 
         title_icon = QLabel()
-        title_icon.setPixmap(get_icon("icon.ico", True).scaled(48, 48))
+        title_icon.setPixmap(get_icon("icon.ico", True, (48, 48)))
         title_icon.setStyleSheet("padding: 10px; font-size: 20px; margin: 10px; font-weight: bold;")
 
         title = QLabel("AdminPanel")
@@ -94,7 +94,7 @@ class Panel(QWidget):
         layout_container.setContentsMargins(0, 0, 0, 0)
         layout_container.setSpacing(0)
 
-        container.setStyleSheet("background: #081028;")
+        container.setObjectName("panel_container")
         container.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
         layout.addWidget(container)
 
@@ -116,25 +116,39 @@ class Panel(QWidget):
 class AdminPanel(QWidget):
     """Fenêtre principale du panel administrateur.
 
-    Contient le menu et les pages accessibles via le panel.
+    Contient le menu et les pages accessibles via le panel. Chaque page n'est
+    construite qu'à sa première ouverture, ou en arrière-plan après l'affichage
+    si `prewarm` est activé.
+
+    Attributes:
+        pages (QStackedWidget): Conteneur des pages.
+        lazy_pages (List[LazyPage]): Pages du panel, construites à la demande.
+        tasks (TaskSupervisor): Superviseur des tâches de la fenêtre et de ses pages, annulées à la fermeture.
     """
 
-    def __init__(self, api: CrmApiAsync, login_window):
+    def __init__(self, api: CrmApiAsync, prewarm: bool = True):
         """Initialise la fenêtre AdminPanel.
 
         Args:
             api (CrmApiAsync): Client API pour la communication avec le backend.
-            login_window (QWidget): Fenêtre de login, pour référence dans AccountPage.
+            prewarm (bool): Si True, construit les pages restantes une fois la fenêtre affichée.
         """
         super().__init__()
         self.resize(1280, 720)
         self.setWindowTitle("CRM Client")
         center_on_screen(self)
+        self.tasks = TaskSupervisor("AdminPanel")
 
-        # Création des pages accessibles
+        # Création des pages accessibles (construites à leur première ouverture)
         self.pages = QStackedWidget()
-        self.pages.addWidget(UserManagement(api))
-        self.pages.addWidget(AccountPage(api, self, login_window))
+        self.lazy_pages = [
+            LazyPage(lambda: self._build_user_management(api)),
+            LazyPage(lambda: self._build_account_page(api)),
+        ]
+        for page in self.lazy_pages:
+            self.pages.addWidget(page)
+        self.pages.currentChanged.connect(lambda index: self.lazy_pages[index].ensure_built())
+        self.lazy_pages[0].ensure_built()
 
         # Layout principal
         layout = QHBoxLayout()
@@ -144,3 +158,29 @@ class AdminPanel(QWidget):
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(0)
         self.setLayout(layout)
+
+        if prewarm:
+            prewarm_lazy_pages(self.lazy_pages, self)
+
+    def _build_user_management(self, api: CrmApiAsync) -> QWidget:
+        """Importe et construit la page de gestion des utilisateurs."""
+        from Pages.UsersPages.UserManagement import UserManagement
+
+        return UserManagement(api, tasks=self.tasks)
+
+    def _build_account_page(self, api: CrmApiAsync) -> QWidget:
+        """Importe et construit la page du compte courant."""
+        from Pages.AccountPage.AccountPage import AccountPage
+
+        return AccountPage(api, self)
+
+    def closeEvent(self, event):
+        """Annule les tâches de la fenêtre et de ses pages à la fermeture."""
+        self.tasks.cancel_all()
+        super().closeEvent(event)
+
+    def paintEvent(self, event):
+        """Enregistre le premier affichage du panel et termine le relevé de démarrage."""
+        if tracer.mark_once("admin_first_paint"):
+            tracer.dump()
+        super().paintEvent(event)
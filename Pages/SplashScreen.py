@@ -10,15 +10,20 @@ Dependencies:
 """
 
 import asyncio
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 from PySide6.QtCore import Qt, QTimer
 from PySide6.QtWidgets import QWidget, QProgressBar, QLabel, QVBoxLayout, QPushButton
 
-from Pages.LoginPage import LoginWindow
-from Pages.Panel import AdminPanel
 from utils.CrmApiAsync import CrmApiAsync
+from utils.StartupTracer import tracer
+from utils.TaskSupervisor import TaskSupervisor
 from utils.utils import center_on_screen, DraggableLabel
 
+if TYPE_CHECKING:
+    # Pages importées seulement à leur ouverture
+    from Pages.LoginPage import LoginWindow
+    from Pages.Panel import AdminPanel
+
 
 class SplashScreen(QWidget):
     """Splash Screen pour la connexion automatique de l'utilisateur.
@@ -27,6 +32,7 @@ class SplashScreen(QWidget):
 
     Attributes:
         api (CrmApiAsync): Client API pour interagir avec le backend.
+        tasks (TaskSupervisor): Tâches asynchrones du SplashScreen, annulées à sa fermeture.
         login_page (Optional[LoginWindow]): Page de connexion si l'utilisateur n'est pas connecté.
         admin_panel (Optional[AdminPanel]): Page administrateur si l'utilisateur est connecté.
         label (QLabel): Label affichant le déroulement de la connexion.
@@ -34,18 +40,22 @@ class SplashScreen(QWidget):
         button_close (QPushButton): Bouton pour fermer le SplashScreen en cas d'erreur.
         button_reload (QPushButton): Bouton pour réessayer la connexion en cas d'erreur.
         author_label (DraggableLabel): Label affichant le créateur et la version du programme.
+        fast_start (bool): Si True, la progression suit les étapes réelles sans animation simulée.
     """
 
-    def __init__(self, api: CrmApiAsync):
+    def __init__(self, api: CrmApiAsync, fast_start: bool = False):
         """Initialise le SplashScreen avec le client API.
 
         Args:
             api (CrmApiAsync): Instance du client API.
+            fast_start (bool): Si True, la progression suit les étapes réelles sans animation simulée.
         """
         super().__init__()
         self.api = api
-        self.login_page: Optional[LoginWindow] = None
-        self.admin_panel: Optional[AdminPanel] = None
+        self.fast_start = fast_start
+        self.tasks = TaskSupervisor("SplashScreen")
+        self.login_page: Optional["LoginWindow"] = None
+        self.admin_panel: Optional["AdminPanel"] = None
         self.label: Optional[QLabel] = None
         self.progress_bar: Optional[QProgressBar] = None
         self.button_close: Optional[QPushButton] = None
@@ -75,7 +85,7 @@ class SplashScreen(QWidget):
         # Boutons
         self.button_close = QPushButton("Fermer")
         self.button_reload = QPushButton("Réessayer")
-        self.button_reload.clicked.connect(lambda: asyncio.create_task(self.verify_session()))
+        self.button_reload.clicked.connect(lambda: self.tasks.spawn(self.verify_session()))
         self.button_close.clicked.connect(self.close)
         self.button_reload.setVisible(False)
         self.button_close.setVisible(False)
@@ -94,7 +104,17 @@ class SplashScreen(QWidget):
         layout.addWidget(self.progress_bar)
 
         # Lance la vérification de session après l'initialisation
-        QTimer.singleShot(0, lambda: asyncio.create_task(self.verify_session()))
+        QTimer.singleShot(0, lambda: self.tasks.spawn(self.verify_session()))
+
+    def closeEvent(self, event):
+        """Annule les tâches en cours à la fermeture du SplashScreen."""
+        self.tasks.cancel_all()
+        super().closeEvent(event)
+
+    def paintEvent(self, event):
+        """Enregistre le premier affichage du SplashScreen dans le relevé de démarrage."""
+        tracer.mark_once("splash_first_paint")
+        super().paintEvent(event)
 
     def message(self, text: str, err: bool = True):
         """Affiche un message et ajuste la visibilité des widgets.
@@ -112,21 +132,30 @@ class SplashScreen(QWidget):
         """Vérifie et connecte l'utilisateur courant de manière asynchrone."""
         self.message("Vérification de la session...", False)
 
-        # Simule une progression visuelle
-        async def fake_progress():
-            for i in range(1, 91):
-                await asyncio.sleep(0.02)
-                self.progress_bar.setValue(i)
+        if self.fast_start:
+            # Progression sur les étapes réelles : envoi (10 %), téléchargement (10 à 90 %), fin
+            self.progress_bar.setValue(10)
+            progress_callback = lambda value: self.progress_bar.setValue(10 + value * 80 // 100)
+            fake_task = None
+        else:
+            # Simule une progression visuelle
+            async def fake_progress():
+                for i in range(1, 91):
+                    await asyncio.sleep(0.02)
+                    self.progress_bar.setValue(i)
 
-        fake_task = asyncio.create_task(fake_progress())
+            progress_callback = self.progress_bar.setValue
+            fake_task = self.tasks.spawn(fake_progress())
 
-        # Vérification réelle via l'API
-        connexion = await self.api.get_current_user_access(progress_callback=self.progress_bar.setValue)
+        # Vérification réelle via l'API, la première page d'utilisateurs est téléchargée en parallèle
+        connexion = await self.api.session.load(progress_callback=progress_callback)
         verify_connexion = await self.api.verify_request(connexion)
+        tracer.mark("session_check")
 
-        fake_task.cancel()
         self.progress_bar.setValue(100)
-        await asyncio.sleep(0.3)
+        if fake_task is not None:
+            fake_task.cancel()
+            await asyncio.sleep(0.3)
 
         # Gestion des résultats
         if verify_connexion == self.api.Ok:
@@ -141,12 +170,16 @@ class SplashScreen(QWidget):
     # ------------------------------------------------------------
     def open_admin(self):
         """Ouvre la page administrateur et ferme le SplashScreen."""
-        self.admin_panel = AdminPanel(self.api, LoginWindow(self.api))
+        from Pages.Panel import AdminPanel
+
+        self.admin_panel = AdminPanel(self.api)
         self.admin_panel.show()
         self.close()
 
     def open_login(self):
         """Ouvre la page de connexion et ferme le SplashScreen."""
+        from Pages.LoginPage import LoginWindow
+
         self.login_page = LoginWindow(self.api)
         self.login_page.show()
         self.close()
@@ -9,15 +9,18 @@ Dependencies:
 """
 
 # import de module
-import asyncio
+from typing import TYPE_CHECKING, Optional
 
 # import des classes de Pyside6
 from PySide6.QtCore import Qt, QRegularExpression
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QSizePolicy, QLineEdit, QPushButton
 
-from Pages.UsersPages.SubPages.ViewUsersPage import ViewUserPage
 from utils.CrmApiAsync import CrmApiAsync
-from utils.utils import load_qss_file, add_widgets, configure_line_edit
+from utils.TaskSupervisor import TaskSupervisor
+from utils.utils import add_widgets, configure_line_edit, create_message_box
+
+if TYPE_CHECKING:
+    from Pages.UsersPages.SubPages.ViewUsersPage import ViewUserPage
 
 
 class AddUserPage(QWidget):
@@ -33,19 +36,23 @@ class AddUserPage(QWidget):
         telephone (QLineEdit): Le champ pour mettre le numéro de téléphone du nouvel utilisateur.
         info_label (QLabel): Un Label pour informer la progression de l'ajout.
         add_button (QPushButton): Le bouton permettant l'ajout de l'utilisateur.
+        tasks (TaskSupervisor): Les tâches asynchrones de la page, annulées à la fermeture du panel.
 
     """
 
-    def __init__(self, api: CrmApiAsync, view_user_page: ViewUserPage):
+    def __init__(self, api: CrmApiAsync, view_user_page: "ViewUserPage", tasks: Optional[TaskSupervisor] = None):
         """Constructeur de la page AddUserPage.
 
         Args:
             api (CrmApiAsync): la classe de l'API
             view_user_page (ViewUserPage): La page contenant le tableau des utilisateurs.
+            tasks (Optional[TaskSupervisor]): Le superviseur parent des tâches de la page.
         """
         super().__init__()
         self.api = api
+        self.tasks = TaskSupervisor("AddUserPage", parent=tasks)
         self.view_user_page = view_user_page
+        self.setObjectName("add_user_page")
 
         container = QWidget()
 
@@ -72,7 +79,7 @@ class AddUserPage(QWidget):
         self.info_label.setStyleSheet("""font-size: 20px;""")
 
         self.add_button = QPushButton("Ajouter l'utilisateur")
-        self.add_button.clicked.connect(lambda: asyncio.create_task(self.add_user_action()))
+        self.add_button.clicked.connect(lambda: self.tasks.spawn(self.add_user_action()))
         self.add_button.setFixedWidth(300)
         self.add_button.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Fixed)
         self.add_button.setCursor(Qt.CursorShape.PointingHandCursor)
@@ -80,8 +87,6 @@ class AddUserPage(QWidget):
                     [self.name, self.first_name, self.email, self.telephone, self.info_label])
         container_layout.addWidget(self.add_button, alignment=Qt.AlignmentFlag.AlignCenter)
 
-        container.setStyleSheet(load_qss_file("add_user_page.qss"))
-
         container_layout.setContentsMargins(0, 0, 0, 0)
         layout.addWidget(container, 1)
         layout.addStretch()
@@ -136,6 +141,16 @@ class AddUserPage(QWidget):
             data (dict): Les données de l'utilisateur qu'on veut ajouter.
         """
         response = await self.api.create_user(data["name"], data["first_name"], data["email"], data["telephone"])
+        err = response.get("err")
+        if isinstance(err, dict) and err.get("local"):
+            # Doublon probable d'après l'index local : le serveur décide si l'utilisateur confirme
+            field = "Cet email" if err["field"] == "email" else "Ce numéro de téléphone"
+            if not create_message_box(self, "Doublon probable",
+                                      f"{field} semble déjà utilisé.\nCréer l'utilisateur quand même ?", True):
+                self.set_progress("Ajout annulé.")
+                return
+            response = await self.api.create_user(data["name"], data["first_name"], data["email"],
+                                                  data["telephone"], check_duplicates=False)
         response_code = await self.api.verify_request(response)
 
         # Vérification de la requête.
@@ -150,7 +165,6 @@ class AddUserPage(QWidget):
             return
         elif response_code == self.api.OtherError:
             if response["err"].message == 'User already exists!':
-                print(response["err"].message)
                 self.set_progress("L'utilisateur existe déjà !")
                 return
             elif response["err"].message == "Not authenticated":
@@ -0,0 +1,746 @@
+"""
+UserTableModel.py
+=================
+
+Module contenant le modèle du tableau des utilisateurs avec chargement à la demande.
+
+Les utilisateurs sont récupérés page par page au fil du défilement via
+`canFetchMore`/`fetchMore`, la page suivante est lue par anticipation et les
+pages éloignées de la zone affichée sont libérées de la mémoire.
+
+Dependencies:
+    PySide6: Pour le modèle Qt.
+    asyncio: Pour le chargement asynchrone des pages.
+"""
+
+import asyncio
+from typing import Any, Dict, List, Optional, Set
+
+from aiohttp import ClientError
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt, Signal
+
+from utils.CrmApiAsync import CrmApiAsync
+from utils.ColumnarUserStore import ColumnarUserStore
+from utils.TaskSupervisor import TaskSupervisor
+from utils.UserSnapshot import SnapshotWriter, UserSnapshot, write_snapshot
+from utils.normalize import user_sort_keys
+from utils.offload import run_cpu
+
+
+class UserTableModel(QAbstractTableModel):
+    """Modèle paginé du tableau des utilisateurs.
+
+    Hérite de QAbstractTableModel.
+
+    Les identifiants de toutes les lignes chargées restent en mémoire, seules les
+    données complètes des pages éloignées sont libérées puis rechargées si la ligne
+    redevient visible. Le tri est fait localement lorsque toute la liste est en
+    mémoire, sinon il est délégué au serveur et le modèle est rechargé.
+
+    Chaque ligne garde ses clés de tri typées (ID numérique, noms sans accents ni
+    casse, téléphone normalisé), calculées une seule fois à l'arrivée des données.
+
+    En mode `columnar`, toute la liste est chargée en une requête dans un
+    `ColumnarUserStore` qui remplace la liste des données : le tri est alors
+    vectorisé et aucune clé de tri n'est gardée par ligne.
+
+    Si le client a un chemin d'instantané (`api.snapshot_path`), la dernière liste
+    reçue est affichée au premier chargement depuis l'instantané sur disque (chaque
+    ligne n'est décodée qu'à son affichage), puis revalidée avec la première page
+    (celle préchargée à l'ouverture de la session) : si elle n'a pas changé, l'instantané
+    reste affiché sans autre téléchargement ; sinon la liste est chargée comme
+    d'habitude et l'instantané est réécrit en arrière-plan.
+
+    Attributes:
+        COLUMNS (list): Champ de l'utilisateur et libellé de chaque colonne.
+        ACTION_COLUMN (int): Index de la colonne contenant les boutons d'action.
+        load_failed (Signal): Émis avec le code et la réponse lorsqu'une page n'a pas pu être chargée.
+        api (CrmApiAsync): Client API pour la communication avec le backend.
+        page_size (int): Nombre d'utilisateurs par page.
+        max_resident_pages (int): Nombre maximal de pages gardées en mémoire.
+        read_ahead (int): Nombre de pages lues par anticipation.
+        tasks (TaskSupervisor): Superviseur des téléchargements de pages.
+        columnar (bool): Si True, la liste complète est chargée dans un stockage en colonnes.
+    """
+
+    COLUMNS = [
+        ("id", "ID"),
+        ("name", "Nom"),
+        ("first_name", "Prénom"),
+        ("email", "Email"),
+        ("telephone", "Téléphone"),
+        (None, "Action"),
+    ]
+    ACTION_COLUMN = 5
+    PLACEHOLDER = "…"
+
+    load_failed = Signal(int, object)
+
+    def __init__(self, api: CrmApiAsync, page_size: int = CrmApiAsync.USERS_PAGE_SIZE, max_resident_pages: int = 20,
+                 read_ahead: int = 1, tasks: Optional[TaskSupervisor] = None, columnar: bool = False):
+        """Initialise le modèle vide.
+
+        Args:
+            api (CrmApiAsync): Client API.
+            page_size (int): Nombre d'utilisateurs par page.
+            max_resident_pages (int): Nombre maximal de pages gardées en mémoire.
+            read_ahead (int): Nombre de pages lues par anticipation.
+            tasks (Optional[TaskSupervisor]): Superviseur parent des téléchargements.
+            columnar (bool): Si True, la liste complète est chargée dans un stockage en colonnes
+                (NumPy requis, voir `columnar_available`).
+        """
+        super().__init__()
+        self.api = api
+        self.tasks = TaskSupervisor("UserTableModel", parent=tasks)
+        self.columnar = columnar
+        self._snapshot: Optional[UserSnapshot] = None
+        self.page_size = page_size
+        self.max_resident_pages = max_resident_pages
+        self.read_ahead = read_ahead
+        self._ids: List[int] = []
+        self._records: List[Optional[Dict[str, Any]]] = []
+        self._keys: List[Optional[tuple]] = []
+        self._resident: Set[int] = set()
+        self._ahead: Dict[int, tuple] = {}
+        self._pending: Dict[int, asyncio.Task] = {}
+        self._reloading: Dict[int, asyncio.Task] = {}
+        self._insert_on_arrival: Set[int] = set()
+        self._exhausted = False
+        self._paginated = True
+        self._locally_sorted = False
+        self._sort_field: Optional[str] = None
+        self._descending = False
+        self._last_page = 0
+        self._generation = 0
+        self._row_offset = 0
+
+    # ------------------------------------------------------------
+    # Interface QAbstractTableModel
+    # ------------------------------------------------------------
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._ids)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.COLUMNS)
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.COLUMNS[section][1]
+        return None
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or role != Qt.ItemDataRole.DisplayRole:
+            return None
+        field = self.COLUMNS[index.column()][0]
+        if field is None:
+            return None
+
+        row = index.row()
+        self._last_page = row // self.page_size
+        if field == "id":
+            return str(self._ids[row])
+
+        record = self._record_at(row)
+        if record is None:
+            self._reload_page(self._last_page)
+            return self.PLACEHOLDER
+        return str(record[field])
+
+    def canFetchMore(self, parent: QModelIndex = QModelIndex()) -> bool:
+        return not parent.isValid() and not self._exhausted
+
+    def fetchMore(self, parent: QModelIndex = QModelIndex()) -> None:
+        if parent.isValid() or self._exhausted:
+            return
+        skip = len(self._ids)
+        if skip in self._ahead:
+            self._append(skip, *self._ahead.pop(skip))
+            self._start_read_ahead()
+            return
+        self._insert_on_arrival.add(skip)
+        self._start_fetch(skip)
+
+    def sort(self, column: int, order: Qt.SortOrder = Qt.SortOrder.AscendingOrder) -> None:
+        field = self.COLUMNS[column][0]
+        if field is None:
+            return
+        descending = order == Qt.SortOrder.DescendingOrder
+
+        # Tri naturel (ID croissant) : aucun paramètre envoyé au serveur
+        if field == "id" and not descending and not self._locally_sorted:
+            field = None
+        if (field, descending) == (self._sort_field, self._descending):
+            return
+        self._sort_field, self._descending = field, descending
+
+        if self._fully_resident():
+            self._sort_locally()
+        elif self._ids:
+            # Une partie de la liste n'est pas en mémoire : tri délégué au serveur
+            self.reset()
+            self.fetchMore()
+
+    # ------------------------------------------------------------
+    # Accès aux utilisateurs
+    # ------------------------------------------------------------
+    def user_id(self, row: int) -> int:
+        """Renvoie l'ID de l'utilisateur affiché à une ligne.
+
+        Args:
+            row (int): Index de la ligne.
+
+        Returns:
+            int: ID de l'utilisateur.
+        """
+        return self._ids[row]
+
+    def record(self, row: int) -> Optional[Dict[str, Any]]:
+        """Renvoie les données de l'utilisateur affiché à une ligne.
+
+        Args:
+            row (int): Index de la ligne.
+
+        Returns:
+            Optional[Dict[str, Any]]: Données de l'utilisateur, None si la page a été libérée.
+        """
+        return self._record_at(row)
+
+    def row_of(self, user_id: int) -> Optional[int]:
+        """Recherche la ligne d'un utilisateur.
+
+        Args:
+            user_id (int): ID de l'utilisateur.
+
+        Returns:
+            Optional[int]: Index de la ligne, None si l'utilisateur n'est pas chargé.
+        """
+        try:
+            return self._ids.index(user_id)
+        except ValueError:
+            return None
+
+    async def first_page_changed(self) -> bool:
+        """Vérifie auprès du serveur si la première page diffère des lignes chargées.
+
+        La requête est conditionnelle : si le serveur gère les ETag, une page inchangée
+        ne coûte qu'une réponse 304. Les utilisateurs sont comparés par ID, ce qui reste
+        valable après un tri local.
+
+        Returns:
+            bool: True si la page a changé (ou si le modèle n'a encore rien chargé).
+        """
+        generation = self._generation
+        response = await self.api.get_users_page(0, self.page_size, self._sort_field, self._descending,
+                                                 conditional=True)
+        response_code = await self.api.verify_request(response)
+        if response_code != self.api.Ok or generation != self._generation:
+            return False
+        return self._page_differs(list(response))
+
+    def _page_differs(self, users: List[Dict[str, Any]]) -> bool:
+        """Compare la première page reçue du serveur aux lignes chargées.
+
+        Args:
+            users (List[Dict[str, Any]]): Utilisateurs de la première page.
+
+        Returns:
+            bool: True si la page contient un utilisateur absent ou modifié.
+        """
+        if not self._ids:
+            return bool(users)
+        if len(users) < self.page_size and len(users) != len(self._ids):
+            return True
+        rows = {user_id: row for row, user_id in enumerate(self._ids)}
+        return any(user["id"] not in rows or self._record_at(rows[user["id"]]) not in (None, user) for user in users)
+
+    # ------------------------------------------------------------
+    # Modifications locales (mises à jour optimistes)
+    # ------------------------------------------------------------
+    def update_record(self, row: int, changes: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Remplace les champs d'un utilisateur sans attendre le serveur.
+
+        Args:
+            row (int): Index de la ligne.
+            changes (Dict[str, Any]): Champs modifiés.
+
+        Returns:
+            Optional[Dict[str, Any]]: Données précédentes de la ligne, pour une éventuelle annulation.
+        """
+        previous = self._record_at(row)
+        base = previous if previous is not None else {"id": self._ids[row]}
+        self._records[row] = {**base, **changes}
+        self._keys[row] = user_sort_keys(self._records[row])
+        self.dataChanged.emit(self.index(row, 0), self.index(row, self.ACTION_COLUMN - 1))
+        return previous
+
+    def restore_record(self, row: int, record: Optional[Dict[str, Any]]) -> None:
+        """Remet les données renvoyées par `update_record` (annulation d'une modification).
+
+        Args:
+            row (int): Index de la ligne.
+            record (Optional[Dict[str, Any]]): Données précédentes ; None si la page avait été
+                libérée, elle est alors rechargée depuis le serveur à son prochain affichage.
+        """
+        self._records[row] = record
+        self._keys[row] = user_sort_keys(record) if record is not None else None
+        self.dataChanged.emit(self.index(row, 0), self.index(row, self.ACTION_COLUMN - 1))
+
+    def take_row(self, row: int) -> tuple:
+        """Retire une ligne du modèle sans attendre le serveur.
+
+        Args:
+            row (int): Index de la ligne.
+
+        Returns:
+            tuple: Position, ID, données retirés et génération du modèle, à passer à `insert_row`
+                pour annuler.
+        """
+        self._record_at(row)
+        self.beginRemoveRows(QModelIndex(), row, row)
+        user_id = self._ids.pop(row)
+        record = self._records.pop(row)
+        self._keys.pop(row)
+        self._shift_pages(-1)
+        self.endRemoveRows()
+        return row, user_id, record, self._generation
+
+    def insert_row(self, row: int, user_id: int, record: Optional[Dict[str, Any]],
+                   generation: Optional[int] = None) -> None:
+        """Réinsère une ligne retirée par `take_row`.
+
+        La ligne n'est pas réinsérée si le modèle a été rechargé depuis son retrait
+        (la liste rechargée la contient déjà si elle existe encore) ou si l'utilisateur
+        est de nouveau affiché.
+
+        Args:
+            row (int): Position de la ligne.
+            user_id (int): ID de l'utilisateur.
+            record (Optional[Dict[str, Any]]): Données de l'utilisateur.
+            generation (Optional[int]): Génération du modèle au retrait de la ligne.
+        """
+        if (generation is not None and generation != self._generation) or self.row_of(user_id) is not None:
+            return
+        row = min(row, len(self._ids))
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._ids.insert(row, user_id)
+        self._records.insert(row, record)
+        self._keys.insert(row, user_sort_keys(record) if record is not None else None)
+        self._shift_pages(1)
+        self.endInsertRows()
+
+    def _shift_pages(self, delta: int) -> None:
+        """Décale les pages attendues après l'ajout ou le retrait local de lignes chargées.
+
+        Les pages lues par anticipation ou en cours de téléchargement commencent après
+        les lignes chargées : leur position suit le nombre de lignes, sans quoi la page
+        suivante sauterait (ou répéterait) un utilisateur.
+
+        Args:
+            delta (int): Nombre de lignes ajoutées (négatif si retirées).
+        """
+        self._row_offset += delta
+        self._ahead = {skip + delta: page for skip, page in self._ahead.items()}
+        self._pending = {skip + delta: task for skip, task in self._pending.items()}
+        self._insert_on_arrival = {skip + delta for skip in self._insert_on_arrival}
+        last = (len(self._ids) - 1) // self.page_size
+        self._resident = {min(page, last) for page in self._resident} if self._ids else set()
+
+    # ------------------------------------------------------------
+    # Chargement des pages
+    # ------------------------------------------------------------
+    def reset(self) -> None:
+        """Vide le modèle et abandonne les chargements en cours."""
+        self.beginResetModel()
+        self._generation += 1
+        self._close_snapshot()
+        for task in list(self._pending.values()) + list(self._reloading.values()):
+            task.cancel()
+        self._pending.clear()
+        self._reloading.clear()
+        self._ahead.clear()
+        self._insert_on_arrival.clear()
+        self._ids = []
+        self._records = []
+        self._keys = []
+        self._resident.clear()
+        self._exhausted = False
+        self._paginated = True
+        self._locally_sorted = False
+        self._last_page = 0
+        self._row_offset = 0
+        self.endResetModel()
+
+    async def reload(self) -> None:
+        """Recharge le modèle depuis la première page, ou entièrement en mode `columnar`.
+
+        Au premier chargement, l'instantané est affiché puis revalidé (voir la
+        description de la classe).
+        """
+        # Aucune remise à zéro n'a encore eu lieu : premier chargement
+        startup = self._generation == 0
+        self.reset()
+        path = self.api.snapshot_path
+        if startup and path is not None:
+            if self._show_snapshot(path):
+                if await self._snapshot_up_to_date(self._generation):
+                    return
+                self.reset()
+            if not self.columnar:
+                # En mode `columnar`, l'instantané est réécrit avec la liste complète
+                self.tasks.spawn(self._rewrite_snapshot(path))
+        if self.columnar:
+            # La liste complète est téléchargée : une première page préchargée ne serait jamais lue
+            self.api.discard_prefetched()
+            await self._fetch_all(self._generation)
+            return
+        self._insert_on_arrival.add(0)
+        await self._start_fetch(0)
+
+    async def _fetch_all(self, generation: int) -> None:
+        """Télécharge toute la liste, remplace les lignes affichées et met à jour l'instantané.
+
+        Args:
+            generation (int): Génération du modèle au lancement du chargement.
+        """
+        response = await self.api.get_all_users(columnar=self.columnar)
+        response_code = await self.api.verify_request(response)
+        if generation != self._generation:
+            return
+        if response_code != self.api.Ok:
+            self.load_failed.emit(response_code, response)
+            return
+
+        if isinstance(response, ColumnarUserStore):
+            records, keys = response, [None] * len(response)
+            ids = response.ids.tolist()
+        else:
+            # Liste de dictionnaires (NumPy absent ou mode `columnar` désactivé)
+            records = list(response)
+            keys = await self.api.build_sort_keys(records)
+            if generation != self._generation:
+                return
+            ids = [user["id"] for user in records]
+        self._replace_rows(ids, records, keys)
+
+        if self.api.snapshot_path is not None:
+            self._close_snapshot()
+            # Copie : les lignes peuvent être modifiées pendant l'écriture dans l'exécuteur
+            copy = records.take(range(len(records))) if isinstance(records, ColumnarUserStore) else list(records)
+            self.tasks.spawn(self._save_snapshot(self.api.snapshot_path, copy))
+
+    def _replace_rows(self, ids: List[int], records: Any, keys: List[Optional[tuple]]) -> None:
+        """Remplace toutes les lignes par la liste complète reçue, en gardant le tri en cours.
+
+        Args:
+            ids (List[int]): ID des utilisateurs.
+            records (Any): Données des utilisateurs (liste ou `ColumnarUserStore`).
+            keys (List[Optional[tuple]]): Clés de tri des utilisateurs.
+        """
+        if self._ids:
+            self.beginRemoveRows(QModelIndex(), 0, len(self._ids) - 1)
+            self._ids, self._records, self._keys = [], [], []
+            self.endRemoveRows()
+        self._paginated = False
+        self._exhausted = True
+        self._locally_sorted = False
+        if ids:
+            self.beginInsertRows(QModelIndex(), 0, len(ids) - 1)
+            self._ids, self._records, self._keys = ids, records, keys
+            self.endInsertRows()
+        if self._sort_field is not None:
+            self._sort_locally()
+
+    # ------------------------------------------------------------
+    # Instantané sur disque
+    # ------------------------------------------------------------
+    def _show_snapshot(self, path: str) -> bool:
+        """Affiche la liste de l'instantané sans décoder les utilisateurs.
+
+        Chaque ligne garde la position de son utilisateur dans l'instantané jusqu'à
+        son premier affichage (voir `_record_at`).
+
+        Args:
+            path (str): Chemin de l'instantané.
+
+        Returns:
+            bool: False si l'instantané n'existe pas ou n'est pas valide.
+        """
+        snapshot = UserSnapshot.open(path)
+        if snapshot is None:
+            return False
+        self._snapshot = snapshot
+        self._paginated = False
+        self._exhausted = True
+        if not len(snapshot):
+            return True
+        self.beginInsertRows(QModelIndex(), 0, len(snapshot) - 1)
+        self._ids = snapshot.ids()
+        self._records = list(range(len(snapshot)))
+        self._keys = [None] * len(snapshot)
+        self.endInsertRows()
+        if self._sort_field is not None:
+            self._sort_locally()
+        return True
+
+    async def _snapshot_up_to_date(self, generation: int) -> bool:
+        """Revalide l'instantané affiché avec la première page, préchargée par la session si récente.
+
+        Args:
+            generation (int): Génération du modèle à l'affichage de l'instantané.
+
+        Returns:
+            bool: False si la première page diffère de l'instantané ; True sinon, y compris
+                en cas d'erreur (l'instantané reste affiché) ou si le modèle a été rechargé.
+        """
+        response = await self.api.get_users_page(0, self.page_size, self._sort_field, self._descending)
+        response_code = await self.api.verify_request(response)
+        if generation != self._generation:
+            return True
+        if response_code != self.api.Ok:
+            self.load_failed.emit(response_code, response)
+            return True
+        return not self._page_differs(list(response))
+
+    async def _rewrite_snapshot(self, path: str) -> None:
+        """Réécrit l'instantané à partir de la liste décodée au fil de la réception.
+
+        La liste n'est pas gardée en mémoire et n'est pas affichée : le modèle
+        continue de charger ses pages normalement.
+
+        Args:
+            path (str): Chemin de l'instantané.
+        """
+        writer = SnapshotWriter()
+        try:
+            async for user in self.api.stream_all_users():
+                writer.add(user)
+            await run_cpu(writer.commit, path, executor=self.api.executor)
+        except (ClientError, ValueError, OSError) as e:
+            print(e)
+
+    def _record_at(self, row: int) -> Optional[Dict[str, Any]]:
+        """Renvoie les données d'une ligne en décodant l'utilisateur de l'instantané si besoin.
+
+        Args:
+            row (int): Index de la ligne.
+
+        Returns:
+            Optional[Dict[str, Any]]: Données de l'utilisateur, None si la page a été libérée.
+        """
+        record = self._records[row]
+        if type(record) is int:
+            record = self._records[row] = self._snapshot[record]
+            self._keys[row] = user_sort_keys(record)
+        return record
+
+    def _resolve_snapshot(self) -> None:
+        """Décode toutes les lignes encore lues depuis l'instantané (avant un tri local)."""
+        if self._snapshot is not None:
+            for row in range(len(self._records)):
+                self._record_at(row)
+
+    def _close_snapshot(self) -> None:
+        """Libère l'instantané une fois que plus aucune ligne n'en dépend (remise à zéro ou remplacement)."""
+        if self._snapshot is not None:
+            self._snapshot.close()
+            self._snapshot = None
+
+    async def _save_snapshot(self, path: str, records: Any) -> None:
+        """Écrit le nouvel instantané hors du thread de l'interface.
+
+        Args:
+            path (str): Chemin de l'instantané.
+            records (Any): Utilisateurs reçus du serveur.
+        """
+        try:
+            await run_cpu(write_snapshot, path, records, executor=self.api.executor)
+        except OSError as e:
+            print(e)
+
+    def _start_fetch(self, skip: int) -> asyncio.Task:
+        """Lance le chargement de la page commençant à `skip` s'il n'est pas déjà en cours."""
+        task = self._pending.get(skip)
+        if task is None:
+            task = self.tasks.spawn(self._fetch_rows(skip, self._generation, self._row_offset))
+            self._pending[skip] = task
+            task.add_done_callback(self._forget_pending)
+        return task
+
+    def _forget_pending(self, task: asyncio.Task) -> None:
+        """Oublie un chargement terminé, retrouvé par sa tâche (sa position a pu être décalée)."""
+        for skip, pending in list(self._pending.items()):
+            if pending is task:
+                del self._pending[skip]
+
+    def _start_read_ahead(self) -> None:
+        """Lit par anticipation les pages suivant la fin du modèle."""
+        if self._exhausted or not self._paginated:
+            return
+        for i in range(self.read_ahead):
+            skip = len(self._ids) + i * self.page_size
+            if skip not in self._ahead:
+                self._start_fetch(skip)
+
+    async def _fetch_rows(self, skip: int, generation: int, offset: int) -> None:
+        """Télécharge une page et l'insère si elle est attendue, sinon la garde en réserve.
+
+        Args:
+            skip (int): Position du premier utilisateur de la page.
+            generation (int): Génération du modèle au lancement du chargement.
+            offset (int): Décalage des lignes (voir `_shift_pages`) au lancement du chargement.
+        """
+        response = await self.api.get_users_page(skip, self.page_size, self._sort_field, self._descending)
+        response_code = await self.api.verify_request(response)
+        if generation != self._generation:
+            return
+        # Lignes ajoutées ou retirées localement pendant le téléchargement
+        skip, offset = skip + self._row_offset - offset, self._row_offset
+
+        if response_code != self.api.Ok:
+            if skip in self._insert_on_arrival:
+                self._insert_on_arrival.discard(skip)
+                self.load_failed.emit(response_code, response)
+            return
+
+        users = list(response)
+        if skip and users and self._ids and users[0]["id"] == self._ids[0]:
+            # Le serveur ignore la pagination et renvoie toujours la liste complète
+            self._paginated = False
+            self._exhausted = True
+            return
+
+        # Clés de tri calculées hors du thread de l'interface pour les grandes réponses
+        keys = await self.api.build_sort_keys(users)
+        if generation != self._generation:
+            return
+        skip += self._row_offset - offset
+
+        if skip in self._insert_on_arrival and skip == len(self._ids):
+            self._insert_on_arrival.discard(skip)
+            self._append(skip, users, keys)
+            self._start_read_ahead()
+        else:
+            self._ahead[skip] = (users, keys)
+
+    def _append(self, skip: int, users: list, keys: list) -> None:
+        """Ajoute une page à la fin du modèle.
+
+        Args:
+            skip (int): Position du premier utilisateur de la page.
+            users (list): Utilisateurs de la page.
+            keys (list): Clés de tri des utilisateurs.
+        """
+        if len(users) > self.page_size:
+            # Réponse non paginée : toute la liste est reçue d'un coup
+            self._paginated = False
+        if len(users) < self.page_size or not self._paginated:
+            self._exhausted = True
+        if not users:
+            return
+
+        self.beginInsertRows(QModelIndex(), skip, skip + len(users) - 1)
+        self._ids.extend(user["id"] for user in users)
+        self._records.extend(users)
+        self._keys.extend(keys)
+        self.endInsertRows()
+
+        self._resident.update(range(skip // self.page_size, (skip + len(users) - 1) // self.page_size + 1))
+        self._last_page = (skip + len(users) - 1) // self.page_size
+        self._evict_far_pages()
+        if self._exhausted and self._sort_field is not None and self._fully_resident():
+            self._sort_locally()
+
+    def _reload_page(self, page: int) -> None:
+        """Recharge en arrière-plan une page libérée de la mémoire.
+
+        Args:
+            page (int): Index de la page.
+        """
+        if page not in self._reloading:
+            task = self.tasks.spawn(self._fetch_page_again(page, self._generation))
+            self._reloading[page] = task
+            task.add_done_callback(lambda t, p=page: self._reloading.pop(p) if self._reloading.get(p) is t else None)
+
+    async def _fetch_page_again(self, page: int, generation: int) -> None:
+        """Télécharge de nouveau une page libérée et remplace ses lignes.
+
+        Args:
+            page (int): Index de la page.
+            generation (int): Génération du modèle au lancement du chargement.
+        """
+        start = page * self.page_size
+        response = await self.api.get_users_page(start, self.page_size, self._sort_field, self._descending)
+        response_code = await self.api.verify_request(response)
+        if generation != self._generation or response_code != self.api.Ok:
+            return
+
+        users = list(response)
+        keys = await self.api.build_sort_keys(users)
+        if generation != self._generation:
+            return
+        # Seules les lignes encore présentes sont remplacées (certaines ont pu être retirées entre-temps)
+        count = min(len(users), len(self._ids) - start)
+        if count <= 0:
+            return
+        for offset in range(count):
+            self._ids[start + offset] = users[offset]["id"]
+            self._records[start + offset] = users[offset]
+            self._keys[start + offset] = keys[offset]
+        self._resident.add(page)
+        self._evict_far_pages(keep=page)
+        self.dataChanged.emit(self.index(start, 0), self.index(start + count - 1, self.ACTION_COLUMN - 1))
+
+    def _evict_far_pages(self, keep: Optional[int] = None) -> None:
+        """Libère les pages les plus éloignées de la zone affichée au-delà de la limite.
+
+        Args:
+            keep (Optional[int]): Page à ne pas libérer.
+        """
+        if not self._paginated or self._locally_sorted:
+            return
+        while len(self._resident) > self.max_resident_pages:
+            candidates = [p for p in self._resident if p not in (keep, self._last_page)]
+            if not candidates:
+                return
+            page = max(candidates, key=lambda p: abs(p - self._last_page))
+            self._resident.discard(page)
+            start = page * self.page_size
+            end = min(start + self.page_size, len(self._records))
+            self._records[start:end] = [None] * (end - start)
+            self._keys[start:end] = [None] * (end - start)
+            self.dataChanged.emit(self.index(start, 1), self.index(end - 1, self.ACTION_COLUMN - 1))
+
+    # ------------------------------------------------------------
+    # Tri local
+    # ------------------------------------------------------------
+    def _fully_resident(self) -> bool:
+        """Indique si toute la liste est chargée et en mémoire (ou lisible depuis l'instantané)."""
+        if isinstance(self._records, ColumnarUserStore):
+            return True
+        return self._exhausted and all(record is not None for record in self._records)
+
+    def _sort_locally(self) -> None:
+        """Trie les lignes en mémoire en conservant les index persistants (widgets d'action)."""
+        column = [field for field, _ in self.COLUMNS].index(self._sort_field or "id")
+        self._resolve_snapshot()
+        self.layoutAboutToBeChanged.emit()
+
+        keys = self._keys
+        if isinstance(self._records, ColumnarUserStore):
+            # Tri vectorisé sur les colonnes encodées
+            order = self._records.argsort(self._sort_field or "id", self._descending).tolist()
+            self._records = self._records.take(order)
+        else:
+            order = sorted(range(len(self._ids)), key=lambda i: keys[i][column], reverse=self._descending)
+            self._records = [self._records[i] for i in order]
+        new_rows = [0] * len(order)
+        for new_row, old_row in enumerate(order):
+            new_rows[old_row] = new_row
+        self._ids = [self._ids[i] for i in order]
+        self._keys = [keys[i] for i in order]
+        self._locally_sorted = True
+
+        old_indexes = self.persistentIndexList()
+        new_indexes = [self.index(new_rows[index.row()], index.column()) for index in old_indexes]
+        self.changePersistentIndexList(old_indexes, new_indexes)
+        self.layoutChanged.emit()
@@ -10,12 +10,19 @@ Dependencies:
 """
 
 import asyncio
-from PySide6.QtCore import Qt, Signal, QSize
-from PySide6.QtGui import QStandardItem, QStandardItemModel, QIcon
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QTreeView, QPushButton, QMessageBox, QHBoxLayout, QLineEdit
+from typing import List, Optional, Tuple
 
+from PySide6.QtCore import Qt, Signal, QSize, QPoint, QPersistentModelIndex, QTimer
+from PySide6.QtGui import QIcon
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QTreeView, QPushButton, QHBoxLayout, QLineEdit, QFileDialog
+
+from Pages.UsersPages.SubPages.UserTableModel import UserTableModel
+from utils.AutoRefreshScheduler import AutoRefreshScheduler, auto_refresh_interval
+from utils.ColumnarUserStore import columnar_enabled
 from utils.CrmApiAsync import CrmApiAsync
-from utils.utils import load_qss_file, create_message_box, configure_line_edit, get_icon
+from utils.Export import ExportError, export_users, iter_users, parquet_available
+from utils.TaskSupervisor import TaskSupervisor
+from utils.utils import create_message_box, configure_line_edit, get_icon
 
 
 class ViewUserPage(QWidget):
@@ -26,28 +33,40 @@ class ViewUserPage(QWidget):
     Attributes:
         refresh_users (Signal): Signal pour rafraîchir la liste des utilisateurs.
         api (CrmApiAsync): Client API pour la communication avec le backend.
+        tasks (TaskSupervisor): Tâches asynchrones de la page, annulées à la fermeture du panel.
         user_table (QTreeView): Tableau affichant les utilisateurs.
-        model (QStandardItemModel): Modèle du tableau.
+        model (UserTableModel): Modèle paginé du tableau.
         info_label (QLabel): Label d'information pour les erreurs ou messages.
+        load_task (Optional[asyncio.Task]): Chargement de la liste en cours, au plus un à la fois.
+        action_timer (QTimer): Regroupe les mises à jour des boutons d'action des lignes visibles.
+        auto_refresh (Optional[AutoRefreshScheduler]): Actualisation automatique, si activée via `CRM_AUTO_REFRESH`.
     """
     refresh_users = Signal()
 
-    def __init__(self, api: CrmApiAsync):
+    def __init__(self, api: CrmApiAsync, tasks: Optional[TaskSupervisor] = None):
         """Initialise la page ViewUserPage.
 
         Args:
             api (CrmApiAsync): Client API.
+            tasks (Optional[TaskSupervisor]): Superviseur parent des tâches de la page.
         """
         super().__init__()
         self.api = api
+        self.tasks = TaskSupervisor("ViewUserPage", parent=tasks)
         self.user_table = None
         self.model = None
         self.info_label = None
-        self.refresh_users.connect(lambda: asyncio.create_task(self.load_users()))
+        self.load_task: Optional[asyncio.Task] = None
+        self.auto_refresh: Optional[AutoRefreshScheduler] = None
+        self.action_timer = QTimer(self, singleShot=True, interval=0)
+        self.action_timer.timeout.connect(self._update_action_widgets)
+        self._action_widgets: List[Tuple[QPersistentModelIndex, QWidget]] = []
+        self.refresh_users.connect(lambda: self.request_refresh(restart=True))
         self.init_ui()
 
     def init_ui(self):
         """Construit l'interface graphique de la page ViewUserPage."""
+        self.setObjectName("view_user_page")
         layout = QVBoxLayout()
 
         # En-tête avec titre et bouton actualiser
@@ -57,14 +76,20 @@ class ViewUserPage(QWidget):
         title.setStyleSheet("font-size: 24px; padding: 20;")
         title_layout.addWidget(title)
         title_layout.addStretch()
-        add_button_to_layout("", "", title_layout, self.load_users, get_icon("actualise.png"))
+        add_button_to_layout("Exporter", "btn_export", title_layout, self.export_users, self.tasks)
+        add_button_to_layout("", "", title_layout, self.refresh, self.tasks, get_icon("actualise.png"))
         layout.addWidget(title_container)
 
         # Tableau des utilisateurs
         self.user_table = QTreeView()
-        self.model = QStandardItemModel()
-        self.model.setHorizontalHeaderLabels(["ID", "Nom", "Prénom", "Email", "Téléphone", "Action"])
+        self.model = UserTableModel(self.api, tasks=self.tasks, columnar=columnar_enabled())
+        self.model.load_failed.connect(self._show_load_error)
         self.user_table.setModel(self.model)
+        # Boutons d'action créés pour les seules lignes visibles
+        for signal in (self.model.rowsInserted, self.model.rowsRemoved, self.model.modelReset,
+                       self.model.layoutChanged, self.user_table.verticalScrollBar().valueChanged,
+                       self.user_table.verticalScrollBar().rangeChanged):
+            signal.connect(lambda *args: self.action_timer.start())
         self._configure_user_table()
         layout.addWidget(self.user_table, 1)
 
@@ -73,21 +98,99 @@ class ViewUserPage(QWidget):
         self.info_label.setStyleSheet("font-size: 24px; padding: 20; color: red;")
         layout.addWidget(self.info_label, alignment=Qt.AlignmentFlag.AlignCenter)
 
-        asyncio.create_task(self.load_users())
+        self.request_refresh()
         self.setLayout(layout)
 
+        interval = auto_refresh_interval()
+        if interval:
+            self.auto_refresh = AutoRefreshScheduler(self, self.poll_for_changes, interval, tasks=self.tasks)
+
+    def request_refresh(self, restart: bool = False) -> asyncio.Task:
+        """Demande un rechargement de la liste en évitant les chargements concurrents.
+
+        Un seul chargement est en cours à la fois : une nouvelle demande rejoint le
+        chargement en cours, ou l'annule et le relance si `restart` vaut True (par
+        exemple après l'ajout d'un utilisateur). Les pages d'un chargement remplacé
+        sont ignorées par le modèle.
+
+        Args:
+            restart (bool): Si True, relance le chargement même si un chargement est en cours.
+
+        Returns:
+            asyncio.Task: Le chargement en cours.
+        """
+        if self.load_task is not None and not self.load_task.done():
+            if not restart:
+                return self.load_task
+            self.load_task.cancel()
+        self.load_task = self.tasks.spawn(self.load_users())
+        return self.load_task
+
+    async def refresh(self):
+        """Action du bouton actualiser : rejoint le chargement en cours ou en lance un."""
+        await asyncio.shield(self.request_refresh())
+
+    async def poll_for_changes(self) -> bool:
+        """Vérification de l'actualisation automatique : recharge la liste si elle a changé.
+
+        Returns:
+            bool: True si la liste a changé côté serveur.
+        """
+        if self.load_task is not None and not self.load_task.done():
+            return False
+        changed = await self.model.first_page_changed()
+        if changed:
+            self.request_refresh()
+        return changed
+
     async def load_users(self):
-        """Charge ou met à jour la liste des utilisateurs depuis l'API."""
-        requests_users_data = await self.api.get_all_users()
-        requests_code = await self.api.verify_request(requests_users_data)
+        """Charge ou met à jour la liste des utilisateurs depuis l'API.
 
-        self.model.removeRows(0, self.model.rowCount())
+        Seule la première page est téléchargée, les suivantes sont chargées par le
+        modèle au fil du défilement.
+        """
+        self.info_label.setText("")
+        await self.model.reload()
 
-        if requests_code == self.api.Ok:
+    async def export_users(self):
+        """Exporte tous les utilisateurs dans le fichier choisi (CSV, JSON Lines ou Parquet).
+
+        Les utilisateurs sont téléchargés page par page et écrits au fur et à mesure,
+        le nombre d'utilisateurs exportés est affiché pendant l'export.
+        """
+        filters = ["CSV (*.csv)", "CSV compressé (*.csv.gz)", "JSON Lines (*.jsonl)", "JSON Lines compressé (*.jsonl.gz)"]
+        if parquet_available():
+            filters.append("Parquet (*.parquet)")
+        path, _ = QFileDialog.getSaveFileName(self, "Exporter les utilisateurs", "utilisateurs.csv", ";;".join(filters))
+        if not path:
+            return
+
+        self.info_label.setText("")
+        try:
+            count = await export_users(
+                iter_users(self.api), path,
+                progress_callback=lambda exported: self.info_label.setText(f"{exported} utilisateurs exportés..."),
+            )
+        except ExportError as e:
             self.info_label.setText("")
-            for user in requests_users_data:
-                self._add_user_to_table(user)
-        elif requests_code == self.api.ErrorDNS:
+            self._show_load_error(await self.api.verify_request(e.response), e.response)
+            return
+        except (OSError, ValueError) as e:
+            print(e)
+            self.info_label.setText("")
+            create_message_box(self, "Erreur", "L'export a échoué !", False, True)
+            return
+        self.info_label.setText("")
+        create_message_box(self, "Succès", f"{count} utilisateurs exportés")
+
+    def _show_load_error(self, requests_code: int, requests_users_data):
+        """Affiche l'erreur rencontrée lors du chargement d'une page d'utilisateurs.
+
+        Args:
+            requests_code (int): Code renvoyé par `verify_request`.
+            requests_users_data: Réponse de l'API.
+        """
+        if requests_code == self.api.ErrorDNS:
             create_message_box(self, "Erreur de connexion", "Veuillez vérifiez votre connexion internet !", False)
             self.info_label.setText("Erreur de connexion\nVeuillez vérifiez votre connexion internet !")
         elif requests_code == self.api.AccessTokenError:
@@ -98,36 +201,53 @@ class ViewUserPage(QWidget):
         elif requests_code == self.api.ErrorNotFound:
             self.info_label.setText("Un problème est survenu, veuillez contacter l'administrateur !")
 
-    def _add_user_to_table(self, user: dict):
-        """Ajoute un utilisateur dans le tableau avec les boutons Modifier et Supprimer.
+    def _update_action_widgets(self):
+        """Place les boutons Modifier et Supprimer sur les lignes visibles et les retire des autres.
 
-        Args:
-            user (dict): Dictionnaire contenant les informations de l'utilisateur.
+        Seules les lignes affichées ont des boutons : le nombre de widgets ne dépend
+        pas de la taille de la liste. Les widgets remplacés entre-temps (ligne en
+        cours de modification) sont laissés en place.
         """
-        if user == "err":
-            self.info_label.setText("Une erreur est survenue, veuillez relancer l'application !")
-            return
+        rows = self.model.rowCount()
+        viewport = self.user_table.viewport()
+        first = self.user_table.indexAt(QPoint(0, 0)).row()
+        last = self.user_table.indexAt(QPoint(0, viewport.height() - 1)).row()
+        if last < 0:
+            last = rows - 1
+        visible = range(first, last + 1) if first >= 0 else range(0)
+
+        attached = []
+        for index, widget in self._action_widgets:
+            if not index.isValid() or self.user_table.indexWidget(index) is not widget:
+                continue
+            if index.row() in visible:
+                attached.append((index, widget))
+            else:
+                self.user_table.setIndexWidget(index, None)
+        self._action_widgets = attached
 
-        users = [
-            QStandardItem(str(user["id"])),
-            QStandardItem(user["name"]),
-            QStandardItem(user["first_name"]),
-            QStandardItem(user["email"]),
-            QStandardItem(user["telephone"]),
-        ]
-        self.model.appendRow(users)
-
-        # Ajout des boutons dans la colonne Action
-        index = self.model.index(self.model.rowCount() - 1, 5)
+        for row in visible:
+            if self.user_table.indexWidget(self.model.index(row, UserTableModel.ACTION_COLUMN)) is None:
+                self._set_action_widget(row)
+
+    def _set_action_widget(self, row: int):
+        """Place les boutons Modifier et Supprimer dans la colonne Action d'une ligne.
+
+        Args:
+            row (int): Index de la ligne.
+        """
+        user_id = self.model.user_id(row)
+        index = self.model.index(row, UserTableModel.ACTION_COLUMN)
         action_widget = QWidget()
         layout = QHBoxLayout(action_widget)
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(5)
 
-        add_button_to_layout("✏️ Modifier", "btn_edit", layout, self.update_user, user_id=user["id"])
-        add_button_to_layout("🗑 Supprimer", "btn_delete", layout, self.delete_user, user_id=user["id"])
+        add_button_to_layout("✏️ Modifier", "btn_edit", layout, self.update_user, self.tasks, user_id=user_id)
+        add_button_to_layout("🗑 Supprimer", "btn_delete", layout, self.delete_user, self.tasks, user_id=user_id)
 
         self.user_table.setIndexWidget(index, action_widget)
+        self._action_widgets.append((QPersistentModelIndex(index), action_widget))
 
     async def delete_user(self, user_id: int):
         """Supprime un utilisateur après confirmation.
@@ -139,13 +259,21 @@ class ViewUserPage(QWidget):
                                      f"Voulez-vous vraiment supprimer l’utilisateur {user_id} ?",
                                      True)
         if confirm:
+            # Suppression optimiste : la ligne disparaît avant la réponse du serveur
+            row = self.model.row_of(user_id)
+            removed = self.model.take_row(row) if row is not None else None
+
             result = await self.api.delete_user(user_id)
             result_code = await self.api.verify_request(result)
 
             if result_code == self.api.Ok:
-                await self.load_users()
                 create_message_box(self, "Succès", f"Utilisateur {user_id} supprimé")
-            elif result_code == self.api.ErrorDNS:
+                return
+
+            # Échec : la ligne est remise à sa place, sauf si la liste a été rechargée entre-temps
+            if removed is not None:
+                self.model.insert_row(*removed)
+            if result_code == self.api.ErrorDNS:
                 create_message_box(self, "Erreur de connexion", "Veuillez vérifiez votre connexion internet !", False)
             elif result_code == self.api.AccessTokenError:
                 create_message_box(self, "Erreur", "Votre connexion a expiré ! Veuillez vous reconnecter !", False, True)
@@ -159,15 +287,16 @@ class ViewUserPage(QWidget):
             user_id (int): ID de l'utilisateur à modifier.
         """
         # Recherche de la ligne correspondant à l'utilisateur
-        row = next((r for r in range(self.model.rowCount()) if self.model.item(r, 0).text() == str(user_id)), None)
-        if row is None:
+        row = self.model.row_of(user_id)
+        if row is None or self.model.record(row) is None:
             return
 
         # Récupération des données existantes
-        name = self.model.item(row, 1).text()
-        first_name = self.model.item(row, 2).text()
-        email = self.model.item(row, 3).text()
-        telephone = self.model.item(row, 4).text()
+        record = self.model.record(row)
+        name = record["name"]
+        first_name = record["first_name"]
+        email = record["email"]
+        telephone = record["telephone"]
 
         # Champs éditables
         name_edit = QLineEdit(name)
@@ -181,30 +310,55 @@ class ViewUserPage(QWidget):
             self.user_table.setIndexWidget(self.model.index(row, col), edit)
 
         # Bouton "Enregistrer"
-        index_action = self.model.index(row, 5)
+        index_action = self.model.index(row, UserTableModel.ACTION_COLUMN)
         save_widget = QWidget()
         layout = QHBoxLayout(save_widget)
         layout.setContentsMargins(0, 0, 0, 0)
 
         async def save_changes():
-            """Envoie les nouvelles données à l'API pour mise à jour."""
+            """Applique les nouvelles données dans le tableau puis les envoie à l'API.
+
+            La ligne est corrigée avec la réponse du serveur en cas de succès et
+            restaurée dans son état précédent en cas d'échec.
+            """
             new_data = {
                 "name": name_edit.text(),
                 "first_name": first_name_edit.text(),
                 "email": email_edit.text(),
                 "telephone": telephone_edit.text(),
             }
+            current_row = self.model.row_of(user_id)
+            if current_row is None:
+                return
+            previous = self.model.update_record(current_row, new_data)
+            self._close_row_editors(current_row)
+
             result = await self.api.update_user(user_id, new_data)
             result_code = await self.api.verify_request(result)
+
+            current_row = self.model.row_of(user_id)
+            if current_row is None:
+                return
             if result_code == self.api.Ok:
-                await self.load_users()
+                if isinstance(result, dict) and result.get("id") == user_id:
+                    self.model.update_record(current_row, result)
             else:
-                await self.load_users()  # Rechargement pour éviter les données corrompues
+                self.model.restore_record(current_row, previous)
                 create_message_box(self, "Erreur", "Une erreur est survenue lors de la modification !", False)
 
-        add_button_to_layout("💾 Enregistrer", "btn_save", layout, save_changes)
+        add_button_to_layout("💾 Enregistrer", "btn_save", layout, save_changes, self.tasks)
         self.user_table.setIndexWidget(index_action, save_widget)
 
+    def _close_row_editors(self, row: int):
+        """Retire les champs d'édition d'une ligne et remet ses boutons d'action.
+
+        Args:
+            row (int): Index de la ligne.
+        """
+        for col in range(1, UserTableModel.ACTION_COLUMN):
+            self.user_table.setIndexWidget(self.model.index(row, col), None)
+        self._set_action_widget(row)
+
     def _configure_user_table(self):
         """Configure l'affichage et le comportement du tableau des utilisateurs."""
         self.user_table.setColumnWidth(3, 225)
@@ -218,17 +372,18 @@ class ViewUserPage(QWidget):
         self.user_table.setUniformRowHeights(True)
         self.user_table.setIndentation(0)
         self.user_table.setAllColumnsShowFocus(False)
+        self.user_table.header().setSortIndicator(0, Qt.SortOrder.AscendingOrder)
         self.user_table.setSortingEnabled(True)
         self.user_table.setFocusPolicy(Qt.FocusPolicy.NoFocus)
         self.user_table.setAlternatingRowColors(True)
         self.user_table.setRootIsDecorated(False)
-        self.user_table.setStyleSheet(load_qss_file("user_table.qss"))
 
 
 # ------------------------------------------------
 # Fonction utilitaire
 # ------------------------------------------------
-def add_button_to_layout(name: str, object_name: str, layout: QHBoxLayout, action, icon: QIcon = None, user_id: int = 0):
+def add_button_to_layout(name: str, object_name: str, layout: QHBoxLayout, action, tasks: TaskSupervisor,
+                         icon: QIcon = None, user_id: int = 0):
     """Ajoute un bouton dans un layout horizontal.
 
     Args:
@@ -236,6 +391,7 @@ def add_button_to_layout(name: str, object_name: str, layout: QHBoxLayout, actio
         object_name (str): Nom pour le style du bouton.
         layout (QHBoxLayout): Layout où ajouter le bouton.
         action: Fonction appelée au clic (async).
+        tasks (TaskSupervisor): Superviseur des tâches lancées au clic.
         icon (QIcon, optional): Icône du bouton.
         user_id (int, optional): ID utilisateur lié à l'action.
     """
@@ -246,7 +402,7 @@ def add_button_to_layout(name: str, object_name: str, layout: QHBoxLayout, actio
         btn.setIcon(icon)
         btn.setIconSize(QSize(50, 50))
     if user_id == 0:
-        btn.clicked.connect(lambda: asyncio.create_task(action()))
+        btn.clicked.connect(lambda: tasks.spawn(action()))
     else:
-        btn.clicked.connect(lambda _, uid=user_id: asyncio.create_task(action(uid)))
+        btn.clicked.connect(lambda _, uid=user_id: tasks.spawn(action(uid)))
     layout.addWidget(btn)
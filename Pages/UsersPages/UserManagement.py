@@ -8,12 +8,14 @@ Dependencies:
     PySide6: Pour la création de l'interface graphique.
 """
 
+from typing import Optional
+
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QTabWidget
 
-from Pages.UsersPages.SubPages.AddUserPage import AddUserPage
 from Pages.UsersPages.SubPages.ViewUsersPage import ViewUserPage
 from utils.CrmApiAsync import CrmApiAsync
-from utils.utils import load_qss_file
+from utils.TaskSupervisor import TaskSupervisor
+from utils.utils import LazyPage, prewarm_lazy_pages
 
 
 class UserManagement(QWidget):
@@ -23,24 +25,39 @@ class UserManagement(QWidget):
 
     Attributes:
         api (CrmApiAsync): Client API pour la communication avec le backend.
+        tasks (TaskSupervisor): Superviseur des tâches des onglets.
         view_user_page (ViewUserPage): Page affichant la liste des utilisateurs.
         onglets (QTabWidget): Onglets de navigation entre ajout et affichage des utilisateurs.
+        add_user_tab (LazyPage): Onglet d'ajout, construit à sa première ouverture.
     """
 
-    def __init__(self, api: CrmApiAsync):
+    def __init__(self, api: CrmApiAsync, prewarm: bool = True, tasks: Optional[TaskSupervisor] = None):
         """Initialise la page de gestion des utilisateurs.
 
         Args:
             api (CrmApiAsync): Client API.
+            prewarm (bool): Si True, construit l'onglet d'ajout en arrière-plan après l'affichage.
+            tasks (Optional[TaskSupervisor]): Superviseur parent, celui de la fenêtre.
         """
         super().__init__()
         self.api = api
-        self.view_user_page = ViewUserPage(self.api)
+        self.tasks = TaskSupervisor("UserManagement", parent=tasks)
+        self.view_user_page = ViewUserPage(self.api, self.tasks)
         self.onglets = None
+        self.add_user_tab = LazyPage(self._build_add_user_page)
         self.init_ui()
+        if prewarm:
+            prewarm_lazy_pages([self.add_user_tab], self)
+
+    def _build_add_user_page(self) -> QWidget:
+        """Importe et construit l'onglet d'ajout d'utilisateur."""
+        from Pages.UsersPages.SubPages.AddUserPage import AddUserPage
+
+        return AddUserPage(self.api, self.view_user_page, self.tasks)
 
     def init_ui(self):
         """Construit l'interface graphique de la page UserManagement."""
+        self.setObjectName("user_management")
         container = QWidget()
         layout = QVBoxLayout()
         layout_container = QVBoxLayout(container)
@@ -52,15 +69,17 @@ class UserManagement(QWidget):
 
         # Onglets
         self.onglets = QTabWidget()
-        self.onglets.setStyleSheet(load_qss_file("tab_bar.qss"))
         self.onglets.addTab(self.view_user_page, "Liste des utilisateurs")
-        self.onglets.addTab(AddUserPage(self.api, self.view_user_page), "Ajouter un utilisateur")
+        self.onglets.addTab(self.add_user_tab, "Ajouter un utilisateur")
+        self.onglets.currentChanged.connect(
+            lambda index: self.add_user_tab.ensure_built() if self.onglets.widget(index) is self.add_user_tab else None
+        )
 
         layout_tab_widget.addWidget(self.onglets)
         layout_tab_widget.addWidget(container_tab_widget)  # Correction : inutile, mais conservé si besoin de future extension
         layout_container.addWidget(container_tab_widget)
 
-        container.setStyleSheet("background: #0B1739;")
+        container.setObjectName("user_management_container")
         layout.addWidget(container)
 
         layout.setContentsMargins(0, 0, 0, 0)
@@ -0,0 +1,81 @@
+"""
+bench_columnar_store.py
+=======================
+
+Compare la liste de dictionnaires (chemin actuel du tableau) et le stockage en
+colonnes `ColumnarUserStore` sur une grande base : mémoire occupée, construction,
+tri, filtre et comptage par valeur.
+
+NumPy doit être installé.
+
+Usage:
+    python -m benchmarks.bench_columnar_store [nombre_d_utilisateurs]
+"""
+
+# Imports standards
+import json
+import sys
+import time
+import tracemalloc
+from collections import Counter
+
+# Imports internes
+from benchmarks.bench_sort_keys import make_users
+from utils.ColumnarUserStore import ColumnarUserStore, columnar_available
+from utils.normalize import fold_text, user_sort_keys
+
+
+def measure(label: str, func):
+    """Exécute une fonction et affiche sa durée et la mémoire allouée restante.
+
+    Args:
+        label (str): Libellé affiché.
+        func: Fonction sans argument à mesurer.
+
+    Returns:
+        Any: Résultat de la fonction.
+    """
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<45} {elapsed * 1000:9.1f} ms  {current / 1e6:8.1f} Mo")
+    return result
+
+
+def main() -> None:
+    """Lance les mesures sur les deux représentations et vérifie qu'elles concordent."""
+    if not columnar_available():
+        print("NumPy n'est pas installé : le stockage en colonnes n'est pas disponible")
+        sys.exit(1)
+
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 300_000
+    body = json.dumps(make_users(count))
+    print(f"{count} utilisateurs")
+
+    # Chemin actuel : liste de dictionnaires et clés de tri par ligne
+    users = measure("Dictionnaires : décodage", lambda: json.loads(body))
+    keys = measure("Dictionnaires : clés de tri", lambda: [user_sort_keys(user) for user in users])
+    dict_order = measure("Dictionnaires : tri Prénom",
+                         lambda: sorted(range(count), key=lambda i: keys[i][2]))
+    measure("Dictionnaires : filtre Prénom contient 'loi'",
+            lambda: [i for i, user in enumerate(users) if "loi" in fold_text(user["first_name"])])
+    dict_counts = measure("Dictionnaires : comptage par Prénom",
+                          lambda: Counter(user["first_name"] for user in users))
+
+    # Stockage en colonnes
+    store = measure("Colonnes : construction", lambda: ColumnarUserStore.from_records(json.loads(body)))
+    store_order = measure("Colonnes : tri Prénom", lambda: store.argsort("first_name"))
+    measure("Colonnes : filtre Prénom contient 'loi'", lambda: store.contains("first_name", "loi").nonzero()[0])
+    store_counts = measure("Colonnes : comptage par Prénom", lambda: store.group_counts("first_name"))
+    print(f"Tableaux du stockage en colonnes : {store.nbytes / 1e6:.1f} Mo")
+
+    assert store_counts == dict(dict_counts), "Les comptages doivent être identiques"
+    assert [keys[i][2] for i in dict_order] == [keys[i][2] for i in store_order.tolist()], \
+        "Les deux tris doivent donner le même ordre de prénoms"
+
+
+if __name__ == "__main__":
+    main()
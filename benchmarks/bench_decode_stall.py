@@ -0,0 +1,91 @@
+"""
+bench_decode_stall.py
+=====================
+
+Mesure le blocage de la boucle événementielle (donc du thread de l'interface avec
+qasync) pendant le décodage d'une grande réponse `crm/users/` et le calcul des
+clés de tri : traitement sur la boucle (ancien comportement) puis dans un
+exécuteur via `utils.offload`.
+
+Une tâche de contrôle se réveille toutes les millisecondes, le plus long écart
+entre deux réveils est le blocage ressenti par l'interface.
+
+Usage:
+    python -m benchmarks.bench_decode_stall [nombre_d_utilisateurs]
+"""
+
+# Imports standards
+import asyncio
+import json
+import sys
+import time
+
+# Imports internes
+from benchmarks.bench_sort_keys import make_users
+from utils.offload import build_sort_keys, decode_body, run_cpu
+
+
+def process(body: bytes) -> list:
+    """Décode la réponse puis calcule les clés de tri, comme à la réception d'une page.
+
+    Args:
+        body (bytes): Corps de la réponse.
+
+    Returns:
+        list: Clés de tri des utilisateurs.
+    """
+    return build_sort_keys(decode_body(body))
+
+
+async def heartbeat(stop: asyncio.Event, gaps: list) -> None:
+    """Enregistre les écarts entre deux réveils de la boucle.
+
+    Args:
+        stop (asyncio.Event): Arrête la mesure.
+        gaps (list): Écarts mesurés, en secondes.
+    """
+    last = time.perf_counter()
+    while not stop.is_set():
+        await asyncio.sleep(0.001)
+        now = time.perf_counter()
+        gaps.append(now - last)
+        last = now
+
+
+async def measure(label: str, body: bytes, offload: bool) -> None:
+    """Traite la réponse et affiche la durée totale et le plus long blocage de la boucle.
+
+    Args:
+        label (str): Libellé affiché.
+        body (bytes): Corps de la réponse.
+        offload (bool): Si True, le traitement est fait dans un exécuteur.
+    """
+    stop = asyncio.Event()
+    gaps: list = []
+    monitor = asyncio.create_task(heartbeat(stop, gaps))
+    await asyncio.sleep(0.05)
+
+    start = time.perf_counter()
+    if offload:
+        await run_cpu(process, body)
+    else:
+        process(body)
+    total = time.perf_counter() - start
+
+    stop.set()
+    await monitor
+    print(f"{label:<30} total {total * 1000:8.1f} ms   blocage max {max(gaps) * 1000:8.1f} ms")
+
+
+def main() -> None:
+    """Lance les deux mesures sur la même réponse."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    body = json.dumps(make_users(count)).encode()
+    print(f"{count} utilisateurs, réponse de {len(body) / 1e6:.1f} Mo")
+
+    asyncio.run(measure("Sur la boucle (ancien)", body, offload=False))
+    asyncio.run(measure("Dans un exécuteur", body, offload=True))
+
+
+if __name__ == "__main__":
+    main()
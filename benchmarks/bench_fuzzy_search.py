@@ -0,0 +1,52 @@
+"""
+bench_fuzzy_search.py
+=====================
+
+Mesure la construction incrémentale de l'index de recherche approchée
+`FuzzyIndex` et le temps d'une recherche avec fautes de frappe sur une grande
+liste d'utilisateurs.
+
+Usage:
+    python -m benchmarks.bench_fuzzy_search [nombre_d_utilisateurs]
+"""
+
+# Imports standards
+import random
+import sys
+import time
+
+# Imports internes
+from benchmarks.bench_sort_keys import make_users
+from utils.FuzzyIndex import FuzzyIndex
+
+QUERIES = ["eloise", "Éloïse", "helo", "huseyin", "zoe", "andre", "chloe omer"]
+
+
+def main() -> None:
+    """Construit l'index utilisateur par utilisateur puis mesure des recherches."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    users = make_users(count)
+    print(f"{count} utilisateurs")
+
+    index = FuzzyIndex()
+    start = time.perf_counter()
+    for user in users:
+        index.add(user)
+    print(f"{'Construction incrémentale':<35} {(time.perf_counter() - start) * 1000:9.1f} ms")
+
+    # Recherches avec le début d'un nom réel mal orthographié
+    rng = random.Random(1)
+    queries = QUERIES + [user["name"][:6] + "x" for user in rng.sample(users, 10)]
+    timings = []
+    for query in queries:
+        start = time.perf_counter()
+        results = index.search(query)
+        timings.append(time.perf_counter() - start)
+        assert results, f"Aucun résultat pour {query!r}"
+    timings.sort()
+    print(f"{'Recherche (médiane)':<35} {timings[len(timings) // 2] * 1000:9.2f} ms")
+    print(f"{'Recherche (max)':<35} {timings[-1] * 1000:9.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+bench_import_time.py
+====================
+
+Vérifie le budget de temps d'import du client API.
+
+Le module `utils.CrmApiAsync` est importé dans un nouvel interpréteur, après ses
+dépendances tierces (aiohttp, dotmap) importées et mesurées à part : le budget
+porte sur le temps propre au projet, qui ne varie pas avec la version d'aiohttp
+ni avec la machine. La mesure est répétée et le minimum est retenu pour ne pas
+dépendre de la charge du moment.
+
+Le script échoue (code de sortie 1) si le budget est dépassé ou si l'import
+charge Qt ou une dépendance optionnelle lourde (NumPy, pyarrow).
+
+Usage:
+    python -m benchmarks.bench_import_time [budget_en_ms]
+"""
+
+# Imports standards
+import json
+import subprocess
+import sys
+
+DEFAULT_BUDGET_MS = 50
+RUNS = 5
+DEPENDENCIES = ["aiohttp", "dotmap"]
+MODULES = ["utils.CrmApiAsync", "utils.SettingsStore", "utils.json_files"]
+FORBIDDEN = ("PySide6", "shiboken6", "numpy", "pyarrow")
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+for name in {dependencies!r}:
+    __import__(name)
+middle = time.perf_counter()
+for name in {modules!r}:
+    __import__(name)
+end = time.perf_counter()
+forbidden = sorted(m for m in sys.modules if m.split(".")[0] in {forbidden!r})
+print(json.dumps({{"dependencies": (middle - start) * 1000, "own": (end - middle) * 1000,
+                   "forbidden": forbidden}}))
+"""
+
+
+def measure() -> dict:
+    """Importe les dépendances puis les modules du projet dans un interpréteur neuf.
+
+    Returns:
+        dict: Durées en millisecondes (`dependencies`, `own`) et modules interdits chargés.
+    """
+    output = subprocess.run(
+        [sys.executable, "-c", PROBE.format(dependencies=DEPENDENCIES, modules=MODULES, forbidden=FORBIDDEN)],
+        capture_output=True, text=True, check=True,
+    ).stdout
+    return json.loads(output)
+
+
+def main() -> int:
+    """Mesure l'import plusieurs fois et compare le meilleur temps propre au budget.
+
+    Returns:
+        int: 0 si le budget est respecté, 1 sinon.
+    """
+    budget = float(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_BUDGET_MS
+    results = [measure() for _ in range(RUNS)]
+    own = min(result["own"] for result in results)
+    dependencies = min(result["dependencies"] for result in results)
+
+    print(f"Import de {', '.join(DEPENDENCIES)} : {dependencies:.1f} ms (hors budget)")
+    print(f"Import de {', '.join(MODULES)} : {own:.1f} ms (budget {budget:.0f} ms, meilleur de {RUNS})")
+    forbidden = results[0]["forbidden"]
+    if forbidden:
+        print(f"ÉCHEC : modules chargés à l'import ({', '.join(forbidden[:3])}...)")
+        return 1
+    if own > budget:
+        print("ÉCHEC : budget dépassé")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
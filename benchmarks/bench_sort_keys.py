@@ -0,0 +1,83 @@
+"""
+bench_sort_keys.py
+==================
+
+Mesure le tri du tableau des utilisateurs sur 100 000 lignes : comparaison du
+texte brut (ancien comportement de `QStandardItemModel`) et tri sur les clés
+typées précalculées par `user_sort_keys`.
+
+Usage:
+    python -m benchmarks.bench_sort_keys [nombre_de_lignes]
+"""
+
+# Imports standards
+import random
+import string
+import sys
+import time
+
+# Imports internes
+from utils.normalize import user_sort_keys
+
+FIRST_NAMES = ["Éloïse", "eloise", "Zoé", "André", "Hüseyin", "Chloé", "Ömer", "Léa", "Noah", "Çağla"]
+
+
+def make_users(count: int) -> list:
+    """Génère une liste d'utilisateurs factices.
+
+    Args:
+        count (int): Nombre d'utilisateurs.
+
+    Returns:
+        list: Utilisateurs au format renvoyé par l'API.
+    """
+    rng = random.Random(42)
+    return [
+        {
+            "id": i,
+            "name": "".join(rng.choices(string.ascii_letters, k=8)),
+            "first_name": rng.choice(FIRST_NAMES),
+            "email": f"user{i}@example.com",
+            "telephone": "06" + "".join(rng.choices(string.digits, k=8)),
+        }
+        for i in rng.sample(range(1, count * 10), count)
+    ]
+
+
+def timed(label: str, func):
+    """Exécute une fonction et affiche sa durée.
+
+    Args:
+        label (str): Libellé affiché.
+        func: Fonction sans argument à mesurer.
+
+    Returns:
+        Any: Résultat de la fonction.
+    """
+    start = time.perf_counter()
+    result = func()
+    print(f"{label:<45} {(time.perf_counter() - start) * 1000:9.1f} ms")
+    return result
+
+
+def main() -> None:
+    """Lance la mesure et vérifie l'ordre numérique de la colonne ID."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    users = make_users(count)
+    rows = range(count)
+    print(f"{count} utilisateurs")
+
+    timed("Tri ID sur le texte (ancien)", lambda: sorted(rows, key=lambda i: str(users[i]["id"])))
+    timed("Tri Prénom sur le texte (ancien)", lambda: sorted(rows, key=lambda i: users[i]["first_name"]))
+
+    keys = timed("Calcul des clés typées (une fois)", lambda: [user_sort_keys(user) for user in users])
+    order = timed("Tri ID sur les clés en cache", lambda: sorted(rows, key=lambda i: keys[i][0]))
+    timed("Tri Prénom sur les clés en cache", lambda: sorted(rows, key=lambda i: keys[i][2]))
+    timed("Tri Téléphone sur les clés en cache", lambda: sorted(rows, key=lambda i: keys[i][4]))
+
+    ids = [users[i]["id"] for i in order]
+    assert ids == sorted(ids), "La colonne ID doit être triée numériquement"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+"""
+bench_user_loading.py
+=====================
+
+Compare les trois façons de charger la liste des utilisateurs face au faux
+serveur local (`utils.FakeCrmServer`), avec une latence réglable : réponse
+complète (`get_all_users`), pages successives avec préchargement
+(`Export.iter_users`) et tableau décodé au fil de la réception
+(`stream_all_users`).
+
+Le serveur tourne dans un autre processus : le pic de mémoire Python mesuré
+(tracemalloc) est celui du client seul. Pour chaque mode sont affichés la durée
+et ce pic.
+
+Usage:
+    python -m benchmarks.bench_user_loading [nombre_d_utilisateurs] [latence_ms]
+"""
+
+# Imports standards
+import asyncio
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Iterator
+
+# Imports internes
+from utils.CrmApiAsync import CrmApiAsync
+from utils.Export import iter_users
+
+
+@contextmanager
+def server_process(count: int, latency: float) -> Iterator[str]:
+    """Lance le faux serveur dans un autre processus et attend qu'il réponde.
+
+    Args:
+        count (int): Nombre d'utilisateurs du serveur.
+        latency (float): Latence ajoutée à chaque réponse, en secondes.
+
+    Yields:
+        str: URL de base du serveur.
+    """
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+    process = subprocess.Popen(
+        [sys.executable, "-m", "utils.FakeCrmServer", "--port", str(port), "--users", str(count),
+         "--latency", str(latency)],
+        stdout=subprocess.DEVNULL,
+    )
+    try:
+        deadline = time.monotonic() + 60
+        while True:
+            try:
+                socket.create_connection(("127.0.0.1", port), timeout=1).close()
+                break
+            except OSError:
+                if process.poll() is not None or time.monotonic() > deadline:
+                    raise RuntimeError("Le faux serveur n'a pas démarré")
+                time.sleep(0.1)
+        yield f"http://127.0.0.1:{port}"
+    finally:
+        process.terminate()
+        process.wait()
+
+
+async def load_all(api: CrmApiAsync) -> int:
+    """Charge la liste en une réponse complète.
+
+    Args:
+        api (CrmApiAsync): Client connecté.
+
+    Returns:
+        int: Nombre d'utilisateurs reçus.
+    """
+    return len(await api.get_all_users())
+
+
+async def load_pages(api: CrmApiAsync) -> int:
+    """Parcourt la liste page par page.
+
+    Args:
+        api (CrmApiAsync): Client connecté.
+
+    Returns:
+        int: Nombre d'utilisateurs reçus.
+    """
+    count = 0
+    async for _ in iter_users(api):
+        count += 1
+    return count
+
+
+async def load_stream(api: CrmApiAsync) -> int:
+    """Décode la liste au fil de la réception.
+
+    Args:
+        api (CrmApiAsync): Client connecté.
+
+    Returns:
+        int: Nombre d'utilisateurs reçus.
+    """
+    count = 0
+    async for _ in api.stream_all_users():
+        count += 1
+    return count
+
+
+async def run(base_url: str) -> None:
+    """Mesure chaque mode de chargement face au serveur.
+
+    Args:
+        base_url (str): URL du faux serveur.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        api = CrmApiAsync(base_url, os.path.join(directory, "auth.json"))
+        api.user_indexes = []
+        # Identifiants par défaut du faux serveur
+        await api.login("admin@example.com", "admin")
+        try:
+            for label, load in (("Réponse complète", load_all), ("Pages (préchargement)", load_pages),
+                                ("Flux décodé", load_stream)):
+                tracemalloc.start()
+                start = time.perf_counter()
+                received = await load(api)
+                total = time.perf_counter() - start
+                peak = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+                print(f"{label:<24} {received:>8} utilisateurs   {total * 1000:8.1f} ms   pic {peak / 1e6:7.1f} Mo")
+        finally:
+            api.discard_prefetched()
+            await api.close()
+
+
+def main() -> None:
+    """Lit les paramètres et lance les mesures."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    latency = float(sys.argv[2]) / 1000 if len(sys.argv) > 2 else 0.02
+    print(f"{count} utilisateurs, latence {latency * 1000:.0f} ms")
+    with server_process(count, latency) as base_url:
+        asyncio.run(run(base_url))
+
+
+if __name__ == "__main__":
+    main()
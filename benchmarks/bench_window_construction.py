@@ -0,0 +1,96 @@
+"""
+bench_window_construction.py
+============================
+
+Mesure le temps de construction et de premier affichage de la fenêtre de connexion
+avec la feuille de style de l'application.
+
+Le script fonctionne sans écran (plateforme Qt `offscreen`). Avec une révision git
+en second argument, la même mesure est faite sur cette version du code (extraite
+dans un `git worktree` temporaire) pour comparer avant et après un changement de
+style ; une version sans `utils.styles` est mesurée sans feuille de style globale.
+
+Usage:
+    python -m benchmarks.bench_window_construction [nombre_de_fenêtres] [révision_git]
+"""
+
+# Imports standards
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+
+def measure(count: int) -> None:
+    """Construit et affiche plusieurs fenêtres de connexion et affiche le temps moyen.
+
+    Args:
+        count (int): Nombre de fenêtres construites.
+    """
+    # Imports à la demande : le module doit pouvoir mesurer une autre version du code
+    from PySide6.QtWidgets import QApplication
+    from Pages.LoginPage import LoginWindow
+    from utils.CrmApiAsync import CrmApiAsync
+
+    app = QApplication([])
+    try:
+        from utils.styles import apply_application_stylesheet
+    except ImportError:
+        print("Feuille de style de l'application : absente de cette version")
+    else:
+        start = time.perf_counter()
+        apply_application_stylesheet(app)
+        print(f"Feuille de style de l'application : {(time.perf_counter() - start) * 1000:.2f} ms")
+
+    try:
+        api = CrmApiAsync("http://localhost", "auth.json", prewarm=False)
+    except TypeError:
+        # Version antérieure à la préparation de la connexion
+        api = CrmApiAsync("http://localhost", "auth.json")
+    start = time.perf_counter()
+    for _ in range(count):
+        window = LoginWindow(api)
+        window.show()
+        app.processEvents()
+        window.close()
+        window.deleteLater()
+    elapsed = (time.perf_counter() - start) * 1000 / count
+    print(f"LoginWindow (construction + affichage) : {elapsed:.2f} ms par fenêtre")
+
+
+def measure_revision(count: int, revision: str) -> None:
+    """Lance la mesure sur une autre version du code, extraite dans un dossier temporaire.
+
+    Args:
+        count (int): Nombre de fenêtres construites.
+        revision (str): Révision git à mesurer.
+    """
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    with tempfile.TemporaryDirectory(prefix="bench-") as directory:
+        tree = os.path.join(directory, "tree")
+        subprocess.run(["git", "-C", root, "worktree", "add", "--detach", tree, revision],
+                       check=True, capture_output=True)
+        try:
+            subprocess.run([sys.executable, os.path.abspath(__file__), str(count)], cwd=tree,
+                           env={**os.environ, "PYTHONPATH": tree}, check=True)
+        finally:
+            subprocess.run(["git", "-C", root, "worktree", "remove", "--force", tree], capture_output=True)
+
+
+def main() -> None:
+    """Lit les paramètres et lance les mesures."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    if len(sys.argv) > 2:
+        print(f"Révision {sys.argv[2]} :")
+        sys.stdout.flush()
+        measure_revision(count, sys.argv[2])
+        print("Version courante :")
+        sys.stdout.flush()
+    measure(count)
+
+
+if __name__ == "__main__":
+    main()
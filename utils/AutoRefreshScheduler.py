@@ -0,0 +1,166 @@
+"""
+AutoRefreshScheduler.py
+=======================
+
+Ce module contient la classe `AutoRefreshScheduler` qui rafraîchit périodiquement
+une page tant qu'elle est réellement affichée.
+
+L'actualisation automatique est optionnelle : elle n'est activée que si la variable
+d'environnement `CRM_AUTO_REFRESH` contient un intervalle en secondes.
+
+Dependencies:
+    PySide6: Pour le minuteur et le filtrage des événements de visibilité.
+    asyncio: Pour exécuter la vérification asynchrone.
+"""
+
+# Imports standards
+import asyncio
+import os
+import time
+from typing import Awaitable, Callable, Optional
+
+# Imports tiers
+from PySide6.QtCore import QObject, QTimer, QEvent
+from PySide6.QtWidgets import QWidget
+
+# Imports internes
+from utils.TaskSupervisor import TaskSupervisor
+
+
+def auto_refresh_interval() -> Optional[float]:
+    """Lit l'intervalle d'actualisation automatique configuré.
+
+    Returns:
+        Optional[float]: Intervalle en secondes, None si l'actualisation automatique est désactivée.
+    """
+    value = os.environ.get("CRM_AUTO_REFRESH", "")
+    try:
+        interval = float(value)
+    except ValueError:
+        return None
+    return interval if interval > 0 else None
+
+
+class AutoRefreshScheduler(QObject):
+    """Planificateur d'actualisation automatique tenant compte de la visibilité.
+
+    Hérite de QObject.
+
+    La fonction de vérification renvoie True si les données ont changé. Tant que rien
+    ne change, l'intervalle est multiplié par `backoff` jusqu'à `max_interval`. Les
+    vérifications sont suspendues lorsque la page est cachée (autre onglet ou autre page
+    du panel) ou que la fenêtre est réduite, et une vérification immédiate est faite
+    lorsqu'elle redevient visible.
+
+    Attributes:
+        widget (QWidget): Page surveillée.
+        poll (Callable[[], Awaitable[bool]]): Vérification asynchrone des changements.
+        interval (float): Intervalle de base en secondes.
+        max_interval (float): Intervalle maximal en secondes après ralentissement.
+        backoff (float): Facteur de ralentissement quand rien ne change.
+        min_gap (float): Délai minimal en secondes entre deux vérifications à la reprise.
+        current_interval (float): Intervalle en cours en secondes.
+        timer (QTimer): Minuteur de la prochaine vérification.
+        tasks (Optional[TaskSupervisor]): Superviseur de la page, qui annule la vérification en cours
+            à sa fermeture.
+    """
+
+    def __init__(
+        self,
+        widget: QWidget,
+        poll: Callable[[], Awaitable[bool]],
+        interval: float,
+        max_interval: Optional[float] = None,
+        backoff: float = 2.0,
+        min_gap: float = 2.0,
+        tasks: Optional[TaskSupervisor] = None,
+    ) -> None:
+        """Initialise le planificateur et surveille la visibilité de la page.
+
+        Args:
+            widget (QWidget): Page à rafraîchir.
+            poll (Callable[[], Awaitable[bool]]): Vérification asynchrone, renvoie True si les données ont changé.
+            interval (float): Intervalle de base en secondes.
+            max_interval (Optional[float]): Intervalle maximal en secondes. Par défaut 10 fois l'intervalle de base.
+            backoff (float): Facteur de ralentissement quand rien ne change.
+            min_gap (float): Délai minimal en secondes entre deux vérifications à la reprise.
+            tasks (Optional[TaskSupervisor]): Superviseur des vérifications, celui de la page.
+        """
+        super().__init__(widget)
+        self.widget = widget
+        self.poll = poll
+        self.interval = interval
+        self.max_interval = max_interval or interval * 10
+        self.backoff = backoff
+        self.min_gap = min_gap
+        self.tasks = tasks
+        self.current_interval = interval
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self._start_poll)
+        self._window: Optional[QWidget] = None
+        self._task: Optional[asyncio.Task] = None
+        self._last_poll = time.monotonic()
+        widget.installEventFilter(self)
+
+    def is_active(self) -> bool:
+        """Indique si la page est affichée à l'écran.
+
+        Returns:
+            bool: True si la page est visible et que sa fenêtre n'est pas réduite.
+        """
+        return self.widget.isVisible() and not self.widget.window().isMinimized()
+
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+        """Suspend ou reprend les vérifications selon la visibilité.
+
+        Args:
+            watched (QObject): Page ou fenêtre surveillée.
+            event (QEvent): Événement reçu.
+
+        Returns:
+            bool: Toujours False, l'événement n'est pas consommé.
+        """
+        if event.type() in (QEvent.Type.Show, QEvent.Type.Hide, QEvent.Type.WindowStateChange,
+                            QEvent.Type.WindowActivate):
+            if self._window is None and watched is self.widget and self.widget.window() is not self.widget:
+                self._window = self.widget.window()
+                self._window.installEventFilter(self)
+            QTimer.singleShot(0, self._update_state)
+        return False
+
+    def _update_state(self) -> None:
+        """Arrête le minuteur si la page est cachée, sinon reprend avec une vérification immédiate."""
+        if not self.is_active():
+            self.timer.stop()
+            return
+        if self.timer.isActive() or (self._task is not None and not self._task.done()):
+            return
+        if time.monotonic() - self._last_poll >= self.min_gap:
+            self.current_interval = self.interval
+            self._start_poll()
+        else:
+            self.timer.start(int(self.current_interval * 1000))
+
+    def _start_poll(self) -> None:
+        """Lance la vérification si la page est toujours affichée."""
+        if self.is_active() and (self._task is None or self._task.done()):
+            if self.tasks is not None:
+                self._task = self.tasks.spawn(self._run_poll(), "auto_refresh")
+            else:
+                self._task = asyncio.create_task(self._run_poll())
+
+    async def _run_poll(self) -> None:
+        """Exécute la vérification et planifie la suivante avec ou sans ralentissement."""
+        try:
+            changed = await self.poll()
+        except Exception as e:
+            print(e)
+            changed = False
+        self._last_poll = time.monotonic()
+        if changed:
+            self.current_interval = self.interval
+        else:
+            self.current_interval = min(self.current_interval * self.backoff, self.max_interval)
+        if self.is_active():
+            self.timer.start(int(self.current_interval * 1000))
@@ -0,0 +1,329 @@
+"""
+ColumnarUserStore.py
+====================
+
+Ce module contient la classe `ColumnarUserStore`, un stockage en colonnes de la
+liste des utilisateurs pour les très grandes bases (plusieurs centaines de
+milliers d'utilisateurs).
+
+Les ID sont gardés dans un tableau d'entiers et chaque autre champ est encodé
+par dictionnaire : un tableau de codes entiers et la liste des valeurs
+distinctes. Les filtres, tris et regroupements ne travaillent que sur les
+valeurs distinctes puis sont appliqués aux codes de manière vectorisée.
+
+Le stockage se comporte aussi comme une séquence modifiable d'utilisateurs
+(dictionnaires créés à la lecture), ce qui lui permet de remplacer directement
+la liste des données du modèle du tableau.
+
+NumPy est une dépendance optionnelle, importée au premier appel de
+`columnar_available()` (et non à l'import du module, qui fait partie du budget
+d'import du client API) : sans elle, la fonction renvoie False et l'application
+garde la liste de dictionnaires. Le tableau des
+utilisateurs n'utilise ce stockage que si la variable d'environnement
+`CRM_COLUMNAR_STORE` vaut `1`.
+
+Dependencies:
+    numpy (optionnel): Pour les tableaux de codes et les opérations vectorisées.
+"""
+
+# Imports standards
+import os
+from collections.abc import MutableSequence
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
+
+# Imports tiers (optionnels) : NumPy, importé à la demande par `columnar_available`
+np = None
+
+# Imports internes
+from utils.normalize import fold_text, normalize_email, normalize_phone
+
+# Normalisation utilisée pour trier et filtrer chaque champ (texte brut pour les autres)
+FIELD_KEYS: Dict[str, Callable[[Any], Any]] = {
+    "name": fold_text,
+    "first_name": fold_text,
+    "email": normalize_email,
+    "telephone": normalize_phone,
+}
+
+
+def columnar_available() -> bool:
+    """Indique si le stockage en colonnes peut être utilisé (NumPy installé).
+
+    Returns:
+        bool: True si NumPy est disponible.
+    """
+    global np
+    if np is None:
+        try:
+            import numpy
+        except ImportError:  # pragma: no cover - dépend de l'environnement
+            return False
+        np = numpy
+    return True
+
+
+def columnar_enabled() -> bool:
+    """Indique si le tableau des utilisateurs doit utiliser le stockage en colonnes.
+
+    Returns:
+        bool: True si `CRM_COLUMNAR_STORE` vaut `1` et que NumPy est installé.
+    """
+    return os.environ.get("CRM_COLUMNAR_STORE") == "1" and columnar_available()
+
+
+class _Column:
+    """Colonne encodée par dictionnaire : codes entiers et valeurs distinctes.
+
+    Attributes:
+        codes (np.ndarray): Code de la valeur de chaque ligne.
+        values (List[Any]): Valeurs distinctes, indexées par leur code.
+    """
+
+    def __init__(self, codes: "np.ndarray", values: List[Any]) -> None:
+        self.codes = codes
+        self.values = values
+        self._lookup = {value: code for code, value in enumerate(values)}
+        self._ranks: Dict[Callable, "np.ndarray"] = {}
+
+    @classmethod
+    def encode(cls, items: Iterable[Any]) -> "_Column":
+        """Encode une suite de valeurs.
+
+        Args:
+            items (Iterable[Any]): Valeur de chaque ligne.
+
+        Returns:
+            _Column: Colonne encodée.
+        """
+        lookup: Dict[Any, int] = {}
+        codes = [lookup.setdefault(item, len(lookup)) for item in items]
+        return cls(np.asarray(codes, dtype=np.int32), list(lookup))
+
+    def code_of(self, value: Any) -> int:
+        """Renvoie le code d'une valeur, en l'ajoutant aux valeurs distinctes si besoin."""
+        code = self._lookup.get(value)
+        if code is None:
+            code = len(self.values)
+            self.values.append(value)
+            self._lookup[value] = code
+            self._ranks.clear()
+        return code
+
+    def ranks(self, key: Callable[[Any], Any]) -> "np.ndarray":
+        """Renvoie le rang de chaque valeur distincte dans l'ordre de `key` (calculé une fois).
+
+        Args:
+            key (Callable[[Any], Any]): Clé de tri des valeurs.
+
+        Returns:
+            np.ndarray: Rang de chaque code, les valeurs égales pour `key` ont le même rang.
+        """
+        if key not in self._ranks:
+            keys = [key(value) for value in self.values]
+            order = sorted(range(len(keys)), key=keys.__getitem__)
+            ranks = np.empty(len(keys), dtype=np.int64)
+            rank = -1
+            previous = object()
+            for code in order:
+                if keys[code] != previous:
+                    rank += 1
+                    previous = keys[code]
+                ranks[code] = rank
+            self._ranks[key] = ranks
+        return self._ranks[key]
+
+
+class ColumnarUserStore(MutableSequence):
+    """Liste d'utilisateurs stockée en colonnes.
+
+    Hérite de MutableSequence : `store[i]` renvoie le dictionnaire de l'utilisateur,
+    `store[i] = user`, `del store[i]` et `store.insert(i, user)` modifient les colonnes.
+
+    Attributes:
+        ids (np.ndarray): ID de chaque utilisateur.
+        fields (List[str]): Champs stockés en plus de l'ID, dans l'ordre des données reçues.
+    """
+
+    def __init__(self, ids: "np.ndarray", columns: Dict[str, _Column]) -> None:
+        """Initialise le stockage à partir de colonnes déjà encodées (voir `from_records`).
+
+        Args:
+            ids (np.ndarray): ID de chaque utilisateur.
+            columns (Dict[str, _Column]): Colonnes encodées de chaque champ.
+        """
+        if not columnar_available():
+            raise RuntimeError("Le stockage en colonnes nécessite NumPy")
+        self.ids = ids
+        self._columns = columns
+        self.fields = list(columns)
+
+    @classmethod
+    def from_records(cls, users: List[Dict[str, Any]]) -> "ColumnarUserStore":
+        """Construit le stockage à partir des utilisateurs reçus de l'API.
+
+        Args:
+            users (List[Dict[str, Any]]): Utilisateurs au format renvoyé par l'API.
+
+        Returns:
+            ColumnarUserStore: Stockage en colonnes.
+        """
+        if not columnar_available():
+            raise RuntimeError("Le stockage en colonnes nécessite NumPy")
+        fields = [field for field in (users[0] if users else {}) if field != "id"]
+        ids = np.fromiter((user["id"] for user in users), dtype=np.int64, count=len(users))
+        columns = {field: _Column.encode(user.get(field) for user in users) for field in fields}
+        return cls(ids, columns)
+
+    # ------------------------------------------------------------
+    # Séquence d'utilisateurs
+    # ------------------------------------------------------------
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        record = {"id": int(self.ids[index])}
+        for field, column in self._columns.items():
+            record[field] = column.values[column.codes[index]]
+        return record
+
+    def __setitem__(self, index: int, user: Dict[str, Any]) -> None:
+        self.ids[index] = user["id"]
+        for field, column in self._columns.items():
+            column.codes[index] = column.code_of(user.get(field))
+
+    def __delitem__(self, index: int) -> None:
+        self.ids = np.delete(self.ids, index)
+        for column in self._columns.values():
+            column.codes = np.delete(column.codes, index)
+
+    def insert(self, index: int, user: Dict[str, Any]) -> None:
+        self.ids = np.insert(self.ids, index, user["id"])
+        for field, column in self._columns.items():
+            column.codes = np.insert(column.codes, index, column.code_of(user.get(field)))
+
+    def __contains__(self, item: Any) -> bool:
+        """Teste la présence d'un utilisateur par son ID (sans créer les dictionnaires)."""
+        if not isinstance(item, dict) or "id" not in item:
+            return False
+        return bool((self.ids == item["id"]).any())
+
+    # ------------------------------------------------------------
+    # Opérations vectorisées
+    # ------------------------------------------------------------
+    def argsort(self, field: str, descending: bool = False) -> "np.ndarray":
+        """Renvoie l'ordre des lignes triées sur un champ (tri stable).
+
+        Args:
+            field (str): Champ de tri (`id` ou un champ stocké).
+            descending (bool): Tri décroissant si True.
+
+        Returns:
+            np.ndarray: Index des lignes dans l'ordre du tri.
+        """
+        if field == "id":
+            values = self.ids
+        else:
+            column = self._columns[field]
+            values = column.ranks(FIELD_KEYS.get(field, str))[column.codes]
+        return np.argsort(-values if descending else values, kind="stable")
+
+    def mask(self, field: str, predicate: Callable[[Any], bool]) -> "np.ndarray":
+        """Évalue une condition sur chaque valeur distinct d'un champ puis l'étend aux lignes.
+
+        Args:
+            field (str): Champ testé.
+            predicate (Callable[[Any], bool]): Condition sur la valeur du champ.
+
+        Returns:
+            np.ndarray: Tableau de booléens, True pour les lignes qui vérifient la condition.
+        """
+        if field == "id":
+            return np.fromiter((predicate(int(i)) for i in self.ids), dtype=bool, count=len(self))
+        column = self._columns[field]
+        matches = np.fromiter((bool(predicate(value)) for value in column.values), dtype=bool,
+                              count=len(column.values))
+        return matches[column.codes]
+
+    def contains(self, field: str, text: str) -> "np.ndarray":
+        """Lignes dont un champ contient un texte, sans tenir compte des accents ni de la casse.
+
+        Args:
+            field (str): Champ testé.
+            text (str): Texte recherché.
+
+        Returns:
+            np.ndarray: Tableau de booléens par ligne.
+        """
+        key = FIELD_KEYS.get(field, fold_text)
+        needle = key(text)
+        return self.mask(field, lambda value: needle in key(value))
+
+    def equals(self, field: str, value: Any) -> "np.ndarray":
+        """Lignes dont un champ vaut exactement une valeur.
+
+        Args:
+            field (str): Champ testé.
+            value (Any): Valeur recherchée.
+
+        Returns:
+            np.ndarray: Tableau de booléens par ligne.
+        """
+        if field == "id":
+            return self.ids == value
+        column = self._columns[field]
+        code = column._lookup.get(value)
+        if code is None:
+            return np.zeros(len(self), dtype=bool)
+        return column.codes == code
+
+    def group_counts(self, field: str) -> Dict[Any, int]:
+        """Compte les utilisateurs par valeur d'un champ.
+
+        Args:
+            field (str): Champ de regroupement.
+
+        Returns:
+            Dict[Any, int]: Nombre d'utilisateurs pour chaque valeur présente.
+        """
+        column = self._columns[field]
+        counts = np.bincount(column.codes, minlength=len(column.values))
+        return {column.values[code]: int(count) for code, count in enumerate(counts) if count}
+
+    def take(self, rows: Union["np.ndarray", List[int]]) -> "ColumnarUserStore":
+        """Renvoie un nouveau stockage avec les lignes demandées, dans cet ordre.
+
+        Les valeurs distinctes sont partagées : seules les colonnes de codes sont copiées.
+
+        Args:
+            rows (np.ndarray | List[int]): Index des lignes (ordre d'un tri, ou lignes d'un masque).
+
+        Returns:
+            ColumnarUserStore: Stockage des lignes sélectionnées.
+        """
+        rows = np.asarray(rows)
+        if rows.dtype == bool:
+            rows = np.flatnonzero(rows)
+        columns = {}
+        for field, column in self._columns.items():
+            taken = _Column(column.codes[rows], column.values)
+            taken._lookup, taken._ranks = column._lookup, column._ranks
+            columns[field] = taken
+        return ColumnarUserStore(self.ids[rows], columns)
+
+    @property
+    def nbytes(self) -> int:
+        """int: Taille en octets des tableaux de codes et d'ID (hors valeurs distinctes)."""
+        return int(self.ids.nbytes + sum(column.codes.nbytes for column in self._columns.values()))
+
+    def to_records(self, rows: Optional[Iterable[int]] = None) -> List[Dict[str, Any]]:
+        """Reconstruit la liste de dictionnaires (toutes les lignes ou celles demandées).
+
+        Args:
+            rows (Optional[Iterable[int]]): Index des lignes, toutes si None.
+
+        Returns:
+            List[Dict[str, Any]]: Utilisateurs au format de l'API.
+        """
+        return [self[int(i)] for i in (range(len(self)) if rows is None else rows)]
@@ -10,14 +10,27 @@ Dependencies:
     aiohttp: Pour gérer les exceptions HTTP via la classe Requests.
 """
 
-import os
-from typing import Optional, Dict, Any, Callable
+import asyncio
+import time
+from typing import Optional, Dict, Any, AsyncIterator, Callable, List, Tuple
 
 from aiohttp import ClientResponseError, ClientConnectorDNSError
 from dotmap import DotMap
 
+from utils.ColumnarUserStore import ColumnarUserStore, columnar_available
+from utils.DuplicateIndex import DuplicateIndex
+from utils.FuzzyIndex import FuzzyIndex
 from utils.Requests import Requests
-from utils.utils import get_key_data_json
+from utils.offload import DECODE_THRESHOLD, ROWS_THRESHOLD, build_sort_keys, run_cpu
+from utils.SessionContext import SessionContext
+from utils.SettingsStore import SettingsStore
+from utils.UserSnapshot import remove_snapshot, snapshot_path_for
+
+# Nombre d'utilisateurs ajoutés aux index locaux entre deux passages de la boucle
+INDEX_CHUNK = 200
+
+# Âge maximal (en secondes) d'une page préchargée encore servie par `get_users_page`
+PREFETCH_MAX_AGE = 30.0
 
 
 class CrmApiAsync(Requests):
@@ -31,8 +44,17 @@ class CrmApiAsync(Requests):
         AccessTokenError (int): Code 400 si le token est expiré ou invalide.
         OtherError (int): Code 450 pour une erreur interne lors de la requête.
         ErrorNotFound (int): Code 500 pour une erreur externe non identifiée.
+        USERS_PAGE_SIZE (int): Taille par défaut d'une page de la liste des utilisateurs.
         auth_file (str): Chemin du fichier stockant les informations d'authentification.
+        settings (SettingsStore): Paramètres et token sauvegardés dans `auth_file`, lus une seule fois.
         error (DotMap): Objet réutilisable pour stocker les erreurs DNS.
+        session (SessionContext): Utilisateur connecté et première page d'utilisateurs, partagés par les pages.
+        duplicates (DuplicateIndex): Emails et téléphones des utilisateurs connus, consultés avant `create_user`.
+        fuzzy (FuzzyIndex): Noms et prénoms des utilisateurs connus, pour la recherche approchée.
+        user_indexes (list): Index locaux alimentés à chaque réception d'utilisateurs (méthodes `add`,
+            `prepare`, `apply`, `remove` et `clear`).
+        snapshot_path (Optional[str]): Instantané de la liste des utilisateurs affiché au démarrage,
+            None s'il est désactivé (voir `utils.UserSnapshot`).
     """
 
     Ok: int = 200
@@ -40,12 +62,15 @@ class CrmApiAsync(Requests):
     AccessTokenError: int = 400
     OtherError: int = 450
     ErrorNotFound: int = 500
+    USERS_PAGE_SIZE: int = 100
 
     def __init__(
         self,
         base_url: str,
         auth_file: str,
         headers: Optional[Dict[str, str]] = None,
+        prewarm: bool = True,
+        decode_threshold: int = DECODE_THRESHOLD,
     ) -> None:
         """Initialise le client CrmApiAsync.
 
@@ -53,10 +78,66 @@ class CrmApiAsync(Requests):
             base_url (str): URL de l'API.
             auth_file (str): Chemin du fichier stockant les informations d'auth.
             headers (Optional[Dict[str, str]]): En-têtes HTTP facultatifs.
+            prewarm (bool): Si True, résout le serveur et ouvre une connexion dès la construction
+                (appelée dans une boucle en cours d'exécution, voir `start_warm_up`).
+            decode_threshold (int): Taille en octets à partir de laquelle une réponse est décodée hors
+                du thread de l'interface.
         """
-        super().__init__(base_url, headers)
+        super().__init__(base_url, headers, decode_threshold)
         self.auth_file = auth_file
+        self.settings = SettingsStore(auth_file)
         self.error = DotMap()
+        self._prefetched: Dict[Tuple, Tuple[float, asyncio.Task]] = {}
+        self.session = SessionContext(self)
+        self.duplicates = DuplicateIndex()
+        self.fuzzy = FuzzyIndex()
+        self.user_indexes = [self.duplicates, self.fuzzy]
+        self.snapshot_path = snapshot_path_for(auth_file)
+        if prewarm:
+            self.start_warm_up()
+
+    def load_saved_token(self) -> bool:
+        """Utilise le token sauvegardé pour les requêtes suivantes, s'il existe.
+
+        Returns:
+            bool: True si un token sauvegardé a été trouvé.
+        """
+        token = self.settings.get("access_token")
+        if token:
+            self.headers = {"Authorization": f"Bearer {token}"}
+        return bool(token)
+
+    def prefetch_users_page(
+        self, skip: int, limit: int, order_by: Optional[str] = None, descending: bool = False, remember: bool = True
+    ) -> asyncio.Task:
+        """Lance en arrière-plan le téléchargement d'une page d'utilisateurs.
+
+        Le prochain appel de `get_users_page` avec les mêmes paramètres utilise ce
+        téléchargement au lieu d'envoyer une nouvelle requête, s'il a été lancé il y a
+        moins de `PREFETCH_MAX_AGE` secondes.
+
+        Args:
+            skip (int): Nombre d'utilisateurs à ignorer avant le début de la page.
+            limit (int): Nombre maximal d'utilisateurs renvoyés.
+            order_by (Optional[str]): Champ de tri côté serveur.
+            descending (bool): Tri décroissant si True.
+            remember (bool): Si False, les index locaux ne sont pas alimentés (voir `get_users_page`).
+
+        Returns:
+            asyncio.Task: Le téléchargement lancé.
+        """
+        key = (skip, limit, order_by, descending, remember)
+        if key not in self._prefetched:
+            task = self.tasks.spawn(self._get_users_page(skip, limit, order_by, descending, remember=remember),
+                                    "prefetch_users_page")
+            self._prefetched[key] = (time.monotonic(), task)
+        return self._prefetched[key][1]
+
+    def discard_prefetched(self) -> None:
+        """Abandonne les téléchargements anticipés (session invalide, déconnexion)."""
+        for _, task in self._prefetched.values():
+            task.cancel()
+        self._prefetched.clear()
 
     async def login(
         self,
@@ -88,6 +169,104 @@ class CrmApiAsync(Requests):
         except ClientResponseError as e:
             return {"err": e}
 
+    async def build_sort_keys(self, users: List[Dict[str, Any]]) -> List[tuple]:
+        """Calcule les clés de tri des utilisateurs reçus, hors du thread de l'interface pour les grandes listes.
+
+        Args:
+            users (List[Dict[str, Any]]): Utilisateurs reçus du serveur.
+
+        Returns:
+            List[tuple]: Clés de tri de chaque utilisateur, dans le même ordre.
+        """
+        if len(users) >= ROWS_THRESHOLD:
+            return await run_cpu(build_sort_keys, users, executor=self.executor)
+        return build_sort_keys(users)
+
+    def logout(self) -> None:
+        """Déconnecte l'utilisateur : oublie le token, la session partagée, les réponses en cache et l'instantané."""
+        self.settings.clear()
+        self.headers = {}
+        self.etags.clear()
+        self.session.invalidate()
+        for index in self.user_indexes:
+            index.clear()
+        if self.snapshot_path is not None:
+            remove_snapshot(self.snapshot_path)
+
+    # ------------------------------------------------------------
+    # Index locaux des utilisateurs connus
+    # ------------------------------------------------------------
+    def _remember_users(self, response: Any) -> Any:
+        """Ajoute aux index locaux les utilisateurs d'une réponse réussie.
+
+        Args:
+            response (Any): Réponse de l'API (un utilisateur ou une liste d'utilisateurs).
+
+        Returns:
+            Any: La réponse, inchangée.
+        """
+        users = [response] if isinstance(response, dict) else response
+        if isinstance(users, (list, ColumnarUserStore)):
+            for user in users:
+                if isinstance(user, dict) and "id" in user:
+                    for index in self.user_indexes:
+                        index.add(user)
+        return response
+
+    async def _remember_many(self, users: List[Dict[str, Any]], chunk: int = INDEX_CHUNK) -> None:
+        """Ajoute une grande liste d'utilisateurs aux index locaux sans figer l'interface.
+
+        Les entrées (normalisation, trigrammes) sont calculées dans l'exécuteur, mais les
+        index ne sont modifiés que sur la boucle, par lots : `search_users` et
+        `create_user` les lisent sans verrou.
+
+        Args:
+            users (List[Dict[str, Any]]): Utilisateurs reçus.
+            chunk (int): Nombre d'utilisateurs ajoutés entre deux passages de la boucle.
+        """
+        indexes = list(self.user_indexes)
+        users = [user for user in users if isinstance(user, dict) and "id" in user]
+        entries = await run_cpu(_prepare_entries, indexes, users, executor=self.executor)
+        for start in range(0, len(users), chunk):
+            for index, index_entries in zip(indexes, entries):
+                for entry in index_entries[start:start + chunk]:
+                    index.apply(entry)
+            await asyncio.sleep(0)
+
+    def _forget_user(self, user_id: int) -> None:
+        """Retire un utilisateur supprimé des index locaux.
+
+        Args:
+            user_id (int): ID de l'utilisateur.
+        """
+        for index in self.user_indexes:
+            index.remove(user_id)
+
+    def find_duplicate(self, email: str, telephone: str, exclude_id: Optional[int] = None) -> Optional[str]:
+        """Recherche parmi les utilisateurs connus un email ou un téléphone déjà utilisé.
+
+        Args:
+            email (str): Email à vérifier.
+            telephone (str): Téléphone à vérifier.
+            exclude_id (Optional[int]): ID à ignorer (l'utilisateur en cours de modification).
+
+        Returns:
+            Optional[str]: `"email"` ou `"telephone"` pour un doublon probable, None sinon.
+        """
+        return self.duplicates.find(email, telephone, exclude_id)
+
+    def search_users(self, query: str, limit: int = 20) -> List[Tuple[Dict[str, Any], float]]:
+        """Recherche approchée (fautes de frappe, accents) parmi les utilisateurs connus par nom et prénom.
+
+        Args:
+            query (str): Nom, prénom ou les deux.
+            limit (int): Nombre maximal de résultats.
+
+        Returns:
+            List[Tuple[Dict[str, Any], float]]: Utilisateurs et scores, du plus proche au moins proche.
+        """
+        return self.fuzzy.search(query, limit)
+
     async def create_user(
         self,
         name: str,
@@ -95,19 +274,31 @@ class CrmApiAsync(Requests):
         email: str,
         telephone: str,
         progress_callback: Optional[Callable[[int], None]] = None,
+        check_duplicates: bool = True,
     ) -> Dict[str, Any]:
         """Ajoute un utilisateur dans la base de données.
 
+        Si l'email ou le téléphone appartient à un utilisateur connu, l'erreur
+        "User already exists!" est renvoyée sans envoyer la requête, avec `field` (champ en
+        double) et `local` à True. Ce doublon n'est que probable (l'index ne voit pas les
+        suppressions faites par d'autres clients) : l'appelant peut confirmer et rappeler
+        la méthode avec `check_duplicates=False`, le serveur décide alors.
+
         Args:
             name (str): Nom.
             first_name (str): Prénom.
             email (str): Email.
             telephone (str): Téléphone.
             progress_callback (Callable[[int], None], optional): Fonction de suivi de progression.
+            check_duplicates (bool): Si False, la requête est envoyée sans consulter l'index local.
 
         Returns:
             Dict[str, Any]: Données de l'utilisateur ajouté ou erreur.
         """
+        duplicate = self.find_duplicate(email, telephone) if check_duplicates else None
+        if duplicate is not None:
+            return DotMap({"err": {"message": "User already exists!", "field": duplicate, "local": True}})
+
         data = {
             "name": name,
             "first_name": first_name,
@@ -115,12 +306,12 @@ class CrmApiAsync(Requests):
             "telephone": telephone,
         }
         try:
-            return await self.post(
+            return self._remember_users(await self.post(
                 "crm/users/",
                 json_data=data,
                 headers=self.headers,
                 progress_callback=progress_callback,
-            )
+            ))
         except ClientConnectorDNSError:
             self.error.err.message = "Not connected"
             return self.error
@@ -140,11 +331,11 @@ class CrmApiAsync(Requests):
             Dict[str, Any]: Données utilisateur ou erreur.
         """
         try:
-            return await self.get(
+            return self._remember_users(await self.get(
                 f"crm/users/{user_id}",
                 headers=self.headers,
                 progress_callback=progress_callback,
-            )
+            ))
         except ClientConnectorDNSError:
             self.error.err.message = "Not connected"
             return self.error
@@ -164,11 +355,11 @@ class CrmApiAsync(Requests):
             Dict[str, Any]: Données utilisateur ou erreur.
         """
         try:
-            return await self.get(
+            return self._remember_users(await self.get(
                 f"crm/users/email/{email}",
                 headers=self.headers,
                 progress_callback=progress_callback,
-            )
+            ))
         except ClientConnectorDNSError:
             self.error.err.message = "Not connected"
             return self.error
@@ -198,12 +389,12 @@ class CrmApiAsync(Requests):
             "telephone": modification["telephone"],
         }
         try:
-            return await self.put(
+            return self._remember_users(await self.put(
                 f"crm/users/{user_id}",
                 json_data=new_data,
                 headers=self.headers,
                 progress_callback=progress_callback,
-            )
+            ))
         except ClientConnectorDNSError:
             self.error.err.message = "Not connected"
             return self.error
@@ -223,11 +414,13 @@ class CrmApiAsync(Requests):
             Dict[str, Any]: Confirmation ou erreur.
         """
         try:
-            return await self.delete(
+            response = await self.delete(
                 f"crm/users/{user_id}",
                 headers=self.headers,
                 progress_callback=progress_callback,
             )
+            self._forget_user(user_id)
+            return response
         except ClientConnectorDNSError:
             self.error.err.message = "Not connected"
             return self.error
@@ -235,22 +428,121 @@ class CrmApiAsync(Requests):
             return {"err": e}
 
     async def get_all_users(
-        self, progress_callback: Optional[Callable[[int], None]] = None
+        self, progress_callback: Optional[Callable[[int], None]] = None, columnar: bool = False
     ) -> Dict[str, Any]:
         """Récupère tous les utilisateurs.
 
         Args:
             progress_callback (Callable[[int], None], optional): Fonction de suivi de progression.
+            columnar (bool): Si True et que NumPy est installé, renvoie un `ColumnarUserStore`
+                (construit hors du thread de l'interface) au lieu d'une liste de dictionnaires.
 
         Returns:
             Dict[str, Any]: Liste des utilisateurs ou erreur.
         """
         try:
-            return await self.get(
+            users = await self.get(
                 "crm/users/",
                 headers=self.headers,
                 progress_callback=progress_callback,
             )
+            if isinstance(users, list) and len(users) >= ROWS_THRESHOLD:
+                # Grande liste : index alimentés par lots sans figer l'interface
+                await self._remember_many(users)
+            else:
+                self._remember_users(users)
+            if columnar and columnar_available() and isinstance(users, list):
+                return await run_cpu(ColumnarUserStore.from_records, users, executor=self.executor)
+            return users
+        except ClientConnectorDNSError:
+            self.error.err.message = "Not connected"
+            return self.error
+        except ClientResponseError as e:
+            return {"err": e}
+
+    async def stream_all_users(
+        self, progress_callback: Optional[Callable[[int], None]] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Parcourt tous les utilisateurs en une requête, décodés au fil de la réception.
+
+        Contrairement à `get_all_users`, ni la réponse ni la liste ne sont gardées en
+        mémoire (et les index locaux ne sont pas alimentés) : la mémoire utilisée ne
+        dépend pas de la taille de la base. Les erreurs sont levées, pas renvoyées.
+
+        Args:
+            progress_callback (Callable[[int], None], optional): Fonction de suivi de progression.
+
+        Yields:
+            Dict[str, Any]: Utilisateurs dans l'ordre du serveur.
+
+        Raises:
+            ClientConnectorDNSError: Si le serveur est inaccessible.
+            ClientResponseError: Si la requête échoue.
+            ValueError: Si la réponse n'est pas une liste JSON valide.
+        """
+        async for user in self.stream_json_array("crm/users/", headers=self.headers,
+                                                 progress_callback=progress_callback):
+            yield user
+
+    async def get_users_page(
+        self,
+        skip: int,
+        limit: int,
+        order_by: Optional[str] = None,
+        descending: bool = False,
+        progress_callback: Optional[Callable[[int], None]] = None,
+        conditional: bool = False,
+        remember: bool = True,
+    ) -> Dict[str, Any]:
+        """Récupère une page de la liste des utilisateurs.
+
+        Args:
+            skip (int): Nombre d'utilisateurs à ignorer avant le début de la page.
+            limit (int): Nombre maximal d'utilisateurs renvoyés.
+            order_by (Optional[str]): Champ de tri côté serveur, ordre naturel si None.
+            descending (bool): Tri décroissant si True.
+            progress_callback (Callable[[int], None], optional): Fonction de suivi de progression.
+            conditional (bool): Si True, requête conditionnelle (la page en cache est renvoyée si inchangée).
+            remember (bool): Si False, les utilisateurs de la page ne sont pas ajoutés aux index locaux
+                (parcours complet de la base, comme un export, à mémoire constante).
+
+        Returns:
+            Dict[str, Any]: Liste des utilisateurs de la page ou erreur.
+        """
+        key = (skip, limit, order_by, descending, remember)
+        prefetched = None if conditional else self._prefetched.pop(key, None)
+        if prefetched is not None:
+            started, task = prefetched
+            if time.monotonic() - started <= PREFETCH_MAX_AGE:
+                return await task
+            # Page trop ancienne : la liste a pu changer depuis
+            task.cancel()
+        return await self._get_users_page(skip, limit, order_by, descending, progress_callback, conditional, remember)
+
+    async def _get_users_page(
+        self,
+        skip: int,
+        limit: int,
+        order_by: Optional[str] = None,
+        descending: bool = False,
+        progress_callback: Optional[Callable[[int], None]] = None,
+        conditional: bool = False,
+        remember: bool = True,
+    ) -> Dict[str, Any]:
+        """Envoie la requête d'une page d'utilisateurs (voir `get_users_page`)."""
+        params = {"skip": skip, "limit": limit}
+        if order_by:
+            params["order_by"] = order_by
+            params["desc"] = "true" if descending else "false"
+        try:
+            page = await self.get(
+                "crm/users/",
+                params=params,
+                headers=self.headers,
+                progress_callback=progress_callback,
+                conditional=conditional,
+            )
+            return self._remember_users(page) if remember else page
         except ClientConnectorDNSError:
             self.error.err.message = "Not connected"
             return self.error
@@ -282,13 +574,12 @@ class CrmApiAsync(Requests):
                 self.error.err.message = e
                 return self.error
         else:
-            token = get_key_data_json(self.auth_file, "access_token")
+            token = self.settings.get("access_token")
             if token:
                 self.headers = {"Authorization": f"Bearer {token}"}
                 return await self.get_current_user_access(progress_callback)
             else:
-                if os.path.exists(self.auth_file):
-                    os.remove(self.auth_file)
+                self.settings.clear()
                 self.error.err.message = "Could not verify credentials"
                 return self.error
 
@@ -311,3 +602,16 @@ class CrmApiAsync(Requests):
                 return self.ErrorDNS
             return self.OtherError
         return self.ErrorNotFound
+
+
+def _prepare_entries(indexes: List[Any], users: List[Dict[str, Any]]) -> List[List[Any]]:
+    """Calcule les entrées des index locaux pour une liste d'utilisateurs (dans un exécuteur).
+
+    Args:
+        indexes (List[Any]): Index locaux (`prepare` ne les modifie pas).
+        users (List[Dict[str, Any]]): Utilisateurs reçus.
+
+    Returns:
+        List[List[Any]]: Pour chaque index, les entrées des utilisateurs dans l'ordre.
+    """
+    return [[index.prepare(user) for user in users] for index in indexes]
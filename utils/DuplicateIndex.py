@@ -0,0 +1,114 @@
+"""
+DuplicateIndex.py
+=================
+
+Ce module contient la classe `DuplicateIndex`, un index local des emails et des
+numéros de téléphone normalisés des utilisateurs déjà connus du client.
+
+Il est alimenté par `CrmApiAsync` à chaque réception d'utilisateurs et consulté
+avant `create_user` : un doublon probable est signalé immédiatement, sans
+envoyer une requête que le serveur refuserait ("User already exists!"). L'index
+n'apprend pas les suppressions faites par d'autres clients, l'utilisateur peut
+donc confirmer la création et laisser le serveur décider.
+
+Dependencies:
+    utils.normalize: Pour normaliser les emails et les numéros de téléphone.
+"""
+
+# Imports standards
+from typing import Any, Dict, Optional, Tuple
+
+# Imports internes
+from utils.normalize import normalize_email, normalize_phone
+
+
+class DuplicateIndex:
+    """Index des emails et téléphones normalisés des utilisateurs connus.
+
+    Chaque valeur est associée à l'ID de son utilisateur, ce qui permet de mettre à
+    jour ou de retirer un utilisateur et d'ignorer l'utilisateur modifié lui-même.
+
+    Attributes:
+        emails (Dict[str, int]): ID de l'utilisateur pour chaque email normalisé.
+        phones (Dict[str, int]): ID de l'utilisateur pour chaque téléphone normalisé.
+    """
+
+    def __init__(self) -> None:
+        """Initialise un index vide."""
+        self.emails: Dict[str, int] = {}
+        self.phones: Dict[str, int] = {}
+        self._by_id: Dict[int, Tuple[str, str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def add(self, user: Dict[str, Any]) -> None:
+        """Ajoute ou met à jour un utilisateur.
+
+        Args:
+            user (Dict[str, Any]): Données de l'utilisateur (`id`, `email`, `telephone`).
+        """
+        self.apply(self.prepare(user))
+
+    @staticmethod
+    def prepare(user: Dict[str, Any]) -> Tuple[int, str, str]:
+        """Normalise l'email et le téléphone d'un utilisateur sans modifier l'index.
+
+        Args:
+            user (Dict[str, Any]): Données de l'utilisateur.
+
+        Returns:
+            Tuple[int, str, str]: ID, email et téléphone normalisés.
+        """
+        return user["id"], normalize_email(user.get("email") or ""), normalize_phone(user.get("telephone") or "")
+
+    def apply(self, entry: Tuple[int, str, str]) -> None:
+        """Ajoute ou met à jour un utilisateur à partir d'une entrée calculée par `prepare`.
+
+        Args:
+            entry (Tuple[int, str, str]): ID, email et téléphone normalisés.
+        """
+        user_id, email, phone = entry
+        self.remove(user_id)
+        self._by_id[user_id] = (email, phone)
+        if email:
+            self.emails[email] = user_id
+        if phone:
+            self.phones[phone] = user_id
+
+    def remove(self, user_id: int) -> None:
+        """Retire un utilisateur de l'index.
+
+        Args:
+            user_id (int): ID de l'utilisateur.
+        """
+        email, phone = self._by_id.pop(user_id, ("", ""))
+        if self.emails.get(email) == user_id:
+            del self.emails[email]
+        if self.phones.get(phone) == user_id:
+            del self.phones[phone]
+
+    def clear(self) -> None:
+        """Vide l'index (par exemple à la déconnexion)."""
+        self.emails.clear()
+        self.phones.clear()
+        self._by_id.clear()
+
+    def find(self, email: str, telephone: str, exclude_id: Optional[int] = None) -> Optional[str]:
+        """Recherche un utilisateur connu ayant le même email ou le même téléphone.
+
+        Args:
+            email (str): Email à vérifier.
+            telephone (str): Numéro de téléphone à vérifier.
+            exclude_id (Optional[int]): ID à ignorer (l'utilisateur en cours de modification).
+
+        Returns:
+            Optional[str]: `"email"` ou `"telephone"` selon le champ en double, None si aucun doublon connu.
+        """
+        owner = self.emails.get(normalize_email(email))
+        if owner is not None and owner != exclude_id:
+            return "email"
+        owner = self.phones.get(normalize_phone(telephone))
+        if owner is not None and owner != exclude_id:
+            return "telephone"
+        return None
@@ -0,0 +1,318 @@
+"""
+Export.py
+=========
+
+Ce module exporte la liste des utilisateurs en CSV, JSON Lines ou Parquet.
+
+Les utilisateurs sont lus page par page depuis l'API (`iter_users`), d'une seule
+requête décodée au fil de la réception (`iter_all_users`) ou depuis une copie
+locale (`iter_records` : instantané, données du tableau) et écrits par
+lots : la mémoire utilisée ne dépend pas de la taille de la base. Chaque lot est
+écrit (et compressé) dans un thread, hors de la boucle événementielle.
+
+Le fichier est écrit sous un nom temporaire puis renommé : un export interrompu
+ne laisse pas de fichier incomplet. Les fichiers CSV et JSON Lines peuvent être
+compressés en gzip (`compress=True` ou extension `.gz`) ; le format Parquet est
+compressé par pyarrow lui-même.
+
+pyarrow est une dépendance optionnelle : sans elle, `parquet_available()` renvoie
+False et seuls CSV et JSON Lines sont proposés.
+
+Dependencies:
+    pyarrow (optionnel): Pour écrire les fichiers Parquet.
+    utils.offload: Pour écrire les lots hors du thread de l'interface.
+"""
+
+# Imports standards
+import asyncio
+import csv
+import gzip
+import io
+import json
+import os
+import sys
+from typing import TYPE_CHECKING, Any, AsyncGenerator, AsyncIterable, AsyncIterator, Callable, Dict, Iterable, List, Optional, \
+    Tuple, Union
+
+# Imports tiers
+from aiohttp import ClientConnectorDNSError, ClientResponseError
+from dotmap import DotMap
+
+# Imports tiers (optionnels)
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - dépend de l'environnement
+    pa = pq = None
+
+# Imports internes
+from utils.offload import run_cpu
+
+if TYPE_CHECKING:
+    from utils.CrmApiAsync import CrmApiAsync
+
+FIELDS = ("id", "name", "first_name", "email", "telephone")
+FORMATS = ("csv", "jsonl", "parquet")
+EXTENSIONS = {".csv": "csv", ".jsonl": "jsonl", ".ndjson": "jsonl", ".parquet": "parquet"}
+
+# Nombre d'utilisateurs écrits à la fois (et taille des pages demandées à l'API)
+BATCH_SIZE = 1000
+
+
+class ExportError(Exception):
+    """Erreur de l'API pendant un export.
+
+    Attributes:
+        response (Dict[str, Any]): Réponse en erreur de `CrmApiAsync` (clé `err`).
+    """
+
+    def __init__(self, response: Dict[str, Any]) -> None:
+        self.response = response
+        err = response.get("err")
+        super().__init__(str(getattr(err, "message", None) or err))
+
+
+def parquet_available() -> bool:
+    """Indique si l'export Parquet est possible (pyarrow installé).
+
+    Returns:
+        bool: True si pyarrow est disponible.
+    """
+    return pq is not None
+
+
+def detect_format(path: str) -> Tuple[str, bool]:
+    """Déduit le format et la compression d'un fichier de son extension.
+
+    Args:
+        path (str): Chemin du fichier (`utilisateurs.csv`, `utilisateurs.jsonl.gz`...).
+
+    Returns:
+        Tuple[str, bool]: Format (`csv` si l'extension est inconnue) et True si l'extension est `.gz`.
+
+    Example:
+        >>> detect_format("export/utilisateurs.jsonl.gz")
+        ('jsonl', True)
+    """
+    lower = path.lower()
+    compressed = lower.endswith(".gz")
+    if compressed:
+        lower = lower[:-3]
+    return EXTENSIONS.get(os.path.splitext(lower)[1], "csv"), compressed
+
+
+async def iter_users(
+    api: "CrmApiAsync", page_size: int = BATCH_SIZE, order_by: Optional[str] = None, descending: bool = False
+) -> AsyncIterator[Dict[str, Any]]:
+    """Parcourt tous les utilisateurs de l'API page par page.
+
+    La page suivante est téléchargée pendant le traitement de la page courante, par
+    une tâche propre au parcours et annulée s'il est interrompu. Les pages ne sont
+    pas ajoutées aux index locaux du client : la mémoire utilisée ne dépend pas de la
+    taille de la base.
+
+    Args:
+        api (CrmApiAsync): Client de l'API.
+        page_size (int): Nombre d'utilisateurs par page.
+        order_by (Optional[str]): Champ de tri côté serveur.
+        descending (bool): Tri décroissant si True.
+
+    Yields:
+        Dict[str, Any]: Utilisateurs dans l'ordre du serveur.
+
+    Raises:
+        ExportError: Si une page ne peut pas être téléchargée.
+    """
+    skip = 0
+    next_page: Optional[asyncio.Task] = None
+    try:
+        while True:
+            if next_page is None:
+                page = await api.get_users_page(skip, page_size, order_by, descending, remember=False)
+            else:
+                page, next_page = await next_page, None
+            if not isinstance(page, list):
+                raise ExportError(page)
+            if len(page) == page_size:
+                next_page = api.tasks.spawn(
+                    api.get_users_page(skip + page_size, page_size, order_by, descending, remember=False),
+                    "iter_users",
+                )
+            for user in page:
+                yield user
+            if len(page) < page_size:
+                return
+            skip += page_size
+    finally:
+        if next_page is not None:
+            next_page.cancel()
+
+
+async def iter_all_users(
+    api: "CrmApiAsync", progress_callback: Optional[Callable[[int], None]] = None
+) -> AsyncIterator[Dict[str, Any]]:
+    """Parcourt tous les utilisateurs de l'API en une seule requête décodée au fil de l'eau.
+
+    Args:
+        api (CrmApiAsync): Client de l'API.
+        progress_callback (Callable[[int], None], optional): Progression du téléchargement (pourcentage).
+
+    Yields:
+        Dict[str, Any]: Utilisateurs dans l'ordre du serveur.
+
+    Raises:
+        ExportError: Si la liste ne peut pas être téléchargée.
+        ValueError: Si la réponse n'est pas une liste JSON valide.
+    """
+    try:
+        async for user in api.stream_all_users(progress_callback):
+            yield user
+    except ClientConnectorDNSError:
+        raise ExportError(DotMap({"err": {"message": "Not connected"}}))
+    except ClientResponseError as e:
+        raise ExportError({"err": e})
+
+
+async def iter_records(records: Iterable[Dict[str, Any]], chunk: int = BATCH_SIZE) -> AsyncIterator[Dict[str, Any]]:
+    """Parcourt une copie locale des utilisateurs en rendant la main à la boucle régulièrement.
+
+    Args:
+        records (Iterable[Dict[str, Any]]): Utilisateurs (`UserSnapshot`, `ColumnarUserStore`, liste...).
+        chunk (int): Nombre d'utilisateurs lus entre deux passages de la boucle.
+
+    Yields:
+        Dict[str, Any]: Utilisateurs dans l'ordre de la copie.
+    """
+    for position, user in enumerate(records, start=1):
+        yield user
+        if position % chunk == 0:
+            await asyncio.sleep(0)
+
+
+class _RowWriter:
+    """Écrit des lots d'utilisateurs dans un fichier (ou la sortie standard) d'un format donné."""
+
+    def __init__(self, target: str, file_format: str, compress: bool) -> None:
+        """Ouvre le fichier de destination.
+
+        Args:
+            target (str): Chemin du fichier, `-` pour la sortie standard (CSV et JSON Lines).
+            file_format (str): `csv`, `jsonl` ou `parquet`.
+            compress (bool): Compression gzip (CSV, JSON Lines) ou compression interne (Parquet).
+        """
+        self.file_format = file_format
+        self._file = None
+        self._owned = target != "-"
+        self._parquet = None
+        if file_format == "parquet":
+            schema = pa.schema([("id", pa.int64())] + [(field, pa.string()) for field in FIELDS[1:]])
+            self._parquet = pq.ParquetWriter(target, schema, compression="gzip" if compress else "snappy")
+            return
+
+        if compress:
+            raw = gzip.open(target, "wb") if self._owned else gzip.GzipFile(fileobj=sys.stdout.buffer, mode="wb")
+            self._owned = True
+            self._file = io.TextIOWrapper(raw, encoding="utf-8", newline="")
+        elif self._owned:
+            self._file = open(target, "w", encoding="utf-8", newline="")
+        else:
+            self._file = sys.stdout
+        self._csv = csv.DictWriter(self._file, fieldnames=FIELDS, extrasaction="ignore")
+        if file_format == "csv":
+            self._csv.writeheader()
+
+    def write_rows(self, rows: List[Dict[str, Any]]) -> None:
+        """Écrit un lot d'utilisateurs.
+
+        Args:
+            rows (List[Dict[str, Any]]): Utilisateurs réduits aux champs exportés.
+        """
+        if self._parquet is not None:
+            self._parquet.write_table(pa.Table.from_pylist(rows, schema=self._parquet.schema))
+        elif self.file_format == "csv":
+            self._csv.writerows(rows)
+        else:
+            self._file.write("".join(json.dumps(row, ensure_ascii=False) + "\n" for row in rows))
+
+    def close(self) -> None:
+        """Termine le fichier (pied de page Parquet, fin du flux gzip)."""
+        if self._parquet is not None:
+            self._parquet.close()
+        elif self._owned:
+            self._file.close()
+        else:
+            self._file.flush()
+
+
+async def export_users(
+    users: Union[AsyncIterable[Dict[str, Any]], Iterable[Dict[str, Any]]],
+    path: str,
+    file_format: Optional[str] = None,
+    compress: Optional[bool] = None,
+    progress_callback: Optional[Callable[[int], None]] = None,
+    batch_size: int = BATCH_SIZE,
+) -> int:
+    """Exporte des utilisateurs dans un fichier, lot par lot.
+
+    Args:
+        users (AsyncIterable | Iterable): Utilisateurs à exporter (`iter_users(api)` ou une copie locale).
+        path (str): Fichier de destination, `-` pour la sortie standard (CSV et JSON Lines).
+        file_format (Optional[str]): `csv`, `jsonl` ou `parquet`, déduit de l'extension si None.
+        compress (Optional[bool]): Compression gzip, déduite de l'extension `.gz` si None.
+        progress_callback (Callable[[int], None], optional): Appelée avec le nombre d'utilisateurs écrits
+            après chaque lot.
+        batch_size (int): Nombre d'utilisateurs écrits à la fois.
+
+    Returns:
+        int: Nombre d'utilisateurs exportés.
+
+    Raises:
+        ValueError: Si le format est inconnu ou indisponible.
+        ExportError: Si une page de l'API ne peut pas être téléchargée.
+        OSError: Si le fichier ne peut pas être écrit.
+    """
+    detected_format, detected_compress = detect_format(path)
+    file_format = file_format or detected_format
+    compress = detected_compress if compress is None else compress
+    if file_format not in FORMATS:
+        raise ValueError(f"Format d'export inconnu : {file_format}")
+    if file_format == "parquet" and (not parquet_available() or path == "-"):
+        raise ValueError("L'export Parquet nécessite pyarrow et un fichier de destination")
+    if not isinstance(users, AsyncIterable):
+        users = iter_records(users, batch_size)
+
+    # Fichier temporaire renommé à la fin : pas de fichier incomplet en cas d'erreur
+    target = path if path == "-" else f"{path}.tmp"
+    writer = await run_cpu(_RowWriter, target, file_format, compress)
+    count = 0
+    batch: List[Dict[str, Any]] = []
+    try:
+        async for user in users:
+            batch.append({field: user.get(field) for field in FIELDS})
+            if len(batch) >= batch_size:
+                await run_cpu(writer.write_rows, batch)
+                count += len(batch)
+                batch = []
+                if progress_callback:
+                    progress_callback(count)
+        if batch:
+            await run_cpu(writer.write_rows, batch)
+            count += len(batch)
+        await run_cpu(writer.close)
+    except BaseException:
+        try:
+            if isinstance(users, AsyncGenerator):
+                # Arrête le parcours tout de suite (téléchargement en cours compris)
+                await users.aclose()
+            await run_cpu(writer.close)
+            if target != path:
+                os.remove(target)
+        except OSError as e:
+            print(e)
+        raise
+
+    if target != path:
+        os.replace(target, path)
+    if progress_callback:
+        progress_callback(count)
+    return count
@@ -0,0 +1,389 @@
+"""
+FakeCrmServer.py
+================
+
+Ce module contient `FakeCrmServer`, un faux serveur de l'API CRM basé sur
+aiohttp, pour faire tourner `CrmApiAsync`, l'application ou les scripts de
+mesure sans le vrai serveur.
+
+Il reproduit les routes utilisées par le client :
+
+- `POST auth/token` : connexion (formulaire `username` / `password`) ;
+- `GET crm` : utilisateur connecté (`current_user`) ;
+- `GET crm/users/` : liste, paginée avec `skip` / `limit`, triée avec `order_by` / `desc` ;
+- `GET|PUT|DELETE crm/users/{id}`, `GET crm/users/email/{email}`, `POST crm/users/`.
+
+Les erreurs ont le format du vrai serveur (`{"detail": ...}`) et les listes
+portent un ETag (réponse 304 pour `If-None-Match`). La latence, le débit et une
+part de réponses en erreur 500 sont réglables pour reproduire un réseau lent ou
+instable.
+
+Le serveur peut tourner dans la boucle courante (`async with FakeCrmServer(...) as server`)
+ou seul :
+
+    python -m utils.FakeCrmServer [--port 8000] [--users 1000] [--latency 0.05]
+                                  [--bandwidth 1000000] [--error-rate 0.01]
+
+Dependencies:
+    aiohttp: Pour le serveur HTTP.
+"""
+
+# Imports standards
+import argparse
+import asyncio
+import hashlib
+import json
+import os
+import random
+import secrets
+import string
+from collections import Counter
+from typing import Any, Dict, List, Optional, Set
+
+# Imports tiers
+from aiohttp import web
+
+FIRST_NAMES = ["Éloïse", "Zoé", "André", "Hüseyin", "Chloé", "Ömer", "Léa", "Noah", "Çağla", "Lucas"]
+NAMES = ["Martin", "Bernard", "Dubois", "Thomas", "Robert", "Yılmaz", "Petit", "Durand", "Lefèvre", "Moreau"]
+SORTABLE_FIELDS = ("id", "name", "first_name", "email", "telephone")
+
+# Taille (en octets) des morceaux envoyés lorsque le débit est limité
+CHUNK_SIZE = 16 * 1024
+
+
+def make_users(count: int, seed: int = 0) -> List[Dict[str, Any]]:
+    """Génère des utilisateurs factices au format de l'API.
+
+    Args:
+        count (int): Nombre d'utilisateurs.
+        seed (int): Graine du générateur (même graine, mêmes utilisateurs).
+
+    Returns:
+        List[Dict[str, Any]]: Utilisateurs d'ID 1 à `count`.
+    """
+    rng = random.Random(seed)
+    return [
+        {
+            "id": user_id,
+            "name": f"{rng.choice(NAMES)}{''.join(rng.choices(string.ascii_lowercase, k=3))}",
+            "first_name": rng.choice(FIRST_NAMES),
+            "email": f"user{user_id}@example.com",
+            "telephone": "06" + "".join(rng.choices(string.digits, k=8)),
+        }
+        for user_id in range(1, count + 1)
+    ]
+
+
+class FakeCrmServer:
+    """Faux serveur de l'API CRM avec latence, débit et erreurs réglables.
+
+    Attributes:
+        users (Dict[int, Dict[str, Any]]): Utilisateurs du CRM, par ID.
+        email (str): Email du compte administrateur accepté par `auth/token`.
+        password (str): Mot de passe de ce compte.
+        latency (float): Délai en secondes ajouté à chaque réponse.
+        jitter (float): Délai aléatoire supplémentaire maximal, en secondes.
+        bandwidth (Optional[int]): Débit maximal des réponses en octets par seconde, illimité si None.
+        error_rate (float): Part des requêtes (entre 0 et 1) qui reçoivent une erreur 500.
+        tokens (Set[str]): Tokens délivrés et encore valides.
+        requests (Counter): Nombre de requêtes reçues par route (`"GET /crm/users/"`...).
+        base_url (Optional[str]): URL du serveur une fois démarré.
+    """
+
+    def __init__(
+        self,
+        users: int = 1000,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        bandwidth: Optional[int] = None,
+        error_rate: float = 0.0,
+        seed: int = 0,
+        email: str = "admin@example.com",
+        password: str = "admin",
+    ) -> None:
+        """Initialise le serveur et son jeu de données sans le démarrer.
+
+        Args:
+            users (int): Nombre d'utilisateurs générés.
+            latency (float): Délai en secondes ajouté à chaque réponse.
+            jitter (float): Délai aléatoire supplémentaire maximal, en secondes.
+            bandwidth (Optional[int]): Débit maximal des réponses en octets par seconde.
+            error_rate (float): Part des requêtes qui reçoivent une erreur 500.
+            seed (int): Graine du jeu de données et des tirages aléatoires.
+            email (str): Email du compte administrateur.
+            password (str): Mot de passe du compte administrateur.
+        """
+        self.users: Dict[int, Dict[str, Any]] = {user["id"]: user for user in make_users(users, seed)}
+        self.email = email
+        self.password = password
+        self.latency = latency
+        self.jitter = jitter
+        self.bandwidth = bandwidth
+        self.error_rate = error_rate
+        self.tokens: Set[str] = set()
+        self.requests: Counter = Counter()
+        self.base_url: Optional[str] = None
+        self._rng = random.Random(seed)
+        self._next_id = users + 1
+        self._runner: Optional[web.AppRunner] = None
+
+        self.app = web.Application(middlewares=[self._faults])
+        self.app.add_routes([
+            web.get("/", self._root),
+            web.post("/auth/token", self._login),
+            web.get("/crm", self._current_user),
+            web.get("/crm/users/", self._list_users),
+            web.post("/crm/users/", self._create_user),
+            web.get("/crm/users/email/{email}", self._get_user_by_email),
+            web.get("/crm/users/{user_id:\\d+}", self._get_user),
+            web.put("/crm/users/{user_id:\\d+}", self._update_user),
+            web.delete("/crm/users/{user_id:\\d+}", self._delete_user),
+        ])
+
+    @classmethod
+    def from_env(cls) -> "FakeCrmServer":
+        """Crée un serveur réglé par les variables d'environnement.
+
+        `CRM_FAKE_USERS`, `CRM_FAKE_LATENCY`, `CRM_FAKE_BANDWIDTH` et `CRM_FAKE_ERROR_RATE`
+        remplacent les valeurs par défaut des paramètres correspondants.
+
+        Returns:
+            FakeCrmServer: Serveur non démarré.
+        """
+        bandwidth = os.environ.get("CRM_FAKE_BANDWIDTH")
+        return cls(
+            users=int(os.environ.get("CRM_FAKE_USERS", 1000)),
+            latency=float(os.environ.get("CRM_FAKE_LATENCY", 0)),
+            bandwidth=int(bandwidth) if bandwidth else None,
+            error_rate=float(os.environ.get("CRM_FAKE_ERROR_RATE", 0)),
+        )
+
+    # ------------------------------------------------------------
+    # Démarrage
+    # ------------------------------------------------------------
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """Démarre le serveur dans la boucle courante.
+
+        Args:
+            host (str): Adresse d'écoute.
+            port (int): Port d'écoute, choisi par le système si 0.
+
+        Returns:
+            str: URL de base à passer à `CrmApiAsync`.
+        """
+        self._runner = web.AppRunner(self.app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        self.base_url = f"http://{host}:{self._runner.addresses[0][1]}"
+        return self.base_url
+
+    async def stop(self) -> None:
+        """Arrête le serveur."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self) -> "FakeCrmServer":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.stop()
+
+    def issue_token(self) -> str:
+        """Délivre un token valide sans passer par `auth/token` (pour les tests).
+
+        Returns:
+            str: Token à envoyer dans l'en-tête `Authorization: Bearer`.
+        """
+        token = secrets.token_hex(16)
+        self.tokens.add(token)
+        return token
+
+    # ------------------------------------------------------------
+    # Latence, erreurs et débit
+    # ------------------------------------------------------------
+    @web.middleware
+    async def _faults(self, request: web.Request, handler) -> web.StreamResponse:
+        """Compte la requête, ajoute la latence et injecte les erreurs 500."""
+        route = request.match_info.route.resource
+        self.requests[f"{request.method} {route.canonical if route is not None else request.path}"] += 1
+        delay = self.latency + (self._rng.uniform(0, self.jitter) if self.jitter else 0)
+        if delay:
+            await asyncio.sleep(delay)
+        if self.error_rate and self._rng.random() < self.error_rate:
+            return web.json_response({"detail": "Injected error"}, status=500)
+        return await handler(request)
+
+    async def _send(self, request: web.Request, data: Any, status: int = 200,
+                    conditional: bool = False) -> web.StreamResponse:
+        """Envoie une réponse JSON en respectant le débit maximal.
+
+        Args:
+            request (web.Request): Requête reçue.
+            data (Any): Données de la réponse.
+            status (int): Statut HTTP.
+            conditional (bool): Si True, ajoute un ETag et répond 304 si le client l'a déjà.
+
+        Returns:
+            web.StreamResponse: Réponse envoyée.
+        """
+        body = json.dumps(data, ensure_ascii=False).encode("utf-8")
+        headers = {}
+        if conditional:
+            headers["ETag"] = f'"{hashlib.md5(body).hexdigest()}"'
+            if request.headers.get("If-None-Match") == headers["ETag"]:
+                return web.Response(status=304, headers=headers)
+        if not self.bandwidth:
+            return web.Response(body=body, status=status, headers=headers, content_type="application/json")
+
+        response = web.StreamResponse(status=status, headers=headers)
+        response.content_type = "application/json"
+        response.content_length = len(body)
+        await response.prepare(request)
+        for start in range(0, len(body), CHUNK_SIZE):
+            chunk = body[start:start + CHUNK_SIZE]
+            await response.write(chunk)
+            await asyncio.sleep(len(chunk) / self.bandwidth)
+        await response.write_eof()
+        return response
+
+    def _authenticate(self, request: web.Request) -> None:
+        """Vérifie le token de la requête.
+
+        Raises:
+            web.HTTPException: 401 si le token est absent ou inconnu.
+        """
+        authorization = request.headers.get("Authorization", "")
+        if not authorization.startswith("Bearer "):
+            raise _HTTPError(401, "Not authenticated")
+        if authorization[len("Bearer "):] not in self.tokens:
+            raise _HTTPError(401, "Could not verify credentials")
+
+    def _user_or_404(self, request: web.Request) -> Dict[str, Any]:
+        """Renvoie l'utilisateur désigné par l'ID de l'URL.
+
+        Raises:
+            web.HTTPException: 404 si l'utilisateur n'existe pas.
+        """
+        user = self.users.get(int(request.match_info["user_id"]))
+        if user is None:
+            raise _HTTPError(404, "User not found")
+        return user
+
+    async def _user_fields(self, request: web.Request) -> Dict[str, str]:
+        """Lit et valide les champs d'un utilisateur envoyés en JSON.
+
+        Raises:
+            web.HTTPException: 422 si un champ manque.
+        """
+        try:
+            data = await request.json()
+        except json.JSONDecodeError:
+            raise _HTTPError(422, "Invalid JSON")
+        fields = ("name", "first_name", "email", "telephone")
+        if not isinstance(data, dict) or any(not data.get(field) for field in fields):
+            raise _HTTPError(422, "Missing fields")
+        return {field: str(data[field]) for field in fields}
+
+    def _duplicate(self, fields: Dict[str, str], exclude_id: Optional[int] = None) -> bool:
+        """Indique si l'email ou le téléphone appartient déjà à un autre utilisateur."""
+        return any(
+            user["id"] != exclude_id and (user["email"] == fields["email"] or user["telephone"] == fields["telephone"])
+            for user in self.users.values()
+        )
+
+    # ------------------------------------------------------------
+    # Routes
+    # ------------------------------------------------------------
+    async def _root(self, request: web.Request) -> web.StreamResponse:
+        return await self._send(request, {"status": "ok"})
+
+    async def _login(self, request: web.Request) -> web.StreamResponse:
+        form = await request.post()
+        if form.get("username") != self.email or form.get("password") != self.password:
+            raise _HTTPError(401, "Wrong info!")
+        return await self._send(request, {"access_token": self.issue_token(), "token_type": "bearer"})
+
+    async def _current_user(self, request: web.Request) -> web.StreamResponse:
+        self._authenticate(request)
+        current_user = {"id": 0, "name": "Admin", "email": self.email, "role": "admin", "is_active": True}
+        return await self._send(request, {"current_user": current_user})
+
+    async def _list_users(self, request: web.Request) -> web.StreamResponse:
+        self._authenticate(request)
+        users = list(self.users.values())
+        order_by = request.query.get("order_by")
+        if order_by in SORTABLE_FIELDS:
+            users.sort(key=lambda user: user[order_by], reverse=request.query.get("desc") == "true")
+        skip = int(request.query.get("skip", 0))
+        limit = request.query.get("limit")
+        users = users[skip:skip + int(limit)] if limit is not None else users[skip:]
+        return await self._send(request, users, conditional=True)
+
+    async def _get_user(self, request: web.Request) -> web.StreamResponse:
+        self._authenticate(request)
+        return await self._send(request, self._user_or_404(request), conditional=True)
+
+    async def _get_user_by_email(self, request: web.Request) -> web.StreamResponse:
+        self._authenticate(request)
+        for user in self.users.values():
+            if user["email"] == request.match_info["email"]:
+                return await self._send(request, user, conditional=True)
+        raise _HTTPError(404, "User not found")
+
+    async def _create_user(self, request: web.Request) -> web.StreamResponse:
+        self._authenticate(request)
+        fields = await self._user_fields(request)
+        if self._duplicate(fields):
+            raise _HTTPError(400, "User already exists!")
+        user = {"id": self._next_id, **fields}
+        self._next_id += 1
+        self.users[user["id"]] = user
+        return await self._send(request, user)
+
+    async def _update_user(self, request: web.Request) -> web.StreamResponse:
+        self._authenticate(request)
+        user = self._user_or_404(request)
+        fields = await self._user_fields(request)
+        if self._duplicate(fields, exclude_id=user["id"]):
+            raise _HTTPError(400, "User already exists!")
+        user.update(fields)
+        return await self._send(request, user)
+
+    async def _delete_user(self, request: web.Request) -> web.StreamResponse:
+        self._authenticate(request)
+        user = self._user_or_404(request)
+        del self.users[user["id"]]
+        return await self._send(request, {"detail": "User deleted"})
+
+
+class _HTTPError(web.HTTPException):
+    """Erreur HTTP de statut quelconque au format du vrai serveur (`{"detail": ...}`)."""
+
+    def __init__(self, status: int, detail: str) -> None:
+        self.status_code = status
+        super().__init__(text=json.dumps({"detail": detail}), content_type="application/json")
+
+
+def main() -> None:
+    """Lance le faux serveur seul jusqu'à son interruption (Ctrl+C)."""
+    parser = argparse.ArgumentParser(prog="FakeCrmServer")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--latency", type=float, default=0.0, help="délai ajouté à chaque réponse (s)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="délai aléatoire supplémentaire maximal (s)")
+    parser.add_argument("--bandwidth", type=int, help="débit maximal des réponses (octets/s)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="part des requêtes en erreur 500")
+    args = parser.parse_args()
+
+    server = FakeCrmServer(args.users, args.latency, args.jitter, args.bandwidth, args.error_rate)
+    print(f"Faux serveur CRM sur http://{args.host}:{args.port} ({args.users} utilisateurs), "
+          f"connexion : {server.email} / {server.password}")
+    web.run_app(server.app, host=args.host, port=args.port, print=None)
+
+
+if __name__ == "__main__":
+    main()
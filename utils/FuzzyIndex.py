@@ -0,0 +1,179 @@
+"""
+FuzzyIndex.py
+=============
+
+Ce module contient la classe `FuzzyIndex`, un index de trigrammes sur le nom et
+le prénom des utilisateurs connus, pour retrouver un utilisateur malgré une
+faute de frappe.
+
+Les noms sont comparés sans accents ni casse (`fold_text`, qui couvre les
+lettres `À-ÿ` acceptées par `configure_line_edit`). L'index est mis à jour
+utilisateur par utilisateur à chaque réception de données : une recherche ne
+reconstruit rien et ne parcourt que les utilisateurs partageant au moins un
+trigramme avec la recherche.
+
+Dependencies:
+    utils.normalize: Pour retirer les accents et la casse.
+"""
+
+# Imports standards
+import heapq
+import math
+from collections import Counter
+from typing import Any, Dict, FrozenSet, List, Set, Tuple
+
+# Imports internes
+from utils.normalize import fold_text
+
+
+def trigrams(text: str) -> FrozenSet[str]:
+    """Découpe un texte normalisé en trigrammes, mot par mot.
+
+    Chaque mot est entouré d'espaces pour que les débuts et fins de mots comptent.
+
+    Args:
+        text (str): Texte déjà normalisé par `fold_text`.
+
+    Returns:
+        FrozenSet[str]: Trigrammes du texte.
+
+    Example:
+        >>> sorted(trigrams("leo"))
+        ['  l', ' le', 'eo ', 'leo']
+    """
+    grams = set()
+    for word in text.split():
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return frozenset(grams)
+
+
+class FuzzyIndex:
+    """Index de recherche approchée sur le nom et le prénom des utilisateurs.
+
+    Le score d'un utilisateur est le coefficient de Dice entre les trigrammes de la
+    recherche et ceux de « nom prénom » ; une recherche contenue telle quelle dans le
+    nom complet est classée en premier à score égal.
+
+    Attributes:
+        fields (Tuple[str, ...]): Champs indexés.
+    """
+
+    def __init__(self, fields: Tuple[str, ...] = ("name", "first_name")) -> None:
+        """Initialise un index vide.
+
+        Args:
+            fields (Tuple[str, ...]): Champs indexés.
+        """
+        self.fields = fields
+        self._postings: Dict[str, Set[int]] = {}
+        self._grams: Dict[int, FrozenSet[str]] = {}
+        self._texts: Dict[int, str] = {}
+        self._users: Dict[int, Dict[str, Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self._users)
+
+    def add(self, user: Dict[str, Any]) -> None:
+        """Ajoute ou met à jour un utilisateur.
+
+        Args:
+            user (Dict[str, Any]): Données de l'utilisateur.
+        """
+        self.apply(self.prepare(user))
+
+    def prepare(self, user: Dict[str, Any]) -> Tuple[Dict[str, Any], str, FrozenSet[str]]:
+        """Calcule l'entrée d'un utilisateur sans modifier l'index (utilisable depuis un autre thread).
+
+        Args:
+            user (Dict[str, Any]): Données de l'utilisateur.
+
+        Returns:
+            Tuple[Dict[str, Any], str, FrozenSet[str]]: Utilisateur, nom complet normalisé et trigrammes.
+        """
+        text = fold_text(" ".join(str(user.get(field) or "") for field in self.fields))
+        return user, text, trigrams(text)
+
+    def apply(self, entry: Tuple[Dict[str, Any], str, FrozenSet[str]]) -> None:
+        """Ajoute ou met à jour un utilisateur à partir d'une entrée calculée par `prepare`.
+
+        Args:
+            entry (Tuple[Dict[str, Any], str, FrozenSet[str]]): Entrée de l'utilisateur.
+        """
+        user, text, grams = entry
+        user_id = user["id"]
+        self._users[user_id] = user
+        if self._texts.get(user_id) == text:
+            return
+        self.remove(user_id)
+        self._users[user_id] = user
+        self._texts[user_id] = text
+        self._grams[user_id] = grams
+        for gram in grams:
+            self._postings.setdefault(gram, set()).add(user_id)
+
+    def remove(self, user_id: int) -> None:
+        """Retire un utilisateur de l'index.
+
+        Args:
+            user_id (int): ID de l'utilisateur.
+        """
+        self._users.pop(user_id, None)
+        self._texts.pop(user_id, None)
+        for gram in self._grams.pop(user_id, ()):
+            posting = self._postings.get(gram)
+            if posting is not None:
+                posting.discard(user_id)
+                if not posting:
+                    del self._postings[gram]
+
+    def clear(self) -> None:
+        """Vide l'index (par exemple à la déconnexion)."""
+        self._postings.clear()
+        self._grams.clear()
+        self._texts.clear()
+        self._users.clear()
+
+    def search(self, query: str, limit: int = 20, min_score: float = 0.3) -> List[Tuple[Dict[str, Any], float]]:
+        """Recherche les utilisateurs dont le nom ressemble à la recherche.
+
+        Args:
+            query (str): Nom, prénom ou les deux, avec ou sans accents et fautes de frappe.
+            limit (int): Nombre maximal de résultats.
+            min_score (float): Score minimal (entre 0 et 1) d'un résultat.
+
+        Returns:
+            List[Tuple[Dict[str, Any], float]]: Utilisateurs et scores, du plus proche au moins proche.
+
+        Example:
+            >>> index = FuzzyIndex()
+            >>> index.add({"id": 1, "name": "Dupont", "first_name": "Éloïse"})
+            >>> [(user["id"], round(score, 2)) for user, score in index.search("eloise dupnt")]
+            [(1, 0.81)]
+        """
+        folded = fold_text(query)
+        query_grams = trigrams(folded)
+        if not query_grams:
+            return []
+
+        # Un résultat partage au moins `needed` trigrammes avec la recherche : il apparaît donc
+        # dans l'un des trigrammes les plus rares, les plus fréquents ne font que compléter le compte
+        grams = sorted(query_grams, key=lambda g: len(self._postings.get(g, ())))
+        needed = max(1, math.ceil(min_score * len(grams) / (2 - min_score)))
+        rare, frequent = grams[:len(grams) - needed + 1], grams[len(grams) - needed + 1:]
+
+        common: Counter = Counter()
+        for gram in rare:
+            common.update(self._postings.get(gram, ()))
+        for gram in frequent:
+            posting = self._postings.get(gram, set())
+            for user_id in (posting & common.keys()) if len(posting) < len(common) else list(common):
+                if user_id in posting:
+                    common[user_id] += 1
+
+        results = []
+        for user_id, shared in common.items():
+            score = 2 * shared / (len(query_grams) + len(self._grams[user_id]))
+            if score >= min_score:
+                results.append((score, folded in self._texts[user_id], user_id))
+        return [(self._users[user_id], score) for score, _, user_id in heapq.nlargest(limit, results)]
@@ -0,0 +1,174 @@
+"""
+JsonStream.py
+=============
+
+Ce module décode un tableau JSON au fil de sa réception, élément par élément,
+et encode un tableau JSON par morceaux pour l'envoyer.
+
+Une très grande liste (par exemple tous les utilisateurs d'une grosse base) peut
+ainsi être traitée sans garder le corps complet de la réponse en mémoire : seuls
+le morceau reçu et l'élément en cours de décodage sont conservés. À l'envoi, seul
+le lot en cours d'encodage existe sous forme d'octets.
+
+Dependencies:
+    json: Pour décoder chaque élément du tableau.
+"""
+
+# Imports standards
+import codecs
+import json
+import re
+from typing import Any, BinaryIO, Dict, Iterator, List, Sequence
+
+# Taille maximale (en caractères) d'un élément non terminé avant d'abandonner le décodage
+MAX_PENDING = 16 * 1024 * 1024
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+class JsonArrayParser:
+    """Décodeur incrémental d'un tableau JSON.
+
+    Les octets sont passés à `feed` au fil de la réception, qui renvoie les éléments
+    complets ; `close` vérifie que le tableau est terminé.
+
+    Example:
+        >>> parser = JsonArrayParser()
+        >>> parser.feed(b'[{"id": 1}, {"i')
+        [{'id': 1}]
+        >>> parser.feed(b'd": 2}]')
+        [{'id': 2}]
+        >>> parser.close()
+        []
+    """
+
+    def __init__(self) -> None:
+        """Initialise le décodeur avant le crochet ouvrant du tableau."""
+        self._decoder = json.JSONDecoder()
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._state = "start"
+        # Clés déjà vues : partagées entre les éléments comme le fait `json.loads`
+        self._keys: Dict[str, str] = {}
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        """Ajoute des octets reçus et renvoie les éléments terminés.
+
+        Args:
+            chunk (bytes): Morceau du corps de la réponse (un caractère UTF-8 peut être coupé).
+
+        Returns:
+            List[Any]: Éléments décodés dans ce morceau, dans l'ordre du tableau.
+
+        Raises:
+            ValueError: Si les données ne sont pas un tableau JSON valide.
+        """
+        self._buffer += self._utf8.decode(chunk)
+        return self._parse(final=False)
+
+    def close(self) -> List[Any]:
+        """Termine le décodage.
+
+        Returns:
+            List[Any]: Derniers éléments décodés.
+
+        Raises:
+            ValueError: Si le tableau n'est pas terminé ou si des données suivent sa fin.
+        """
+        self._buffer += self._utf8.decode(b"", final=True)
+        items = self._parse(final=True)
+        if self._state != "done":
+            raise ValueError("Tableau JSON incomplet")
+        return items
+
+    def _parse(self, final: bool) -> List[Any]:
+        """Décode tout ce qui peut l'être dans le tampon.
+
+        Args:
+            final (bool): True si plus aucune donnée n'arrivera.
+
+        Returns:
+            List[Any]: Éléments terminés.
+        """
+        items = []
+        buffer, position = self._buffer, 0
+        while True:
+            position = _WHITESPACE.match(buffer, position).end()
+            if position >= len(buffer):
+                break
+            char = buffer[position]
+            if self._state == "start":
+                if char != "[":
+                    raise ValueError("Tableau JSON attendu")
+                self._state = "first"
+                position += 1
+            elif self._state == "first" and char == "]":
+                self._state = "done"
+                position += 1
+            elif self._state in ("first", "item"):
+                try:
+                    item, end = self._decoder.raw_decode(buffer, position)
+                except json.JSONDecodeError as e:
+                    if final or len(buffer) - position > MAX_PENDING:
+                        raise ValueError(f"Élément JSON invalide : {e}")
+                    break
+                # Un nombre coupé (`12` de `12.5`) n'est complet que suivi d'un séparateur
+                if not final and not isinstance(item, (dict, list, str)) \
+                        and (end == len(buffer) or buffer[end] not in ",] \t\n\r"):
+                    break
+                if isinstance(item, dict):
+                    keys = self._keys
+                    item = {keys.setdefault(key, key): value for key, value in item.items()}
+                items.append(item)
+                self._state = "separator"
+                position = end
+            elif self._state == "separator" and char in ",]":
+                self._state = "item" if char == "," else "done"
+                position += 1
+            else:
+                raise ValueError(f"Caractère inattendu dans le tableau JSON : {char!r}")
+        self._buffer = buffer[position:]
+        return items
+
+
+def iter_json_array(file: BinaryIO, chunk_size: int = 64 * 1024) -> Iterator[Any]:
+    """Parcourt les éléments d'un tableau JSON stocké dans un fichier binaire.
+
+    Args:
+        file (BinaryIO): Fichier ouvert en lecture binaire (réponse déversée sur disque...).
+        chunk_size (int): Nombre d'octets lus à la fois.
+
+    Yields:
+        Any: Éléments du tableau.
+
+    Raises:
+        ValueError: Si le fichier ne contient pas un tableau JSON valide.
+    """
+    parser = JsonArrayParser()
+    while True:
+        chunk = file.read(chunk_size)
+        if not chunk:
+            break
+        yield from parser.feed(chunk)
+    yield from parser.close()
+
+
+def encode_json_array(items: Sequence[Any], batch_size: int = 1000) -> Iterator[bytes]:
+    """Encode un tableau JSON par lots d'éléments.
+
+    Args:
+        items (Sequence[Any]): Éléments du tableau.
+        batch_size (int): Nombre d'éléments encodés par morceau.
+
+    Yields:
+        bytes: Le crochet ouvrant, un morceau par lot, puis le crochet fermant.
+
+    Example:
+        >>> b"".join(encode_json_array([{"id": 1}, {"id": 2}], batch_size=1))
+        b'[{"id": 1},{"id": 2}]'
+    """
+    yield b"["
+    for start in range(0, len(items), batch_size):
+        text = ",".join(json.dumps(item, ensure_ascii=False) for item in items[start:start + batch_size])
+        yield (("," if start else "") + text).encode("utf-8")
+    yield b"]"
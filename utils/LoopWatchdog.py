@@ -0,0 +1,208 @@
+"""
+LoopWatchdog.py
+===============
+
+Ce module contient la classe `LoopWatchdog` qui surveille la latence de la boucle
+événementielle (la boucle qasync tourne sur le thread de l'interface : une boucle
+bloquée est une fenêtre figée) et l'instance partagée `watchdog`.
+
+Une tâche de contrôle se réveille à intervalle régulier et enregistre son retard
+dans un histogramme. Un thread de surveillance relève la pile du thread de la
+boucle lorsqu'elle ne répond plus depuis plus que le seuil, puis le blocage est
+affiché avec cette pile, la page d'origine et la tâche en cours.
+
+La surveillance est activée par l'option `--watchdog [MS]` de l'application ou par
+la variable d'environnement `CRM_WATCHDOG` (seuil en millisecondes, `1` pour le
+seuil par défaut). L'histogramme est consultable à tout moment via `watchdog.report()`.
+
+Dependencies:
+    asyncio: Pour la tâche de contrôle de la boucle.
+    threading: Pour relever la pile pendant un blocage.
+"""
+
+# Imports standards
+import asyncio
+import os
+import sys
+import threading
+import time
+import traceback
+from typing import Dict, List, Optional, Tuple
+
+# Bornes supérieures (en millisecondes) des classes de l'histogramme des retards
+HISTOGRAM_BOUNDS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 5000)
+
+
+class LoopWatchdog:
+    """Surveillance de la latence de la boucle événementielle.
+
+    Attributes:
+        enabled (bool): Si True, la surveillance est lancée par `start`.
+        threshold (float): Retard en secondes à partir duquel un blocage est signalé.
+        interval (float): Intervalle en secondes entre deux réveils de la tâche de contrôle.
+        histogram (List[int]): Nombre de retards par classe de `HISTOGRAM_BOUNDS` (plus une classe au-delà).
+        stalls (int): Nombre de blocages signalés.
+        max_lag (float): Plus grand retard mesuré en secondes.
+    """
+
+    DEFAULT_THRESHOLD_MS = 100.0
+
+    def __init__(self) -> None:
+        """Initialise la surveillance, désactivée sauf si `CRM_WATCHDOG` est défini."""
+        self.enabled = False
+        self.threshold = self.DEFAULT_THRESHOLD_MS / 1000
+        self.interval = 0.05
+        self.histogram: List[int] = [0] * (len(HISTOGRAM_BOUNDS) + 1)
+        self.stalls = 0
+        self.max_lag = 0.0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread_id: Optional[int] = None
+        self._task: Optional[asyncio.Task] = None
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+        self._last_beat = time.perf_counter()
+        self._stall_sample: Optional[Tuple[str, str, List[str]]] = None
+        self.configure(os.environ.get("CRM_WATCHDOG"))
+
+    def configure(self, value: Optional[str]) -> None:
+        """Active la surveillance selon la valeur de `CRM_WATCHDOG` ou de l'option en ligne de commande.
+
+        Args:
+            value (Optional[str]): Seuil en millisecondes, `1` pour le seuil par défaut, ou None pour désactiver.
+        """
+        if not value:
+            return
+        self.enabled = True
+        try:
+            threshold_ms = float(value)
+        except ValueError:
+            threshold_ms = self.DEFAULT_THRESHOLD_MS
+        if threshold_ms > 1:
+            self.threshold = threshold_ms / 1000
+        self.interval = min(0.05, self.threshold / 2)
+
+    # ------------------------------------------------------------
+    # Démarrage et arrêt
+    # ------------------------------------------------------------
+    def start(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Lance la tâche de contrôle sur la boucle et le thread de surveillance, si activé.
+
+        Args:
+            loop (asyncio.AbstractEventLoop): Boucle à surveiller, exécutée par le thread appelant.
+        """
+        if not self.enabled or self._running:
+            return
+        self._loop = loop
+        self._loop_thread_id = threading.get_ident()
+        self._running = True
+        self._last_beat = time.perf_counter()
+        self._task = loop.create_task(self._heartbeat())
+        self._thread = threading.Thread(target=self._sample_stalls, name="LoopWatchdog", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Arrête la surveillance."""
+        self._running = False
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+
+    # ------------------------------------------------------------
+    # Mesure
+    # ------------------------------------------------------------
+    async def _heartbeat(self) -> None:
+        """Se réveille à intervalle régulier et enregistre le retard de chaque réveil."""
+        while self._running:
+            expected = time.perf_counter() + self.interval
+            await asyncio.sleep(self.interval)
+            now = time.perf_counter()
+            self._last_beat = now
+            self._record(now - expected)
+
+    def _record(self, lag: float) -> None:
+        """Ajoute un retard à l'histogramme et signale un blocage au-delà du seuil.
+
+        Args:
+            lag (float): Retard en secondes.
+        """
+        lag = max(lag, 0.0)
+        lag_ms = lag * 1000
+        index = next((i for i, bound in enumerate(HISTOGRAM_BOUNDS) if lag_ms <= bound), len(HISTOGRAM_BOUNDS))
+        self.histogram[index] += 1
+        self.max_lag = max(self.max_lag, lag)
+        if lag >= self.threshold:
+            self.stalls += 1
+            self._print_stall(lag)
+        self._stall_sample = None
+
+    def _sample_stalls(self) -> None:
+        """Thread de surveillance : relève la pile de la boucle lorsqu'elle ne répond plus."""
+        while self._running:
+            time.sleep(self.threshold / 2)
+            if self._stall_sample is None and time.perf_counter() - self._last_beat > self.threshold + self.interval:
+                self._stall_sample = self._capture()
+
+    def _capture(self) -> Optional[Tuple[str, str, List[str]]]:
+        """Relève la pile du thread de la boucle, la page d'origine et la tâche en cours.
+
+        Returns:
+            Optional[Tuple[str, str, List[str]]]: Page, tâche et lignes de la pile, None si indisponible.
+        """
+        frame = sys._current_frames().get(self._loop_thread_id)
+        if frame is None:
+            return None
+        stack = traceback.extract_stack(frame)
+        page = next(
+            (f"{os.path.relpath(entry.filename)}:{entry.lineno} ({entry.name})"
+             for entry in reversed(stack) if f"{os.sep}Pages{os.sep}" in entry.filename),
+            "inconnue",
+        )
+        try:
+            task = asyncio.current_task(self._loop)
+        except RuntimeError:
+            task = None
+        task_name = task.get_name() if task is not None else "aucune"
+        return page, task_name, traceback.format_list(stack)
+
+    def _print_stall(self, lag: float) -> None:
+        """Affiche un blocage avec la pile relevée pendant celui-ci.
+
+        Args:
+            lag (float): Durée du blocage en secondes.
+        """
+        lines = [f"Boucle bloquée pendant {lag * 1000:.0f} ms"]
+        sample = self._stall_sample
+        if sample is not None:
+            page, task_name, stack = sample
+            lines.append(f"  page : {page}")
+            lines.append(f"  tâche : {task_name}")
+            lines.extend("  " + line.rstrip() for line in stack)
+        print("\n".join(lines), file=sys.stderr)
+
+    # ------------------------------------------------------------
+    # Consultation
+    # ------------------------------------------------------------
+    def histogram_by_bound(self) -> Dict[str, int]:
+        """Renvoie l'histogramme des retards avec le libellé de chaque classe.
+
+        Returns:
+            Dict[str, int]: Nombre de retards par classe (`<= 10 ms`, ..., `> 5000 ms`).
+        """
+        labels = [f"<= {bound} ms" for bound in HISTOGRAM_BOUNDS] + [f"> {HISTOGRAM_BOUNDS[-1]} ms"]
+        return dict(zip(labels, self.histogram))
+
+    def report(self) -> str:
+        """Met en forme l'histogramme et les compteurs de blocage.
+
+        Returns:
+            str: Une ligne par classe de retard non vide.
+        """
+        lines = [f"Latence de la boucle : {self.stalls} blocage(s) >= {self.threshold * 1000:.0f} ms, "
+                 f"retard max {self.max_lag * 1000:.1f} ms"]
+        for label, count in self.histogram_by_bound().items():
+            if count:
+                lines.append(f"  {label:<12} {count}")
+        return "\n".join(lines)
+
+
+# Instance partagée, consultable à tout moment depuis l'application
+watchdog = LoopWatchdog()
@@ -6,17 +6,34 @@ Ce module contient la classe `Requests` facilitant l'envoi asynchrone de requêt
 
 Dependencies:
     aiohttp: Pour envoyer des requêtes HTTP asynchrones.
-    json: Pour manipuler les données au format JSON.
+    utils.offload: Pour décoder les grandes réponses hors du thread de l'interface.
+    utils.JsonStream: Pour décoder les grandes listes au fil de leur réception.
 """
 
 # Imports standards
 import asyncio
+import io
 import json
-from typing import Optional, Dict, Any
+import math
+import os
+import tempfile
+from concurrent.futures import Executor
+from typing import Optional, Dict, Any, AsyncIterator, Tuple
 
 # Imports tiers
 import aiohttp
 
+# Imports internes
+from utils.JsonStream import JsonArrayParser, encode_json_array
+from utils.TaskSupervisor import TaskSupervisor
+from utils.offload import DECODE_THRESHOLD, SPILL_THRESHOLD, decode_body, decode_file, run_cpu
+
+# Taille (en octets) des morceaux d'un corps envoyé par morceaux
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+# Nombre d'éléments à partir duquel une liste JSON envoyée est encodée par lots
+JSON_STREAM_ITEMS = 1000
+
 
 class Requests:
     """Classe utilitaire pour faciliter l'envoi de requêtes HTTP asynchrones.
@@ -24,23 +41,101 @@ class Requests:
     Attributes:
         base_url (str): L'URL de base du serveur contenant l'API.
         headers (dict | None): Les en-têtes HTTP envoyés lors des requêtes.
+        etags (dict): Dernier ETag et réponse reçus pour chaque requête GET conditionnelle.
+        decode_threshold (int): Taille en octets à partir de laquelle une réponse est décodée dans `executor`.
+        executor (Executor | None): Exécuteur des traitements coûteux, threads de la boucle si None.
+        spill_threshold (int): Taille en octets au-delà de laquelle le corps reçu est écrit dans un
+            fichier temporaire plutôt que gardé en mémoire.
+        tasks (TaskSupervisor): Tâches de fond du client, annulées à sa fermeture.
+
+    Une seule session `aiohttp` est gardée pour toutes les requêtes : la résolution DNS
+    est mise en cache et les connexions (TLS compris) sont réutilisées.
+
+    Les corps envoyés par `post` et `put` peuvent être des octets, un fichier binaire
+    ou un itérable (asynchrone ou non) d'octets ; les grandes listes JSON sont encodées
+    par lots. Ils sont alors envoyés par morceaux et la progression de l'envoi est
+    signalée à `upload_progress_callback` (pourcentage, comme `progress_callback`).
     """
 
-    def __init__(self, base_url: str, headers: Optional[Dict[str, str]] = None) -> None:
+    def __init__(
+        self,
+        base_url: str,
+        headers: Optional[Dict[str, str]] = None,
+        decode_threshold: int = DECODE_THRESHOLD,
+        executor: Optional[Executor] = None,
+        spill_threshold: int = SPILL_THRESHOLD,
+    ) -> None:
         """Initialise une instance de la classe `Requests`.
 
         Args:
             base_url (str): L'URL du serveur contenant l'API.
             headers (dict | None): Optionnel. En-têtes HTTP par défaut pour les requêtes.
+            decode_threshold (int): Taille en octets à partir de laquelle une réponse est décodée hors
+                du thread de l'interface.
+            executor (Executor | None): Exécuteur des traitements coûteux, threads de la boucle si None.
+            spill_threshold (int): Taille en octets au-delà de laquelle le corps reçu est écrit dans un
+                fichier temporaire.
         """
         self.base_url = base_url.rstrip("/")
         self.headers = headers or {}
+        self.decode_threshold = decode_threshold
+        self.executor = executor
+        self.spill_threshold = spill_threshold
+        self.etags: Dict[str, Tuple[str, Any]] = {}
+        self._session: Optional[aiohttp.ClientSession] = None
+        self.tasks = TaskSupervisor(type(self).__name__)
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Renvoie la session partagée, créée au premier appel.
+
+        Returns:
+            aiohttp.ClientSession: Session gardant les connexions ouvertes (keep-alive).
+        """
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(ttl_dns_cache=600, keepalive_timeout=60)
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+
+    async def warm_up(self) -> None:
+        """Prépare la connexion au serveur avant la première vraie requête.
+
+        Une requête HEAD sur l'URL de base résout le nom du serveur et ouvre une
+        connexion TLS qui reste dans le pool de la session. Les erreurs sont ignorées :
+        la requête suivante les rencontrera à nouveau et les signalera.
+        """
+        try:
+            async with self._get_session().head(f"{self.base_url}/", allow_redirects=False) as response:
+                await response.read()
+        except (aiohttp.ClientError, asyncio.TimeoutError, OSError):
+            pass
+
+    def start_warm_up(self) -> Optional[asyncio.Task]:
+        """Lance `warm_up` en arrière-plan sur la boucle événementielle en cours.
+
+        Returns:
+            Optional[asyncio.Task]: La tâche lancée, None si aucune boucle n'est en cours d'exécution
+                (l'appelant peut alors la programmer, par exemple avec `loop.call_soon`).
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return None
+        return self.tasks.spawn(self.warm_up(), "warm_up")
+
+    async def close(self) -> None:
+        """Annule les tâches de fond puis ferme la session partagée et ses connexions."""
+        self.tasks.cancel_all()
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
 
     async def _request(
         self,
         method: str,
         endpoint: str,
         progress_callback=None,
+        conditional: bool = False,
+        body: Any = None,
+        upload_progress_callback=None,
         **kwargs,
     ) -> Any:
         """Méthode interne générique pour gérer toutes les requêtes HTTP.
@@ -52,6 +147,10 @@ class Requests:
             method (str): Méthode HTTP de la requête (GET, POST, PUT, DELETE).
             endpoint (str): Chemin de l'API à appeler.
             progress_callback (Callable | None): Fonction pour suivre la progression de la requête.
+            conditional (bool): Si True, envoie le dernier ETag reçu (`If-None-Match`) et renvoie
+                la réponse mise en cache lorsque le serveur répond 304.
+            body (Any): Corps envoyé par morceaux (octets, fichier binaire, itérable d'octets).
+            upload_progress_callback (Callable | None): Fonction pour suivre la progression de l'envoi.
             **kwargs: Paramètres additionnels pour `aiohttp.request`.
 
         Returns:
@@ -61,49 +160,198 @@ class Requests:
             aiohttp.ClientResponseError: Si la requête échoue (statut HTTP 4xx/5xx).
         """
         url = f"{self.base_url}/{endpoint.lstrip('/')}"
-        async with aiohttp.ClientSession(headers=self.headers) as session:
-            async with session.request(method, url, **kwargs) as response:
-                # Gestion des erreurs HTTP
-                if not response.ok:
-                    try:
-                        text = await response.json()
-                    except aiohttp.ContentTypeError:
-                        text = await response.text()
-
-                    message = text.get("detail") if isinstance(text, dict) else str(text)
-
-                    raise aiohttp.ClientResponseError(
-                        status=response.status,
-                        request_info=response.request_info,
-                        history=response.history,
-                        message=message,
-                        headers=response.headers,
-                    )
-
-                # Gestion de la progression du téléchargement
-                total = int(response.headers.get("content-length", 0))
-                data = bytearray()
-                downloaded = 0
-
-                if total and progress_callback:
-                    progress_callback(0)
-
-                async for chunk in response.content.iter_chunked(1024):
-                    data.extend(chunk)
-                    downloaded += len(chunk)
-                    if progress_callback and total:
-                        percentage = int(downloaded / total * 100)
-                        progress_callback(percentage)
-                    await asyncio.sleep(0)
-
-                if progress_callback and total:
-                    progress_callback(100)
-
-                # Tentative de décodage JSON, sinon texte brut
-                try:
-                    return json.loads(data.decode())
-                except (aiohttp.ContentTypeError, json.JSONDecodeError):
-                    return data.decode()
+        cache_key = f"{method} {url} {sorted((kwargs.get('params') or {}).items())}"
+        cached = self.etags.get(cache_key) if conditional else None
+        kwargs["headers"] = {**self.headers, **(kwargs.get("headers") or {})}
+        if cached is not None:
+            kwargs["headers"]["If-None-Match"] = cached[0]
+
+        json_data = kwargs.get("json")
+        if body is not None or upload_progress_callback is not None \
+                or (isinstance(json_data, list) and len(json_data) >= JSON_STREAM_ITEMS):
+            if json_data is not None:
+                kwargs.pop("json")
+                kwargs["headers"].setdefault("Content-Type", "application/json")
+                body = json_data if isinstance(json_data, list) else json.dumps(json_data).encode("utf-8")
+            if body is not None:
+                kwargs["data"] = self._upload(body, upload_progress_callback)
+
+        session = self._get_session()
+        async with session.request(method, url, **kwargs) as response:
+            # Ressource inchangée depuis la dernière requête conditionnelle
+            if response.status == 304 and cached is not None:
+                return cached[1]
+
+            await self._raise_for_status(response)
+
+            # Corps gardé en mémoire, puis écrit dans un fichier temporaire au-delà de `spill_threshold`
+            with tempfile.SpooledTemporaryFile(max_size=self.spill_threshold) as spool:
+                async for chunk in self._iter_body(response, progress_callback):
+                    spool.write(chunk)
+                size = spool.tell()
+                spool.seek(0)
+
+                # Tentative de décodage JSON, sinon texte brut (hors du thread de l'interface si volumineux).
+                # Un corps déversé sur disque est décodé par morceaux, sans être relu d'un bloc.
+                if size >= self.decode_threshold:
+                    spilled = size > self.spill_threshold
+                    result = await run_cpu(decode_file, spool, spilled, executor=self.executor)
+                else:
+                    result = decode_body(spool.read())
+
+            if conditional and "ETag" in response.headers:
+                self.etags[cache_key] = (response.headers["ETag"], result)
+            return result
+
+    @staticmethod
+    async def _raise_for_status(response: aiohttp.ClientResponse) -> None:
+        """Lève une erreur avec le message du serveur si la requête a échoué.
+
+        Args:
+            response (aiohttp.ClientResponse): Réponse reçue.
+
+        Raises:
+            aiohttp.ClientResponseError: Si le statut HTTP est 4xx/5xx.
+        """
+        if response.ok:
+            return
+        try:
+            text = await response.json()
+        except aiohttp.ContentTypeError:
+            text = await response.text()
+
+        message = text.get("detail") if isinstance(text, dict) else str(text)
+
+        raise aiohttp.ClientResponseError(
+            status=response.status,
+            request_info=response.request_info,
+            history=response.history,
+            message=message,
+            headers=response.headers,
+        )
+
+    @staticmethod
+    async def _iter_body(
+        response: aiohttp.ClientResponse, progress_callback=None, chunk_size: int = 1024
+    ) -> AsyncIterator[bytes]:
+        """Parcourt le corps d'une réponse en signalant la progression du téléchargement.
+
+        Args:
+            response (aiohttp.ClientResponse): Réponse reçue.
+            progress_callback (Callable | None): Fonction de suivi de progression (pourcentage).
+            chunk_size (int): Taille maximale des morceaux renvoyés.
+
+        Yields:
+            bytes: Morceaux du corps, dans l'ordre de réception.
+        """
+        total = int(response.headers.get("content-length", 0))
+        downloaded = 0
+
+        if total and progress_callback:
+            progress_callback(0)
+
+        async for chunk in response.content.iter_chunked(chunk_size):
+            yield chunk
+            downloaded += len(chunk)
+            if progress_callback and total:
+                percentage = int(downloaded / total * 100)
+                progress_callback(percentage)
+            await asyncio.sleep(0)
+
+        if progress_callback and total:
+            progress_callback(100)
+
+    async def _upload(self, body: Any, progress_callback=None) -> AsyncIterator[bytes]:
+        """Envoie un corps morceau par morceau en signalant la progression de l'envoi.
+
+        Args:
+            body (Any): Liste JSON, octets, fichier binaire ou itérable (asynchrone ou non) d'octets.
+            progress_callback (Callable | None): Fonction de suivi de progression (pourcentage).
+
+        Yields:
+            bytes: Morceaux du corps.
+        """
+        reported = -1
+        if progress_callback:
+            progress_callback(0)
+        async for chunk, done in self._body_parts(body):
+            yield chunk
+            if progress_callback and done is not None and int(done * 100) != reported:
+                reported = int(done * 100)
+                progress_callback(reported)
+        if progress_callback and reported != 100:
+            progress_callback(100)
+
+    async def _body_parts(self, body: Any) -> AsyncIterator[Tuple[bytes, Optional[float]]]:
+        """Découpe un corps en morceaux, avec la part déjà envoyée lorsqu'elle est connue.
+
+        Args:
+            body (Any): Liste JSON, octets, fichier binaire ou itérable (asynchrone ou non) d'octets.
+
+        Yields:
+            Tuple[bytes, Optional[float]]: Morceau et part du corps envoyée (entre 0 et 1), None si inconnue.
+        """
+        if isinstance(body, list):
+            # Liste JSON encodée par lots : progression au nombre d'éléments
+            count = math.ceil(len(body) / JSON_STREAM_ITEMS) + 2
+            for index, chunk in enumerate(encode_json_array(body, JSON_STREAM_ITEMS), start=1):
+                yield chunk, index / count
+        elif isinstance(body, (bytes, bytearray, memoryview)):
+            view = memoryview(body)
+            for start in range(0, len(view), UPLOAD_CHUNK_SIZE):
+                yield bytes(view[start:start + UPLOAD_CHUNK_SIZE]), min(1.0, (start + UPLOAD_CHUNK_SIZE) / len(view))
+        elif hasattr(body, "read"):
+            # Fichier lu hors de la boucle : progression à la taille restante du fichier
+            try:
+                total = os.fstat(body.fileno()).st_size - body.tell()
+            except (AttributeError, OSError, io.UnsupportedOperation):
+                total = None
+            sent = 0
+            while chunk := await run_cpu(body.read, UPLOAD_CHUNK_SIZE, executor=self.executor):
+                sent += len(chunk)
+                yield chunk, min(1.0, sent / total) if total else None
+        elif hasattr(body, "__aiter__"):
+            async for chunk in body:
+                yield chunk, None
+        else:
+            for chunk in body:
+                yield chunk, None
+
+    async def stream_json_array(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        progress_callback=None,
+    ) -> AsyncIterator[Any]:
+        """Envoie une requête GET et renvoie les éléments du tableau JSON reçu au fil de l'eau.
+
+        Le corps n'est jamais gardé en entier : la mémoire utilisée ne dépend que de la
+        taille d'un élément, quelle que soit la longueur de la liste.
+
+        Args:
+            endpoint (str): Chemin de l'API.
+            params (dict | None): Paramètres de la requête.
+            headers (dict | None): En-têtes HTTP personnalisés.
+            progress_callback (Callable | None): Fonction de suivi de progression.
+
+        Yields:
+            Any: Éléments du tableau, dans l'ordre du serveur.
+
+        Raises:
+            aiohttp.ClientResponseError: Si la requête échoue (statut HTTP 4xx/5xx).
+            ValueError: Si la réponse n'est pas un tableau JSON valide.
+        """
+        url = f"{self.base_url}/{endpoint.lstrip('/')}"
+        headers = {**self.headers, **(headers or {})}
+        async with self._get_session().get(url, params=params, headers=headers) as response:
+            await self._raise_for_status(response)
+            parser = JsonArrayParser()
+            async for chunk in self._iter_body(response, progress_callback, 64 * 1024):
+                for item in parser.feed(chunk):
+                    yield item
+            for item in parser.close():
+                yield item
 
     # -------------------------------------------------------------------
     # 🌐 Méthodes publiques pour chaque type de requête HTTP
@@ -115,6 +363,7 @@ class Requests:
         params: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, str]] = None,
         progress_callback=None,
+        conditional: bool = False,
     ) -> Any:
         """Envoie une requête HTTP GET.
 
@@ -123,6 +372,7 @@ class Requests:
             params (dict | None): Paramètres de la requête.
             headers (dict | None): En-têtes HTTP personnalisés.
             progress_callback (Callable | None): Fonction de suivi de progression.
+            conditional (bool): Si True, requête conditionnelle basée sur le dernier ETag reçu.
 
         Returns:
             Any: Réponse du serveur.
@@ -133,24 +383,30 @@ class Requests:
             params=params,
             headers=headers,
             progress_callback=progress_callback,
+            conditional=conditional,
         )
 
     async def post(
         self,
         endpoint: str,
-        json_data: Optional[dict] = None,
+        json_data: Optional[Any] = None,
         data: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, str]] = None,
         progress_callback=None,
+        body: Any = None,
+        upload_progress_callback=None,
     ) -> Any:
         """Envoie une requête HTTP POST.
 
         Args:
             endpoint (str): Chemin de l'API.
-            json_data (dict | None): Corps de la requête au format JSON.
+            json_data (dict | list | None): Corps de la requête au format JSON (encodé par lots si
+                c'est une grande liste).
             data (dict | None): Corps de la requête au format `x-www-form-urlencoded`.
             headers (dict | None): En-têtes HTTP personnalisés.
             progress_callback (Callable | None): Fonction de suivi de progression.
+            body (Any): Corps envoyé par morceaux (octets, fichier binaire, itérable d'octets).
+            upload_progress_callback (Callable | None): Fonction de suivi de progression de l'envoi.
 
         Returns:
             Any: Réponse du serveur.
@@ -162,22 +418,29 @@ class Requests:
             json=json_data,
             headers=headers,
             progress_callback=progress_callback,
+            body=body,
+            upload_progress_callback=upload_progress_callback,
         )
 
     async def put(
         self,
         endpoint: str,
-        json_data: Optional[Dict[str, Any]] = None,
+        json_data: Optional[Any] = None,
         headers: Optional[Dict[str, str]] = None,
         progress_callback=None,
+        body: Any = None,
+        upload_progress_callback=None,
     ) -> Any:
         """Envoie une requête HTTP PUT.
 
         Args:
             endpoint (str): Chemin de l'API.
-            json_data (dict | None): Corps de la requête au format JSON.
+            json_data (dict | list | None): Corps de la requête au format JSON (encodé par lots si
+                c'est une grande liste).
             headers (dict | None): En-têtes HTTP personnalisés.
             progress_callback (Callable | None): Fonction de suivi de progression.
+            body (Any): Corps envoyé par morceaux (octets, fichier binaire, itérable d'octets).
+            upload_progress_callback (Callable | None): Fonction de suivi de progression de l'envoi.
 
         Returns:
             Any: Réponse du serveur.
@@ -188,6 +451,8 @@ class Requests:
             json=json_data,
             headers=headers,
             progress_callback=progress_callback,
+            body=body,
+            upload_progress_callback=upload_progress_callback,
         )
 
     async def delete(
@@ -0,0 +1,128 @@
+"""
+SessionContext.py
+=================
+
+Ce module contient la classe `SessionContext` qui garde les informations de la
+session courante (utilisateur connecté, rôle, première page de la liste des
+utilisateurs), chargées une seule fois puis partagées par toutes les pages.
+
+Les requêtes sont envoyées en parallèle avec `asyncio.gather` : l'ouverture du
+panel coûte un seul aller-retour au lieu d'une suite de requêtes.
+
+Dependencies:
+    asyncio: Pour le chargement parallèle des informations.
+"""
+
+# Imports standards
+import asyncio
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
+
+# Imports internes
+from utils.ColumnarUserStore import columnar_enabled
+
+if TYPE_CHECKING:
+    from utils.CrmApiAsync import CrmApiAsync
+
+
+class SessionContext:
+    """Informations partagées de la session courante.
+
+    Attributes:
+        api (CrmApiAsync): Client API de la session.
+        access (Optional[Dict[str, Any]]): Dernière réponse de vérification de l'accès.
+        current_user (Optional[Dict[str, Any]]): Utilisateur connecté, None si la session n'est pas chargée.
+        users (Optional[List[Dict[str, Any]]]): Première page de la liste des utilisateurs.
+    """
+
+    def __init__(self, api: "CrmApiAsync") -> None:
+        """Initialise un contexte vide.
+
+        Args:
+            api (CrmApiAsync): Client API de la session.
+        """
+        self.api = api
+        self.access: Optional[Dict[str, Any]] = None
+        self.current_user: Optional[Dict[str, Any]] = None
+        self.users: Optional[List[Dict[str, Any]]] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def loaded(self) -> bool:
+        """bool: True si l'utilisateur connecté est connu."""
+        return self.current_user is not None
+
+    @property
+    def role(self) -> Optional[str]:
+        """Optional[str]: Rôle de l'utilisateur connecté."""
+        return self.current_user.get("role") if self.current_user else None
+
+    async def load(self, progress_callback: Optional[Callable[[int], None]] = None) -> Dict[str, Any]:
+        """Charge la session une seule fois, les appels suivants renvoient le résultat partagé.
+
+        Un appel pendant le chargement attend ce même chargement au lieu d'envoyer
+        de nouvelles requêtes.
+
+        Args:
+            progress_callback (Callable[[int], None], optional): Fonction de suivi de progression.
+
+        Returns:
+            Dict[str, Any]: Réponse de vérification de l'accès (données de l'utilisateur ou erreur).
+        """
+        if self.loaded:
+            return self.access
+        return await asyncio.shield(self.start(progress_callback))
+
+    def start(self, progress_callback: Optional[Callable[[int], None]] = None) -> asyncio.Task:
+        """Lance le chargement de la session sans l'attendre, ou renvoie celui en cours.
+
+        La tâche est supervisée par le client (`api.tasks`) : elle n'est pas annulée avec la page
+        qui l'a lancée.
+
+        Args:
+            progress_callback (Callable[[int], None], optional): Fonction de suivi de progression.
+
+        Returns:
+            asyncio.Task: Le chargement de la session.
+        """
+        if self._task is None or (self._task.done() and not self.loaded):
+            self._task = self.api.tasks.spawn(self._load(progress_callback), "session")
+        return self._task
+
+    async def _load(self, progress_callback: Optional[Callable[[int], None]]) -> Dict[str, Any]:
+        """Vérifie l'accès et télécharge la première page d'utilisateurs en parallèle."""
+        requests = [self.api.get_current_user_access(progress_callback=progress_callback)]
+        if (self.api.headers or self.api.load_saved_token()) and self._table_reads_first_page():
+            # Gardée par le client : le modèle du tableau la récupère sans nouvelle requête
+            requests.append(self.api.prefetch_users_page(0, self.api.USERS_PAGE_SIZE))
+        access, *users = await asyncio.gather(*requests)
+
+        if await self.api.verify_request(access) != self.api.Ok:
+            self.invalidate()
+            return access
+
+        self.access = access
+        self.current_user = access.get("current_user")
+        if users and await self.api.verify_request(users[0]) == self.api.Ok:
+            self.users = list(users[0])
+        return access
+
+    def _table_reads_first_page(self) -> bool:
+        """Indique si le tableau des utilisateurs lira la première page préchargée.
+
+        En mode `columnar`, le tableau télécharge la liste complète : la première page
+        ne sert qu'à revalider l'instantané, s'il est activé.
+
+        Returns:
+            bool: True si la première page doit être préchargée.
+        """
+        return not columnar_enabled() or self.api.snapshot_path is not None
+
+    def invalidate(self) -> None:
+        """Oublie la session (déconnexion ou session expirée) et abandonne les chargements anticipés."""
+        if self._task is not None and not self._task.done() and self._task is not asyncio.current_task():
+            self._task.cancel()
+        self._task = None
+        self.access = None
+        self.current_user = None
+        self.users = None
+        self.api.discard_prefetched()
@@ -0,0 +1,148 @@
+"""
+SettingsStore.py
+================
+
+Ce module contient la classe `SettingsStore`, un magasin de paramètres (dont le
+token d'authentification) sauvegardé dans un fichier JSON.
+
+Le fichier est lu une seule fois, les lectures sont servies depuis la mémoire et
+les écritures sont regroupées puis faites en arrière-plan, hors de la boucle
+événementielle, par un renommage atomique : un arrêt brutal ne peut pas laisser
+un fichier à moitié écrit.
+
+Dependencies:
+    asyncio: Pour différer et regrouper les écritures.
+    json: Pour lire et écrire le fichier.
+"""
+
+# Imports standards
+import asyncio
+import json
+import os
+from typing import Any, Dict, Optional
+
+
+class SettingsStore:
+    """Magasin de paramètres en mémoire avec écriture différée et atomique.
+
+    Attributes:
+        file_path (str): Chemin du fichier JSON.
+        write_delay (float): Délai en secondes pendant lequel les modifications sont regroupées.
+    """
+
+    def __init__(self, file_path: str, write_delay: float = 0.2) -> None:
+        """Initialise le magasin sans lire le fichier.
+
+        Args:
+            file_path (str): Chemin du fichier JSON.
+            write_delay (float): Délai en secondes pendant lequel les modifications sont regroupées.
+        """
+        self.file_path = file_path
+        self.write_delay = write_delay
+        self._data: Optional[Dict[str, Any]] = None
+        self._dirty = False
+        self._write_task: Optional[asyncio.Task] = None
+
+    # ------------------------------------------------------------
+    # Lecture
+    # ------------------------------------------------------------
+    def _load(self) -> Dict[str, Any]:
+        """Lit le fichier lors du premier accès puis renvoie les données en mémoire."""
+        if self._data is None:
+            try:
+                with open(self.file_path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                self._data = data if isinstance(data, dict) else {}
+            except FileNotFoundError:
+                self._data = {}
+            except (OSError, json.JSONDecodeError) as e:
+                print(e)
+                self._data = {}
+        return self._data
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Renvoie la valeur d'une clé.
+
+        Args:
+            key (str): Clé recherchée.
+            default (Any): Valeur renvoyée si la clé est absente.
+
+        Returns:
+            Any: Valeur associée à la clé.
+        """
+        return self._load().get(key, default)
+
+    # ------------------------------------------------------------
+    # Écriture
+    # ------------------------------------------------------------
+    def set(self, key: str, value: Any) -> None:
+        """Modifie une clé et planifie l'écriture du fichier.
+
+        Args:
+            key (str): Clé à modifier ou ajouter.
+            value (Any): Nouvelle valeur.
+        """
+        self._load()[key] = value
+        self._schedule_write()
+
+    def delete(self, key: str) -> None:
+        """Supprime une clé et planifie l'écriture du fichier.
+
+        Args:
+            key (str): Clé à supprimer.
+        """
+        if self._load().pop(key, None) is not None:
+            self._schedule_write()
+
+    def clear(self) -> None:
+        """Vide le magasin, le fichier est supprimé lors de la prochaine écriture."""
+        self._data = {}
+        self._schedule_write()
+
+    def _schedule_write(self) -> None:
+        """Planifie une écriture regroupée, ou écrit immédiatement hors boucle événementielle."""
+        self._dirty = True
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.flush_sync()
+            return
+        if self._write_task is None or self._write_task.done():
+            self._write_task = loop.create_task(self._write_later())
+
+    async def _write_later(self) -> None:
+        """Attend le délai de regroupement puis écrit dans un thread tant qu'il reste des modifications."""
+        await asyncio.sleep(self.write_delay)
+        loop = asyncio.get_running_loop()
+        while self._dirty:
+            self._dirty = False
+            await loop.run_in_executor(None, self._write_file, dict(self._load()))
+
+    async def flush(self) -> None:
+        """Attend la fin de l'écriture en cours."""
+        if self._write_task is not None:
+            await self._write_task
+
+    def flush_sync(self) -> None:
+        """Écrit immédiatement les modifications en attente (par exemple à la fermeture)."""
+        if self._dirty:
+            self._dirty = False
+            self._write_file(dict(self._load()))
+
+    def _write_file(self, data: Dict[str, Any]) -> None:
+        """Écrit le fichier de manière atomique, ou le supprime s'il n'y a plus de données.
+
+        Args:
+            data (Dict[str, Any]): Copie des données à écrire.
+        """
+        if not data:
+            if os.path.exists(self.file_path):
+                os.remove(self.file_path)
+            return
+
+        tmp_path = f"{self.file_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=4, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.file_path)
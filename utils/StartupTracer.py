@@ -0,0 +1,116 @@
+"""
+StartupTracer.py
+================
+
+Ce module contient la classe `StartupTracer` qui enregistre les étapes du
+démarrage de l'application (imports, création de la QApplication, premier
+affichage du SplashScreen, vérification de la session, premier affichage du
+panel) et l'instance partagée `tracer`.
+
+Le relevé est affiché à la fin du démarrage si l'option `--trace-startup` est
+passée à l'application ou si la variable d'environnement `CRM_TRACE_STARTUP`
+est définie (`1` pour la sortie d'erreur, sinon chemin du fichier de sortie).
+
+Dependencies:
+    time: Pour horodater les étapes.
+"""
+
+# Imports standards
+import os
+import sys
+import time
+from typing import List, Optional, Tuple
+
+
+class StartupTracer:
+    """Enregistreur des étapes du démarrage.
+
+    Attributes:
+        origin (float): Instant de référence (`time.perf_counter`) du démarrage.
+        marks (List[Tuple[str, float]]): Étapes enregistrées avec leur instant.
+        enabled (bool): Si True, le relevé est écrit lors de `dump`.
+        output (Optional[str]): Fichier de sortie, None pour la sortie d'erreur.
+    """
+
+    def __init__(self) -> None:
+        """Initialise l'enregistreur, l'instant de référence est l'instant de création."""
+        self.origin = time.perf_counter()
+        self.marks: List[Tuple[str, float]] = []
+        self.enabled = False
+        self.output: Optional[str] = None
+        self._dumped = False
+        self.configure(os.environ.get("CRM_TRACE_STARTUP"))
+
+    def configure(self, value: Optional[str]) -> None:
+        """Active le relevé selon la valeur de `CRM_TRACE_STARTUP` ou de l'option en ligne de commande.
+
+        Args:
+            value (Optional[str]): `1` pour la sortie d'erreur, un chemin de fichier, ou None pour désactiver.
+        """
+        if value:
+            self.enabled = True
+            self.output = None if value in ("1", "true", "stderr") else value
+
+    def mark(self, name: str) -> None:
+        """Enregistre une étape.
+
+        Args:
+            name (str): Nom de l'étape.
+        """
+        self.marks.append((name, time.perf_counter()))
+
+    def mark_once(self, name: str) -> bool:
+        """Enregistre une étape seulement si elle ne l'a pas déjà été.
+
+        Args:
+            name (str): Nom de l'étape.
+
+        Returns:
+            bool: True si l'étape vient d'être enregistrée.
+        """
+        if self.elapsed(name) is not None:
+            return False
+        self.mark(name)
+        return True
+
+    def elapsed(self, name: str) -> Optional[float]:
+        """Renvoie le temps écoulé en millisecondes entre le démarrage et une étape.
+
+        Args:
+            name (str): Nom de l'étape.
+
+        Returns:
+            Optional[float]: Temps en millisecondes, None si l'étape n'a pas été enregistrée.
+        """
+        for mark_name, instant in self.marks:
+            if mark_name == name:
+                return (instant - self.origin) * 1000
+        return None
+
+    def report(self) -> str:
+        """Met en forme le relevé des étapes.
+
+        Returns:
+            str: Une ligne par étape avec le temps depuis le démarrage et depuis l'étape précédente.
+        """
+        lines = ["Démarrage de CRM Client :"]
+        previous = self.origin
+        for name, instant in self.marks:
+            lines.append(f"  {name:<22} {(instant - self.origin) * 1000:9.1f} ms  (+{(instant - previous) * 1000:.1f} ms)")
+            previous = instant
+        return "\n".join(lines)
+
+    def dump(self) -> None:
+        """Écrit le relevé une seule fois, si l'enregistreur est activé."""
+        if not self.enabled or self._dumped:
+            return
+        self._dumped = True
+        if self.output:
+            with open(self.output, "w", encoding="utf-8") as f:
+                f.write(self.report() + "\n")
+        else:
+            print(self.report(), file=sys.stderr)
+
+
+# Instance partagée, créée au premier import (début du démarrage)
+tracer = StartupTracer()
@@ -0,0 +1,157 @@
+"""
+TaskSupervisor.py
+=================
+
+Ce module contient la classe `TaskSupervisor` qui suit les tâches asyncio lancées
+par une page ou une fenêtre.
+
+Le superviseur garde une référence sur chaque tâche (une tâche sans référence
+peut être détruite en cours d'exécution), affiche les erreurs qui seraient
+sinon perdues, annule les tâches restantes à la fermeture de la fenêtre et
+compte les tâches en cours pour rendre les fuites mesurables.
+
+Dependencies:
+    asyncio: Pour la création et l'annulation des tâches.
+"""
+
+# Imports standards
+import asyncio
+import sys
+import traceback
+import weakref
+from typing import Any, Callable, Coroutine, Dict, List, Optional, Set
+
+
+class TaskSupervisor:
+    """Superviseur des tâches asyncio d'une page ou d'une fenêtre.
+
+    Les superviseurs forment un arbre : annuler un superviseur annule aussi les
+    tâches de ses enfants (par exemple les pages d'une fenêtre).
+
+    Attributes:
+        name (str): Nom du propriétaire, utilisé dans les messages et les relevés.
+        on_error (Optional[Callable[[str, BaseException], None]]): Appelée avec le nom de la tâche et l'erreur.
+        spawned (int): Nombre de tâches lancées.
+        failed (int): Nombre de tâches terminées par une erreur.
+        cancelled (int): Nombre de tâches annulées.
+    """
+
+    _instances: "weakref.WeakSet[TaskSupervisor]" = weakref.WeakSet()
+
+    def __init__(
+        self,
+        name: str,
+        parent: Optional["TaskSupervisor"] = None,
+        on_error: Optional[Callable[[str, BaseException], None]] = None,
+    ) -> None:
+        """Initialise un superviseur sans tâche.
+
+        Args:
+            name (str): Nom du propriétaire.
+            parent (Optional[TaskSupervisor]): Superviseur parent, qui annule aussi celui-ci.
+            on_error (Optional[Callable[[str, BaseException], None]]): Appelée lorsqu'une tâche échoue.
+                Par défaut l'erreur est affichée sur la sortie d'erreur.
+        """
+        self.name = name
+        self.on_error = on_error
+        self.spawned = 0
+        self.failed = 0
+        self.cancelled = 0
+        self._tasks: Set[asyncio.Task] = set()
+        self._children: "weakref.WeakSet[TaskSupervisor]" = weakref.WeakSet()
+        if parent is not None:
+            parent._children.add(self)
+        TaskSupervisor._instances.add(self)
+
+    def spawn(self, coro: Coroutine[Any, Any, Any], name: Optional[str] = None) -> asyncio.Task:
+        """Lance une coroutine dans une tâche suivie.
+
+        Args:
+            coro (Coroutine): Coroutine à exécuter.
+            name (Optional[str]): Nom de la tâche, par défaut le nom de la coroutine.
+
+        Returns:
+            asyncio.Task: La tâche lancée.
+        """
+        task = asyncio.ensure_future(coro)
+        task.set_name(f"{self.name}.{name or getattr(coro, '__qualname__', 'task')}")
+        self._tasks.add(task)
+        self.spawned += 1
+        task.add_done_callback(self._on_done)
+        return task
+
+    def _on_done(self, task: asyncio.Task) -> None:
+        """Oublie une tâche terminée et signale son erreur éventuelle."""
+        self._tasks.discard(task)
+        if task.cancelled():
+            self.cancelled += 1
+            return
+        error = task.exception()
+        if error is None:
+            return
+        self.failed += 1
+        if self.on_error is not None:
+            self.on_error(task.get_name(), error)
+        else:
+            print(f"Erreur dans la tâche {task.get_name()} :", file=sys.stderr)
+            traceback.print_exception(type(error), error, error.__traceback__, file=sys.stderr)
+
+    def cancel_all(self) -> None:
+        """Annule les tâches en cours de ce superviseur et de ses enfants.
+
+        La tâche appelante n'est pas annulée, ce qui permet à une tâche de fermer
+        la fenêtre qui la supervise.
+        """
+        current = asyncio.current_task() if self._loop_running() else None
+        for task in list(self._tasks):
+            if task is not current:
+                task.cancel()
+        for child in list(self._children):
+            child.cancel_all()
+
+    @staticmethod
+    def _loop_running() -> bool:
+        """Indique si une boucle événementielle est en cours d'exécution."""
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+        return True
+
+    def live_count(self) -> int:
+        """Renvoie le nombre de tâches en cours, enfants compris.
+
+        Returns:
+            int: Nombre de tâches non terminées.
+        """
+        return len(self._tasks) + sum(child.live_count() for child in list(self._children))
+
+    def stats(self) -> Dict[str, int]:
+        """Renvoie les compteurs de ce superviseur (sans ses enfants).
+
+        Returns:
+            Dict[str, int]: Tâches en cours, lancées, échouées et annulées.
+        """
+        return {"live": len(self._tasks), "spawned": self.spawned, "failed": self.failed, "cancelled": self.cancelled}
+
+    @classmethod
+    def live_total(cls) -> int:
+        """Renvoie le nombre de tâches en cours dans tous les superviseurs existants.
+
+        Returns:
+            int: Nombre de tâches non terminées.
+        """
+        return sum(len(supervisor._tasks) for supervisor in list(cls._instances))
+
+    @classmethod
+    def report(cls) -> str:
+        """Met en forme les compteurs de tous les superviseurs existants.
+
+        Returns:
+            str: Une ligne par superviseur.
+        """
+        lines: List[str] = [f"Tâches asyncio ({cls.live_total()} en cours) :"]
+        for supervisor in sorted(cls._instances, key=lambda s: s.name):
+            stats = supervisor.stats()
+            lines.append(f"  {supervisor.name:<22} " + "  ".join(f"{key}={value}" for key, value in stats.items()))
+        return "\n".join(lines)
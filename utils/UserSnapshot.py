@@ -0,0 +1,225 @@
+"""
+UserSnapshot.py
+===============
+
+Ce module gère l'instantané sur disque de la dernière liste d'utilisateurs reçue,
+affiché immédiatement au démarrage pendant que la liste est revalidée auprès du
+serveur.
+
+Format du fichier (entiers little-endian) :
+
+- en-tête : signature `CRMU`, version, nombre de champs, nombre d'utilisateurs,
+  taille du tas ;
+- index à largeur fixe : pour chaque utilisateur, son ID puis la position et la
+  longueur de chaque champ dans le tas ;
+- tas de chaînes : les valeurs des champs encodées en UTF-8, bout à bout.
+
+Le fichier est projeté en mémoire (`mmap`) : l'ouverture ne lit rien et un
+utilisateur n'est décodé que lorsqu'il est demandé. L'écriture passe par un
+fichier temporaire (unique, deux écritures peuvent se chevaucher) renommé, un
+instantané n'est donc jamais à moitié écrit ; un fichier tronqué est refusé à
+l'ouverture grâce à la taille du tas enregistrée dans l'en-tête.
+
+L'instantané est désactivé par défaut : la variable d'environnement
+`CRM_USER_SNAPSHOT` vaut `1` (fichier `users.snapshot` à côté du fichier
+d'authentification) ou le chemin du fichier à utiliser.
+
+Dependencies:
+    mmap: Pour projeter le fichier en mémoire.
+    struct: Pour l'en-tête et l'index à largeur fixe.
+"""
+
+# Imports standards
+import mmap
+import os
+import struct
+import tempfile
+from collections.abc import Sequence
+from typing import Any, Dict, Iterable, List, Optional
+
+# Champs enregistrés en plus de l'ID, dans l'ordre du fichier
+FIELDS = ("name", "first_name", "email", "telephone")
+
+MAGIC = b"CRMU"
+VERSION = 2
+HEADER = struct.Struct("<4sHHIQ")
+ENTRY = struct.Struct("<q" + "II" * len(FIELDS))
+
+
+def snapshot_path_for(auth_file: str) -> Optional[str]:
+    """Renvoie le chemin de l'instantané choisi par `CRM_USER_SNAPSHOT`.
+
+    Args:
+        auth_file (str): Chemin du fichier d'authentification.
+
+    Returns:
+        Optional[str]: Chemin de l'instantané, None s'il est désactivé.
+    """
+    value = os.environ.get("CRM_USER_SNAPSHOT", "")
+    if value in ("", "0"):
+        return None
+    if value == "1":
+        return os.path.join(os.path.dirname(os.path.abspath(auth_file)), "users.snapshot")
+    return value
+
+
+def write_snapshot(path: str, users: Iterable[Dict[str, Any]]) -> None:
+    """Écrit l'instantané d'une liste d'utilisateurs de manière atomique.
+
+    Args:
+        path (str): Chemin du fichier.
+        users (Iterable[Dict[str, Any]]): Utilisateurs au format renvoyé par l'API.
+    """
+    writer = SnapshotWriter()
+    for user in users:
+        writer.add(user)
+    writer.commit(path)
+
+
+class SnapshotWriter:
+    """Construit un instantané utilisateur par utilisateur.
+
+    Seuls l'index et le tas encodés sont gardés en mémoire : les utilisateurs
+    peuvent venir d'un flux (`CrmApiAsync.stream_all_users`) sans que la liste
+    complète soit décodée.
+    """
+
+    def __init__(self) -> None:
+        """Initialise un instantané vide."""
+        self._index = bytearray()
+        self._heap = bytearray()
+        self._count = 0
+
+    def add(self, user: Dict[str, Any]) -> None:
+        """Ajoute un utilisateur à la fin de l'instantané.
+
+        Args:
+            user (Dict[str, Any]): Utilisateur au format renvoyé par l'API.
+        """
+        spans = []
+        for field in FIELDS:
+            value = user.get(field)
+            encoded = ("" if value is None else str(value)).encode("utf-8")
+            spans += (len(self._heap), len(encoded))
+            self._heap += encoded
+        self._index += ENTRY.pack(int(user["id"]), *spans)
+        self._count += 1
+
+    def commit(self, path: str) -> None:
+        """Écrit l'instantané de manière atomique.
+
+        Args:
+            path (str): Chemin du fichier.
+        """
+        directory, name = os.path.split(os.path.abspath(path))
+        fd, tmp_path = tempfile.mkstemp(prefix=f"{name}.", suffix=".tmp", dir=directory)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(HEADER.pack(MAGIC, VERSION, len(FIELDS), self._count, len(self._heap)))
+                f.write(self._index)
+                f.write(self._heap)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+        except BaseException:
+            remove_snapshot(tmp_path)
+            raise
+
+
+def remove_snapshot(path: str) -> None:
+    """Supprime l'instantané s'il existe (par exemple à la déconnexion).
+
+    Args:
+        path (str): Chemin du fichier.
+    """
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        print(e)
+
+
+class UserSnapshot(Sequence):
+    """Instantané projeté en mémoire, lu comme une séquence d'utilisateurs.
+
+    Hérite de Sequence : `snapshot[i]` décode l'utilisateur `i` à la demande.
+
+    Attributes:
+        path (str): Chemin du fichier.
+    """
+
+    def __init__(self, path: str, buffer: mmap.mmap, count: int) -> None:
+        """Initialise l'instantané à partir d'un fichier déjà projeté (voir `open`).
+
+        Args:
+            path (str): Chemin du fichier.
+            buffer (mmap.mmap): Projection du fichier.
+            count (int): Nombre d'utilisateurs.
+        """
+        self.path = path
+        self._buffer = buffer
+        self._count = count
+        self._heap_start = HEADER.size + count * ENTRY.size
+
+    @classmethod
+    def open(cls, path: str) -> Optional["UserSnapshot"]:
+        """Projette un instantané en mémoire.
+
+        Args:
+            path (str): Chemin du fichier.
+
+        Returns:
+            Optional[UserSnapshot]: L'instantané, None s'il n'existe pas ou n'est pas valide.
+        """
+        try:
+            with open(path, "rb") as f:
+                buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+
+        if len(buffer) < HEADER.size:
+            buffer.close()
+            return None
+        magic, version, field_count, count, heap_size = HEADER.unpack_from(buffer, 0)
+        if (magic, version, field_count) != (MAGIC, VERSION, len(FIELDS)) \
+                or len(buffer) != HEADER.size + count * ENTRY.size + heap_size:
+            buffer.close()
+            return None
+        return cls(path, buffer, count)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int) -> Dict[str, Any]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._count))]
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError(index)
+        entry = ENTRY.unpack_from(self._buffer, HEADER.size + index * ENTRY.size)
+        record = {"id": entry[0]}
+        for position, field in enumerate(FIELDS):
+            start = self._heap_start + entry[1 + 2 * position]
+            record[field] = self._buffer[start:start + entry[2 + 2 * position]].decode("utf-8")
+        return record
+
+    def ids(self) -> List[int]:
+        """Renvoie les ID de tous les utilisateurs sans décoder leurs champs.
+
+        Returns:
+            List[int]: ID dans l'ordre de l'instantané.
+        """
+        return [ENTRY.unpack_from(self._buffer, HEADER.size + i * ENTRY.size)[0] for i in range(self._count)]
+
+    def close(self) -> None:
+        """Libère la projection (nécessaire avant de remplacer le fichier sous Windows)."""
+        if not self._buffer.closed:
+            self._buffer.close()
+
+    def __enter__(self) -> "UserSnapshot":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
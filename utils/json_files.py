@@ -0,0 +1,76 @@
+"""
+json_files.py
+=============
+
+Ce module fournit les fonctions de manipulation de fichiers JSON.
+
+Il n'importe pas Qt afin de rester utilisable par le client API sans charger
+l'interface graphique.
+
+Dependencies:
+    json: Pour manipuler des fichiers JSON.
+"""
+
+# Imports standards
+import json
+import os
+
+
+def update_json_file(file_path: str, key: str, value) -> None:
+    """Met à jour un fichier JSON en ajoutant ou modifiant une clé.
+
+    Args:
+        file_path (str): Chemin du fichier JSON.
+        key (str): Clé à modifier ou ajouter.
+        value: Nouvelle valeur à insérer.
+    """
+    if not os.path.exists(file_path):
+        with open(file_path, "w", encoding="utf-8") as f:
+            json.dump({}, f, indent=4, ensure_ascii=False)
+
+    with open(file_path, "r", encoding="utf-8") as f:
+        json_file = json.load(f)
+
+    json_file[key] = value
+
+    with open(file_path, "w", encoding="utf-8") as f:
+        json.dump(json_file, f, indent=4, ensure_ascii=False)
+
+
+def get_key_data_json(file_path: str, key: str):
+    """Récupère une valeur spécifique dans un fichier JSON à partir d'une clé.
+
+    Args:
+        file_path (str): Chemin du fichier JSON.
+        key (str): Clé dont on souhaite obtenir la valeur.
+
+    Returns:
+        Any | None: Valeur associée à la clé, ou None si non trouvée.
+    """
+    if not os.path.exists(file_path):
+        return None
+
+    with open(file_path, "r", encoding="utf-8") as f:
+        json_file = json.load(f)
+
+    return json_file.get(key)
+
+
+def get_data_json(file_path: str):
+    """Récupère le contenu complet d’un fichier JSON.
+
+    Args:
+        file_path (str): Chemin du fichier JSON.
+
+    Returns:
+        dict | None: Données JSON, ou None en cas d'erreur.
+    """
+    if not os.path.exists(file_path):
+        return None
+
+    with open(file_path, "r", encoding="utf-8") as f:
+        try:
+            return json.load(f)
+        except json.JSONDecodeError as e:
+            print(e)
+            return None
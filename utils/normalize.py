@@ -0,0 +1,87 @@
+"""
+normalize.py
+============
+
+Ce module fournit les fonctions de normalisation des champs utilisateurs,
+utilisées pour les clés de tri du tableau et les comparaisons insensibles
+à la casse et aux accents.
+
+Dependencies:
+    unicodedata: Pour retirer les accents des chaînes de caractères.
+"""
+
+# Imports standards
+import unicodedata
+from typing import Any, Dict, Tuple
+
+
+def fold_text(text: str) -> str:
+    """Normalise un texte pour les comparaisons (sans accents ni casse).
+
+    Args:
+        text (str): Texte à normaliser.
+
+    Returns:
+        str: Texte sans accents, en minuscules et sans espaces superflus.
+
+    Example:
+        >>> fold_text("  Éloïse ")
+        'eloise'
+    """
+    decomposed = unicodedata.normalize("NFKD", str(text))
+    stripped = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return " ".join(stripped.casefold().split())
+
+
+def normalize_phone(phone: str) -> str:
+    """Normalise un numéro de téléphone en ne gardant que ses chiffres.
+
+    Les préfixes internationaux français (`+33`, `0033`) sont remplacés par `0`.
+
+    Args:
+        phone (str): Numéro de téléphone.
+
+    Returns:
+        str: Numéro composé uniquement de chiffres.
+
+    Example:
+        >>> normalize_phone("+33 6 12 34 56 78")
+        '0612345678'
+    """
+    phone = str(phone).strip()
+    digits = "".join(c for c in phone if c.isdigit())
+    if phone.startswith("+33"):
+        return "0" + digits[2:]
+    if digits.startswith("0033"):
+        return "0" + digits[4:]
+    return digits
+
+
+def normalize_email(email: str) -> str:
+    """Normalise une adresse email pour les comparaisons.
+
+    Args:
+        email (str): Adresse email.
+
+    Returns:
+        str: Adresse sans espaces, en minuscules.
+    """
+    return str(email).strip().casefold()
+
+
+def user_sort_keys(user: Dict[str, Any]) -> Tuple[int, str, str, str, str]:
+    """Calcule les clés de tri typées d'un utilisateur, une par colonne du tableau.
+
+    Args:
+        user (Dict[str, Any]): Données de l'utilisateur.
+
+    Returns:
+        Tuple[int, str, str, str, str]: Clés de l'ID, du nom, du prénom, de l'email et du téléphone.
+    """
+    return (
+        int(user["id"]),
+        fold_text(user["name"]),
+        fold_text(user["first_name"]),
+        normalize_email(user["email"]),
+        normalize_phone(user["telephone"]),
+    )
@@ -0,0 +1,100 @@
+"""
+offload.py
+==========
+
+Ce module regroupe les traitements coûteux en calcul exécutés hors du thread
+de l'interface : avec qasync, la boucle asyncio tourne sur le thread Qt et un
+long calcul y fige la fenêtre.
+
+Les traitements sont des fonctions de module (utilisables aussi avec un
+`ProcessPoolExecutor`) et `run_cpu` les exécute dans un exécuteur avant de
+rendre le résultat à la boucle.
+
+Dependencies:
+    asyncio: Pour exécuter les traitements dans un exécuteur.
+    json: Pour décoder les réponses du serveur.
+    utils.JsonStream: Pour décoder par morceaux les tableaux reçus dans un fichier.
+"""
+
+# Imports standards
+import asyncio
+import json
+from concurrent.futures import Executor
+from typing import Any, BinaryIO, Callable, Dict, List, Optional
+
+# Imports internes
+from utils.JsonStream import iter_json_array
+from utils.normalize import user_sort_keys
+
+# Taille (en octets) à partir de laquelle une réponse est décodée hors du thread de l'interface
+DECODE_THRESHOLD = 256 * 1024
+
+# Taille (en octets) à partir de laquelle le corps d'une réponse est reçu dans un fichier temporaire
+SPILL_THRESHOLD = 8 * 1024 * 1024
+
+# Nombre d'utilisateurs à partir duquel les clés de tri sont calculées hors du thread de l'interface
+ROWS_THRESHOLD = 1000
+
+
+def decode_body(data: bytes) -> Any:
+    """Décode le corps d'une réponse en JSON, ou en texte brut si ce n'est pas du JSON.
+
+    Args:
+        data (bytes): Corps de la réponse.
+
+    Returns:
+        Any: Données JSON décodées ou texte brut.
+    """
+    text = bytes(data).decode()
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError:
+        return text
+
+
+def decode_file(file: BinaryIO, incremental: bool = False) -> Any:
+    """Décode le corps d'une réponse reçu dans un fichier (voir `decode_body`).
+
+    Args:
+        file (BinaryIO): Fichier positionné au début du corps.
+        incremental (bool): Si True, un tableau JSON est décodé morceau par morceau
+            (`iter_json_array`) : seuls les éléments décodés sont gardés en mémoire,
+            pas le corps complet. Pour les corps déversés sur disque.
+
+    Returns:
+        Any: Données JSON décodées ou texte brut.
+    """
+    if incremental and file.read(64).lstrip()[:1] == b"[":
+        file.seek(0)
+        try:
+            return list(iter_json_array(file))
+        except ValueError:
+            pass
+    file.seek(0)
+    return decode_body(file.read())
+
+
+def build_sort_keys(users: List[Dict[str, Any]]) -> List[tuple]:
+    """Calcule les clés de tri d'une liste d'utilisateurs.
+
+    Args:
+        users (List[Dict[str, Any]]): Utilisateurs reçus du serveur.
+
+    Returns:
+        List[tuple]: Clés de tri de chaque utilisateur, dans le même ordre.
+    """
+    return [user_sort_keys(user) for user in users]
+
+
+async def run_cpu(func: Callable[..., Any], *args: Any, executor: Optional[Executor] = None) -> Any:
+    """Exécute un traitement coûteux dans un exécuteur et attend son résultat.
+
+    Args:
+        func (Callable[..., Any]): Traitement à exécuter.
+        *args (Any): Arguments du traitement.
+        executor (Optional[Executor]): Exécuteur à utiliser, celui de la boucle (threads) si None.
+
+    Returns:
+        Any: Résultat du traitement.
+    """
+    return await asyncio.get_running_loop().run_in_executor(executor, func, *args)
@@ -0,0 +1,92 @@
+"""
+styles.py
+=========
+
+Ce module compose les fichiers `.qss` du dossier `styles` en une seule feuille de
+style appliquée une fois sur la `QApplication`.
+
+Chaque fichier est limité aux widgets qu'il concernait auparavant en préfixant ses
+sélecteurs par le `objectName` de la page correspondante. Les fichiers sont lus une
+seule fois puis gardés en cache.
+
+Dependencies:
+    PySide6: Pour appliquer la feuille de style à l'application.
+    re: Pour préfixer les sélecteurs des règles.
+"""
+
+# Imports standards
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+# Imports tiers
+from PySide6.QtWidgets import QApplication
+
+# Imports internes
+from utils.utils import load_qss_file
+
+STYLES_DIR = Path(__file__).parent.parent / "styles"
+
+# Ordre de composition et portée de chaque fichier (None : sélecteurs déjà ciblés par objectName)
+STYLE_SHEETS: List[Tuple[str, Optional[str]]] = [
+    ("containers.qss", None),
+    ("login_page.qss", None),
+    ("button_style.qss", None),
+    ("input_style.qss", "QWidget#login_window"),
+    ("menu_widget.qss", "QWidget#panel"),
+    ("tab_bar.qss", "QWidget#user_management"),
+    ("user_table.qss", "QWidget#view_user_page"),
+    ("add_user_page.qss", "QWidget#add_user_page"),
+]
+
+_COMMENT = re.compile(r"/\*.*?\*/", re.DOTALL)
+_RULE = re.compile(r"(\s*)([^{}]+?)\s*\{([^{}]*)\}")
+
+
+def scope_stylesheet(qss: str, scope: Optional[str]) -> str:
+    """Limite les règles d'une feuille de style aux descendants d'un widget.
+
+    Args:
+        qss (str): Contenu de la feuille de style.
+        scope (Optional[str]): Sélecteur du widget parent, aucun préfixe si None.
+
+    Returns:
+        str: Feuille de style dont chaque sélecteur est préfixé par `scope`.
+
+    Example:
+        >>> scope_stylesheet("QLineEdit, QPushButton { padding: 10; }", "QWidget#form")
+        'QWidget#form QLineEdit, QWidget#form QPushButton { padding: 10; }'
+    """
+    qss = _COMMENT.sub("", qss)
+    if not scope:
+        return qss.strip()
+
+    def prefix(match: re.Match) -> str:
+        selectors = ", ".join(f"{scope} {sel.strip()}" for sel in match.group(2).split(",") if sel.strip())
+        return f"{match.group(1)}{selectors} {{{match.group(3)}}}"
+
+    return _RULE.sub(prefix, qss).strip()
+
+
+@lru_cache(maxsize=None)
+def build_application_stylesheet() -> str:
+    """Compose tous les fichiers `.qss` en une seule feuille de style.
+
+    Les fichiers absents de `STYLE_SHEETS` sont ajoutés à la fin sans portée.
+
+    Returns:
+        str: Feuille de style de l'application.
+    """
+    known = {name for name, _ in STYLE_SHEETS}
+    extra = [(path.name, None) for path in sorted(STYLES_DIR.glob("*.qss")) if path.name not in known]
+    return "\n\n".join(scope_stylesheet(load_qss_file(name), scope) for name, scope in STYLE_SHEETS + extra)
+
+
+def apply_application_stylesheet(app: QApplication) -> None:
+    """Applique la feuille de style composée à toute l'application.
+
+    Args:
+        app (QApplication): Application Qt.
+    """
+    app.setStyleSheet(build_application_stylesheet())
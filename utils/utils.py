@@ -3,30 +3,62 @@ utils.py
 ========
 
 Ce module fournit des fonctions et classes utilitaires facilitant la gestion
-de l'interface graphique, la manipulation de fichiers JSON et le style général
-de l'application.
+de l'interface graphique et le style général de l'application.
+
+Les fonctions de manipulation de fichiers JSON sont dans `utils.json_files`, qui
+n'importe pas Qt ; elles restent importables depuis ce module.
+
+Les fichiers des dossiers `assets` et `styles` sont lus depuis le module de
+ressources Qt compilé `resources_rc` s'il existe (voir `resources.qrc`), sinon
+depuis le système de fichiers.
 
 Dependencies:
     PySide6: Bibliothèque principale utilisée pour créer des interfaces graphiques.
-    json: Pour manipuler des fichiers JSON.
 """
 
 # Imports standards
-import json
-import os
+from functools import lru_cache
 from pathlib import Path
-from typing import List
+from typing import Callable, List, Optional, Tuple
 
 # Imports tiers
-from PySide6.QtCore import QRegularExpression, QPoint
+from PySide6.QtCore import QRegularExpression, QPoint, QFile, QIODevice, QObject, QTimer
 from PySide6.QtGui import (
     QGuiApplication,
     QRegularExpressionValidator,
     QIcon,
     QPixmap,
+    QPixmapCache,
     Qt,
 )
-from PySide6.QtWidgets import QWidget, QBoxLayout, QMessageBox, QLineEdit, QLabel
+from PySide6.QtWidgets import QWidget, QBoxLayout, QMessageBox, QLineEdit, QLabel, QVBoxLayout
+
+# Imports internes
+from utils.json_files import update_json_file, get_key_data_json, get_data_json  # noqa: F401
+
+# Ressources compilées (pyside6-rcc resources.qrc -o resources_rc.py), facultatives
+try:
+    import resources_rc  # noqa: F401
+
+    RESOURCES_EMBEDDED = True
+except ImportError:
+    RESOURCES_EMBEDDED = False
+
+
+def resource_path(folder: str, file_name: str) -> str:
+    """Renvoie le chemin d'un fichier des dossiers `assets` ou `styles`.
+
+    Args:
+        folder (str): Dossier du fichier (`assets` ou `styles`).
+        file_name (str): Nom du fichier.
+
+    Returns:
+        str: Chemin de ressource Qt (`:/assets/...`) si les ressources sont compilées,
+        sinon chemin sur le disque.
+    """
+    if RESOURCES_EMBEDDED:
+        return f":/{folder}/{file_name}"
+    return str(Path(__file__).parent.parent / folder / file_name)
 
 
 class DraggableLabel(QLabel):
@@ -73,17 +105,83 @@ class DraggableLabel(QLabel):
             event.accept()
 
 
+class LazyPage(QWidget):
+    """Conteneur qui ne construit sa page qu'à sa première activation.
+
+    Utilisé dans les `QStackedWidget` et `QTabWidget` pour ne pas construire au
+    démarrage les pages que l'utilisateur n'a pas encore ouvertes.
+
+    Attributes:
+        factory (Callable[[], QWidget]): Fonction construisant la page.
+        page (QWidget | None): Page construite, None tant qu'elle n'a pas été activée.
+    """
+
+    def __init__(self, factory: Callable[[], QWidget]) -> None:
+        """Initialise le conteneur vide.
+
+        Args:
+            factory (Callable[[], QWidget]): Fonction construisant la page.
+        """
+        super().__init__()
+        self.factory = factory
+        self.page: Optional[QWidget] = None
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(0)
+
+    def ensure_built(self) -> QWidget:
+        """Construit la page si ce n'est pas déjà fait.
+
+        Returns:
+            QWidget: La page construite.
+        """
+        if self.page is None:
+            self.page = self.factory()
+            self.layout().addWidget(self.page)
+        return self.page
+
+
+def prewarm_lazy_pages(pages: List[LazyPage], context: QObject, delay: int = 500) -> None:
+    """Construit en arrière-plan les pages pas encore activées, une par passage de la boucle.
+
+    Les minuteries sont liées à `context` : elles sont abandonnées si la fenêtre qui
+    contient les pages est détruite avant leur construction.
+
+    Args:
+        pages (List[LazyPage]): Pages à préparer.
+        context (QObject): Propriétaire des pages (fenêtre ou onglet).
+        delay (int): Délai en millisecondes avant la première construction.
+    """
+    remaining = [page for page in pages if page.page is None]
+
+    def build_next():
+        if remaining:
+            remaining.pop(0).ensure_built()
+            QTimer.singleShot(0, context, build_next)
+
+    QTimer.singleShot(delay, context, build_next)
+
+
+@lru_cache(maxsize=None)
 def load_qss_file(filename: str) -> str:
     """Charge un fichier `.qss` et renvoie son contenu.
 
+    Le fichier n'est lu qu'une seule fois, les appels suivants utilisent le cache.
+
     Args:
         filename (str): Nom du fichier `.qss` contenant le style.
 
     Returns:
         str: Contenu du fichier `.qss`.
     """
-    path = Path(__file__).parent.parent / "styles" / filename
-    with path.open(encoding="utf-8") as f:
+    path = resource_path("styles", filename)
+    if RESOURCES_EMBEDDED:
+        file = QFile(path)
+        file.open(QIODevice.OpenModeFlag.ReadOnly)
+        content = bytes(file.readAll()).decode("utf-8")
+        file.close()
+        return content
+    with open(path, encoding="utf-8") as f:
         return f.read()
 
 
@@ -110,66 +208,6 @@ def center_on_screen(widget: QWidget) -> None:
     widget.move(x, y)
 
 
-def update_json_file(file_path: str, key: str, value) -> None:
-    """Met à jour un fichier JSON en ajoutant ou modifiant une clé.
-
-    Args:
-        file_path (str): Chemin du fichier JSON.
-        key (str): Clé à modifier ou ajouter.
-        value: Nouvelle valeur à insérer.
-    """
-    if not os.path.exists(file_path):
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump({}, f, indent=4, ensure_ascii=False)
-
-    with open(file_path, "r", encoding="utf-8") as f:
-        json_file = json.load(f)
-
-    json_file[key] = value
-
-    with open(file_path, "w", encoding="utf-8") as f:
-        json.dump(json_file, f, indent=4, ensure_ascii=False)
-
-
-def get_key_data_json(file_path: str, key: str):
-    """Récupère une valeur spécifique dans un fichier JSON à partir d'une clé.
-
-    Args:
-        file_path (str): Chemin du fichier JSON.
-        key (str): Clé dont on souhaite obtenir la valeur.
-
-    Returns:
-        Any | None: Valeur associée à la clé, ou None si non trouvée.
-    """
-    if not os.path.exists(file_path):
-        return None
-
-    with open(file_path, "r", encoding="utf-8") as f:
-        json_file = json.load(f)
-
-    return json_file.get(key)
-
-
-def get_data_json(file_path: str):
-    """Récupère le contenu complet d’un fichier JSON.
-
-    Args:
-        file_path (str): Chemin du fichier JSON.
-
-    Returns:
-        dict | None: Données JSON, ou None en cas d'erreur.
-    """
-    if not os.path.exists(file_path):
-        return None
-
-    with open(file_path, "r", encoding="utf-8") as f:
-        try:
-            return json.load(f)
-        except json.JSONDecodeError as e:
-            print(e)
-            return None
-
-
 def create_message_box(
     parent: QWidget, title: str, text: str, question: bool = False, error: bool = False
 ) -> bool | None:
@@ -236,15 +274,41 @@ def configure_line_edit(
             edit.setValidator(validator_text)
 
 
-def get_icon(file_name: str, is_pixmap: bool = False) -> QIcon | QPixmap:
+def get_icon(file_name: str, is_pixmap: bool = False, size: Optional[Tuple[int, int]] = None) -> QIcon | QPixmap:
     """Retourne une icône ou une pixmap à partir du dossier `assets`.
 
+    Les pixmaps sont gardées dans `QPixmapCache` par nom et par taille, les icônes
+    sont gardées en mémoire : une image n'est lue et redimensionnée qu'une seule fois.
+
     Args:
         file_name (str): Nom du fichier image.
         is_pixmap (bool, optional): Si True, renvoie un QPixmap au lieu d’un QIcon.
+        size (Tuple[int, int], optional): Taille (largeur, hauteur) de la pixmap redimensionnée.
 
     Returns:
         QIcon | QPixmap: L'icône ou la pixmap correspondante.
     """
-    image_path = Path(__file__).parent.parent / "assets" / Path(file_name)
-    return QPixmap(str(image_path)) if is_pixmap else QIcon(str(image_path))
+    if not is_pixmap:
+        return _get_cached_icon(file_name)
+
+    key = f"{file_name}@{size[0]}x{size[1]}" if size else file_name
+    pixmap = QPixmap()
+    if not QPixmapCache.find(key, pixmap):
+        pixmap = QPixmap(resource_path("assets", file_name))
+        if size:
+            pixmap = pixmap.scaled(*size)
+        QPixmapCache.insert(key, pixmap)
+    return pixmap
+
+
+@lru_cache(maxsize=None)
+def _get_cached_icon(file_name: str) -> QIcon:
+    """Charge une icône du dossier `assets` une seule fois.
+
+    Args:
+        file_name (str): Nom du fichier image.
+
+    Returns:
+        QIcon: L'icône correspondante.
+    """
+    return QIcon(resource_path("assets", file_name))